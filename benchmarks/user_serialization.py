@@ -0,0 +1,79 @@
+"""
+Compare the default serialization of the user listing with the fast JSON mode.
+
+The default path validates the page against the `UserPage` response model, converts it with `jsonable_encoder` and
+renders it with the standard `json` module, as FastAPI does for `response_model` endpoints. The fast path renders the
+page built by the service directly with orjson, as the user routers do when `FAST_JSON_RESPONSES` is enabled.
+
+Usage:
+    DATABASE_URL=sqlite:///./app.db python -m benchmarks.user_serialization --users 1000 --repeat 50
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.entities.user_entity import User
+from src.schemas.user_schema import UserPage
+from src.utils.json_utils import FastJSONResponse
+from src.utils.user_utils import USER_FIELDS, project_user
+
+
+def build_page(count: int) -> UserPage:
+    """
+    Build a page of users the way `AsyncUserService.list_users` does, from transient User entities.
+
+    Args:
+        count (int): The number of users in the page.
+
+    Returns:
+        UserPage: The page of users.
+    """
+    created_at = datetime(2023, 3, 1, tzinfo=timezone.utc)
+    users = [
+        User(id=index, name=f"User {index}", email=f"user{index}@example.com", password="hash", created_at=created_at)
+        for index in range(count)
+    ]
+    return UserPage.construct(items=[project_user(user, USER_FIELDS) for user in users], next_cursor=None)
+
+
+async def default_path(page: UserPage, field) -> bytes:
+    content = await serialize_response(field=field, response_content=page, exclude_unset=True, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def fast_path(page: UserPage, field) -> bytes:
+    return FastJSONResponse(page).body
+
+
+async def measure(path, page: UserPage, field, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await path(page, field)
+    return (time.perf_counter() - start) / repeat
+
+
+async def main(users: int, repeat: int) -> None:
+    field = create_response_field(name="Response_list_users", type_=UserPage)
+    page = build_page(users)
+    assert json.loads(await default_path(page, field)) == json.loads(await fast_path(page, field))
+
+    default_seconds = await measure(default_path, page, field, repeat)
+    fast_seconds = await measure(fast_path, page, field, repeat)
+    print(f"{users} users, mean of {repeat} runs")
+    print(f"default (response_model + jsonable_encoder + json): {default_seconds * 1000:8.2f} ms")
+    print(f"fast (construct + orjson):                          {fast_seconds * 1000:8.2f} ms")
+    print(f"speedup: {default_seconds / fast_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000, help="number of users in the page")
+    parser.add_argument("--repeat", type=int, default=50, help="number of serializations measured per path")
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.users, arguments.repeat))
@@ -1,11 +1,119 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from src.utils.metrics_utils import instrument_queries
+from src.utils.pool_metrics_utils import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool, instrument_engine
+from src.utils.query_budget_utils import instrument_query_budget
+from src.utils.slow_query_utils import instrument_slow_queries
+
+from .replica import ReplicaSet, RoutingSession, parse_replica_urls
 from .settings import Settings
 
+ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Derive the URL used by the async engine from a synchronous database URL.
+
+    The blocking drivers are replaced by their asyncio counterparts: asyncpg for PostgreSQL and aiosqlite for SQLite.
+    URLs that already name an async driver are returned unchanged.
+
+    Args:
+        database_url (str): The database URL used by the synchronous engine.
+
+    Returns:
+        str: The database URL for the async engine.
+
+    """
+    url = make_url(database_url)
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def get_pool_options(settings: Settings) -> dict:
+    """
+    Build the connection pool options shared by the sync and async engines.
+
+    Args:
+        settings (Settings): Settings object with the app's configuration.
+
+    Returns:
+        dict: Keyword arguments for `create_engine` and `create_async_engine`.
+
+    """
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
 settings = Settings()
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(settings.DATABASE_URL, poolclass=InstrumentedQueuePool, **get_pool_options(settings))
+replica_engines = [
+    create_engine(url, poolclass=InstrumentedQueuePool, **get_pool_options(settings))
+    for url in parse_replica_urls(settings.DATABASE_REPLICA_URLS)
+]
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+    class_=RoutingSession,
+    replicas=ReplicaSet(replica_engines, settings.DATABASE_REPLICA_HEALTH_CHECK_SECONDS),
+)
+
+async_engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    **get_pool_options(settings),
+)
+async_replica_engines = [
+    create_async_engine(
+        get_async_database_url(url),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        **get_pool_options(settings),
+    )
+    for url in parse_replica_urls(settings.DATABASE_REPLICA_URLS)
+]
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replicas=ReplicaSet(
+        [replica.sync_engine for replica in async_replica_engines], settings.DATABASE_REPLICA_HEALTH_CHECK_SECONDS
+    ),
+)
+
+# The engine of each connection pool, keyed by the name its usage counters are published under
+pooled_engines = {"sync": engine, "async": async_engine.sync_engine}
+pooled_engines.update({f"sync_replica_{index}": replica for index, replica in enumerate(replica_engines)})
+pooled_engines.update(
+    {f"async_replica_{index}": replica.sync_engine for index, replica in enumerate(async_replica_engines)}
+)
+pool_metrics = {name: instrument_engine(pooled_engine) for name, pooled_engine in pooled_engines.items()}
+sync_engines = [engine, *replica_engines, async_engine.sync_engine]
+sync_engines += [replica.sync_engine for replica in async_replica_engines]
+for sync_engine in sync_engines:
+    if settings.METRICS_ENABLED:
+        instrument_queries(sync_engine)
+    if settings.QUERY_BUDGET_ENABLED:
+        instrument_query_budget(sync_engine)
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        instrument_slow_queries(sync_engine)
 
 Base = declarative_base()
 
@@ -25,6 +133,8 @@ def get_db():
     Get a database session.
 
     This function returns a context manager that provides a SQLAlchemy session. The session is closed automatically when the context manager is exited.
+    The session only checks out a pooled connection when it runs its first statement, so a request that never queries
+    the database never touches the pool.
 
     Returns:
         generator: A generator that yields a database session.
@@ -35,3 +145,21 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Get an asynchronous database session.
+
+    The session runs its queries on the event loop through the async driver, so a request waiting on the database does
+    not hold a threadpool thread. The session is closed automatically when the request is finished.
+
+    FastAPI resolves a dependency once per request, so the authentication dependency and the services of a request
+    share this session. Like the sync session, it only checks out a pooled connection when it runs its first statement.
+
+    Returns:
+        async_generator: An async generator that yields an AsyncSession.
+
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
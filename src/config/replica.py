@@ -0,0 +1,116 @@
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import exc, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Bind arguments marking a read-only statement that may run on a read replica
+READ_REPLICA = {"replica": True}
+
+
+class ReplicaSet:
+    """
+    Round-robin selection of healthy read replicas.
+
+    A replica is checked with `SELECT 1` at most once every `health_check_interval` seconds and skipped while the last
+    check failed, so a replica that goes down only costs one failed connection per interval.
+
+    Args:
+        engines (Sequence[Engine]): The engines of the replicas. For async engines, pass their `sync_engine`.
+        health_check_interval (float): How long (in seconds) the result of a health check is reused.
+    """
+
+    def __init__(self, engines: Sequence[Engine], health_check_interval: float = 5):
+        self.engines = list(engines)
+        self.health_check_interval = health_check_interval
+        self._counter = itertools.count()
+        self._health: Dict[Engine, Tuple[float, bool]] = {}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def is_healthy(self, engine: Engine) -> bool:
+        """
+        Tells whether a replica accepts connections, using the cached result of the last check while it is fresh.
+
+        Args:
+            engine (Engine): The engine of the replica.
+
+        Returns:
+            bool: True if the replica answered its last health check.
+        """
+        with self._lock:
+            checked_at, healthy = self._health.get(engine, (None, True))
+        if checked_at is not None and time.monotonic() - checked_at < self.health_check_interval:
+            return healthy
+
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            healthy = True
+        except exc.SQLAlchemyError:
+            healthy = False
+        with self._lock:
+            self._health[engine] = (time.monotonic(), healthy)
+        return healthy
+
+    def choose(self) -> Optional[Engine]:
+        """
+        Picks the next healthy replica in round-robin order.
+
+        Returns:
+            Optional[Engine]: The engine of the replica, or None if no replica is healthy.
+        """
+        start = next(self._counter)
+        for offset in range(len(self.engines)):
+            engine = self.engines[(start + offset) % len(self.engines)]
+            if self.is_healthy(engine):
+                return engine
+        return None
+
+
+class RoutingSession(Session):
+    """
+    Session sending read-only statements to read replicas and everything else to the primary.
+
+    A statement goes to a replica only when it is executed with the `READ_REPLICA` bind arguments, the session has no
+    pending changes and it has not written anything yet. Writes, flushes, refreshes and lazy loads always run on the
+    primary, and once a session has written, all its reads stay there too, so a request reads its own writes. When no
+    replica is configured or healthy, every statement runs on the primary.
+
+    Args:
+        replicas (Optional[ReplicaSet]): The read replicas. Defaults to none.
+        *args: Positional arguments of `Session`.
+        **kwargs: Keyword arguments of `Session`.
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas if replicas else ReplicaSet([])
+        self.has_written = False
+
+    def get_bind(self, mapper=None, *, clause=None, bind=None, replica: bool = False, **kwargs):
+        if self._flushing or (clause is not None and clause.is_dml):
+            self.has_written = True
+        if replica and self.replicas and not (self.has_written or self.new or self.dirty or self.deleted):
+            engine = self.replicas.choose()
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+
+def parse_replica_urls(replica_urls: str) -> List[str]:
+    """
+    Splits the comma-separated list of replica URLs.
+
+    Args:
+        replica_urls (str): The value of the `DATABASE_REPLICA_URLS` setting.
+
+    Returns:
+        List[str]: The replica URLs, without blanks.
+    """
+    return [url.strip() for url in replica_urls.split(",") if url.strip()]
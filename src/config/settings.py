@@ -12,6 +12,13 @@ class Settings(BaseSettings):
         PG_PASSWORD (str): The password for the PostgreSQL database.
         PG_DB (str): The name of the PostgreSQL database.
         DATABASE_URL (str): The URL of the PostgreSQL database.
+        DB_POOL_SIZE (int): The number of connections kept open in each database connection pool.
+        DB_MAX_OVERFLOW (int): The number of connections a pool may open beyond `DB_POOL_SIZE` under load.
+        DB_POOL_TIMEOUT (int): How long (in seconds) a request waits for a pooled connection before failing.
+        DB_POOL_RECYCLE (int): The age (in seconds) after which a pooled connection is replaced. -1 never recycles.
+        DB_POOL_PRE_PING (bool): Whether connections are tested before being handed out of the pool.
+        DATABASE_REPLICA_URLS (str): Comma-separated URLs of read replicas serving read-only queries. Empty disables replicas.
+        DATABASE_REPLICA_HEALTH_CHECK_SECONDS (int): How long (in seconds) the result of a replica health check is reused.
         SECRET_KEY (str): The secret key used for JWT token encoding and decoding.
         ALGORITHM (str): The encryption algorithm used for JWT token encoding and decoding.
         ACCESS_TOKEN_EXPIRATION_MINUTES (int): The expiration time (in minutes) for access tokens.
@@ -20,6 +27,47 @@ class Settings(BaseSettings):
         EMAIL_HOST_USER (str): The username for the email server.
         EMAIL_HOST_PASSWORD (str): The password for the email server.
         EMAIL_PORT (int): The port number for the email server.
+        COMPRESSION_ENABLED (bool): Whether responses are compressed with brotli or gzip when the client accepts it.
+        COMPRESSION_MINIMUM_SIZE (int): The size (in bytes) below which a response is sent uncompressed.
+        COMPRESSION_GZIP_LEVEL (int): The gzip compression level, from 1 (fastest) to 9 (smallest).
+        COMPRESSION_BROTLI_QUALITY (int): The brotli compression quality, from 0 (fastest) to 11 (smallest). Brotli is only used when the `brotli` package is installed.
+        METRICS_ENABLED (bool): Whether the latency, status and SQL statements of each request are recorded and exposed in the Prometheus text format at `/metrics`. The internal metrics routes under `/api/metrics` are only mounted when it is set.
+        METRICS_SCRAPE_TOKEN (str): A bearer token granting access to the metrics routes without an administrator's access token, e.g. for Prometheus. Empty disables it.
+        QUERY_BUDGET_ENABLED (bool): Whether the SQL statements of each request are checked against a budget, to catch N+1 queries. Meant for development and tests.
+        QUERY_BUDGET_MAX_QUERIES (int): The maximum number of SQL statements a request may run when the query budget is enabled.
+        QUERY_BUDGET_MAX_REPEATS (int): The maximum number of times a request may run the same SQL statement, with any values, when the query budget is enabled.
+        QUERY_BUDGET_RAISE (bool): Whether a request going over its query budget fails, instead of being logged as a warning.
+        SLOW_QUERY_LOG_ENABLED (bool): Whether the durations of the SQL statements are aggregated per fingerprint, and the slow ones logged. The slow query routes under `/api/metrics/slow-queries` are only mounted when it is set.
+        SLOW_QUERY_THRESHOLD_MS (int): The duration (in milliseconds) above which a SQL statement is logged as slow.
+        SLOW_QUERY_MAX_FINGERPRINTS (int): The maximum number of statement fingerprints aggregated by the slow query log.
+        SLOW_QUERY_SAMPLE_SIZE (int): The number of recent durations kept per fingerprint to compute its p50 and p99.
+        PROFILER_ENABLED (bool): Whether administrators may profile the process, through `/api/metrics/profile` or the `X-Profile` header of a request. When disabled, profiling costs nothing.
+        PROFILER_MAX_SECONDS (int): The maximum duration (in seconds) of a profile requested through `/api/metrics/profile`.
+        PROFILER_INTERVAL_MS (int): The time (in milliseconds) between two samples of the profiler.
+        FAST_JSON_RESPONSES (bool): Whether the user read endpoints render their responses with orjson, skipping the validation against the response model.
+        USERS_PAGE_DEFAULT_LIMIT (int): The default number of users returned per page when listing users.
+        USERS_PAGE_MAX_LIMIT (int): The maximum number of users a client may request per page.
+        USERS_BATCH_GET_MAX_IDS (int): The maximum number of users a client may retrieve by ID in one request.
+        USERS_EXPORT_BATCH_SIZE (int): The number of rows fetched from the database cursor per chunk when exporting users.
+        USERS_IMPORT_BATCH_SIZE (int): The number of users hashed and inserted together when importing users in bulk.
+        USERS_IMPORT_MAX_ROWS (int): The maximum number of rows accepted by a single bulk import.
+        PASSWORD_HASH_WORKERS (int): The number of worker processes used to hash and verify passwords. 0 hashes in the calling thread.
+        PASSWORD_HASH_MAX_PENDING (int): The maximum number of password hashing jobs queued or running in the worker processes.
+        PASSWORD_HASH_SCHEMES (str): Comma-separated password hashing schemes. The first one hashes new passwords, the others are only verified and migrated on login.
+        PASSWORD_BCRYPT_ROUNDS (int): The bcrypt cost factor (log2 of the number of rounds).
+        PASSWORD_ARGON2_TIME_COST (int): The number of argon2 iterations.
+        PASSWORD_ARGON2_MEMORY_COST (int): The amount of memory (in KiB) used by argon2.
+        PASSWORD_ARGON2_PARALLELISM (int): The number of argon2 lanes.
+        PRINCIPAL_CACHE_MAX_SIZE (int): The maximum number of authenticated users cached by the authentication middleware.
+        PRINCIPAL_CACHE_TTL_SECONDS (int): How long (in seconds) an authenticated user stays cached. 0 disables the cache.
+        TOKEN_CACHE_ENABLED (bool): Whether the claims of verified JWT tokens are cached.
+        TOKEN_CACHE_MAX_SIZE (int): The maximum number of verified JWT tokens cached.
+        TOKEN_CACHE_MAX_TTL_SECONDS (int): The maximum time (in seconds) the claims of a verified JWT token stay cached.
+        USER_LOOKUP_COALESCING_ENABLED (bool): Whether concurrent identical lookups of a user by id or email share a single query.
+        USER_CACHE_ENABLED (bool): Whether the users read by id or email are cached.
+        USER_CACHE_MAX_SIZE (int): The maximum number of users cached in each process.
+        USER_CACHE_TTL_SECONDS (int): How long (in seconds) a user stays cached, which bounds how stale a user updated by another process can be.
+        USER_CACHE_REDIS_URL (str): The URL of a Redis server caching users for every process, behind the in-process cache. Empty disables it. Requires the `redis` package.
 
     Config:
         env_file (str): The name of the file containing environment variables.
@@ -30,6 +78,13 @@ class Settings(BaseSettings):
     PG_PASSWORD: str = os.getenv("PG_PASSWORD", default="")
     PG_DB: str = os.getenv("PG_DB", default="fastapi")
     DATABASE_URL: str = os.getenv("DATABASE_URL", default="")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", default=5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", default=10))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", default=30))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", default=-1))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", default="false").lower() == "true"
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", default="")
+    DATABASE_REPLICA_HEALTH_CHECK_SECONDS: int = int(os.getenv("DATABASE_REPLICA_HEALTH_CHECK_SECONDS", default=5))
 
     SECRET_KEY: str = os.getenv("SECRET_KEY", default="secretkey")
     ALGORITHM: str = os.getenv("ALGORITHM", default="HS256")
@@ -41,6 +96,52 @@ class Settings(BaseSettings):
     EMAIL_HOST_PASSWORD: str = os.getenv("EMAIL_HOST_PASSWORD", default="")
     EMAIL_PORT: int = int(os.getenv("EMAIL_PORT", default=2525))
 
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", default="true").lower() == "true"
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", default=1000))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", default=6))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", default=4))
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", default="true").lower() == "true"
+    METRICS_SCRAPE_TOKEN: str = os.getenv("METRICS_SCRAPE_TOKEN", default="")
+    QUERY_BUDGET_ENABLED: bool = os.getenv("QUERY_BUDGET_ENABLED", default="false").lower() == "true"
+    QUERY_BUDGET_MAX_QUERIES: int = int(os.getenv("QUERY_BUDGET_MAX_QUERIES", default=10))
+    QUERY_BUDGET_MAX_REPEATS: int = int(os.getenv("QUERY_BUDGET_MAX_REPEATS", default=3))
+    QUERY_BUDGET_RAISE: bool = os.getenv("QUERY_BUDGET_RAISE", default="false").lower() == "true"
+    SLOW_QUERY_LOG_ENABLED: bool = os.getenv("SLOW_QUERY_LOG_ENABLED", default="true").lower() == "true"
+    SLOW_QUERY_THRESHOLD_MS: int = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", default=500))
+    SLOW_QUERY_MAX_FINGERPRINTS: int = int(os.getenv("SLOW_QUERY_MAX_FINGERPRINTS", default=1000))
+    SLOW_QUERY_SAMPLE_SIZE: int = int(os.getenv("SLOW_QUERY_SAMPLE_SIZE", default=256))
+    PROFILER_ENABLED: bool = os.getenv("PROFILER_ENABLED", default="false").lower() == "true"
+    PROFILER_MAX_SECONDS: int = int(os.getenv("PROFILER_MAX_SECONDS", default=30))
+    PROFILER_INTERVAL_MS: int = int(os.getenv("PROFILER_INTERVAL_MS", default=5))
+    FAST_JSON_RESPONSES: bool = os.getenv("FAST_JSON_RESPONSES", default="false").lower() == "true"
+    USERS_PAGE_DEFAULT_LIMIT: int = int(os.getenv("USERS_PAGE_DEFAULT_LIMIT", default=50))
+    USERS_PAGE_MAX_LIMIT: int = int(os.getenv("USERS_PAGE_MAX_LIMIT", default=100))
+    USERS_BATCH_GET_MAX_IDS: int = int(os.getenv("USERS_BATCH_GET_MAX_IDS", default=500))
+    USERS_EXPORT_BATCH_SIZE: int = int(os.getenv("USERS_EXPORT_BATCH_SIZE", default=1000))
+    USERS_IMPORT_BATCH_SIZE: int = int(os.getenv("USERS_IMPORT_BATCH_SIZE", default=1000))
+    USERS_IMPORT_MAX_ROWS: int = int(os.getenv("USERS_IMPORT_MAX_ROWS", default=50000))
+
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", default=0))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", default=64))
+    PASSWORD_HASH_SCHEMES: str = os.getenv("PASSWORD_HASH_SCHEMES", default="bcrypt")
+    PASSWORD_BCRYPT_ROUNDS: int = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", default=12))
+    PASSWORD_ARGON2_TIME_COST: int = int(os.getenv("PASSWORD_ARGON2_TIME_COST", default=2))
+    PASSWORD_ARGON2_MEMORY_COST: int = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", default=102400))
+    PASSWORD_ARGON2_PARALLELISM: int = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", default=8))
+
+    PRINCIPAL_CACHE_MAX_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", default=1024))
+    PRINCIPAL_CACHE_TTL_SECONDS: int = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", default=30))
+
+    TOKEN_CACHE_ENABLED: bool = os.getenv("TOKEN_CACHE_ENABLED", default="false").lower() == "true"
+    TOKEN_CACHE_MAX_SIZE: int = int(os.getenv("TOKEN_CACHE_MAX_SIZE", default=4096))
+    TOKEN_CACHE_MAX_TTL_SECONDS: int = int(os.getenv("TOKEN_CACHE_MAX_TTL_SECONDS", default=300))
+
+    USER_LOOKUP_COALESCING_ENABLED: bool = os.getenv("USER_LOOKUP_COALESCING_ENABLED", default="true").lower() == "true"
+    USER_CACHE_ENABLED: bool = os.getenv("USER_CACHE_ENABLED", default="false").lower() == "true"
+    USER_CACHE_MAX_SIZE: int = int(os.getenv("USER_CACHE_MAX_SIZE", default=10000))
+    USER_CACHE_TTL_SECONDS: int = int(os.getenv("USER_CACHE_TTL_SECONDS", default=60))
+    USER_CACHE_REDIS_URL: str = os.getenv("USER_CACHE_REDIS_URL", default="")
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,59 +1,99 @@
+import hmac
+import time
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config.database import get_db
+from src.config.database import get_async_db
+from src.config.settings import Settings
+from src.entities.administrator_entity import Administrator
+from src.entities.user_entity import User
 from src.providers.token_manager_provider import TokenManagerProvider
-from src.repositories.user_repository import UserRepository
+from src.repositories.async_user_repository import AsyncUserRepository
+from src.utils.cache_utils import principal_cache
 
 oauth2_schema = OAuth2PasswordBearer(tokenUrl="token")
+settings = Settings()
 
 
 class AuthenticationMiddleware:
     """
     Middleware that handles authentication for FastAPI endpoints.
 
+    Authenticated users are kept in a bounded TTL cache keyed by the token subject, so most authenticated requests
+    skip the database. An entry never outlives the token that populated it, and the user repositories invalidate it
+    when the user is updated or deleted. On a cache miss the user is loaded through the async session, so the lookup
+    does not block the event loop.
+
     Attributes:
         oauth2_schema (OAuth2PasswordBearer): The OAuth2 password bearer object.
     """
 
-    def verify_token(self, token: str):
+    def get_token_claims(self, token: str) -> Optional[dict]:
         """
-        Verify the JWT token and return the email address associated with it.
+        Verify the JWT token and return its claims.
 
         Args:
             token (str): The JWT token to verify.
 
         Returns:
-            email (str): The email address associated with the token, or None if the token is invalid.
+            claims (dict): The claims of the token, or None if the token is invalid.
         """
         try:
-            email = TokenManagerProvider().verify_access_token(token)
+            return TokenManagerProvider().get_access_token_claims(token)
         except JWTError:
             return None
-        return email
 
-    def get_user_by_email(self, email: str, db: Session):
+    def verify_token(self, token: str):
+        """
+        Verify the JWT token and return the email address associated with it.
+
+        Args:
+            token (str): The JWT token to verify.
+
+        Returns:
+            email (str): The email address associated with the token, or None if the token is invalid.
+        """
+        claims = self.get_token_claims(token)
+        return claims.get("sub") if claims else None
+
+    async def get_user_by_email(self, email: str, db: AsyncSession):
         """
         Retrieve the user with the given email address from the database.
 
         Args:
             email (str): The email address of the user to retrieve.
-            db (Session): The SQLAlchemy database session.
+            db (AsyncSession): The SQLAlchemy async database session.
 
         Returns:
             user (User): The user with the given email address, or None if no such user exists.
         """
-        return UserRepository(db).get_user_by_email(email)
+        return await AsyncUserRepository(db).get_user_by_email(email)
 
-    async def __call__(self, token: str = Depends(oauth2_schema), db: Session = Depends(get_db)):
+    @staticmethod
+    def _detached_copy(user: User) -> User:
+        """
+        Copy a user into a new instance that is not bound to any session, so it can be shared between requests.
+
+        Args:
+            user (User): The user to copy.
+
+        Returns:
+            user (User): A transient copy of the user.
+        """
+        return User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+
+    async def __call__(self, token: str = Depends(oauth2_schema), db: AsyncSession = Depends(get_async_db)):
         """
         Verify the JWT token and retrieve the user associated with it.
 
         Args:
             token (str, optional): The JWT token to verify. Defaults to Depends(oauth2_schema).
-            db (Session, optional): The SQLAlchemy database session. Defaults to Depends(get_db).
+            db (AsyncSession, optional): The SQLAlchemy async database session. Defaults to Depends(get_async_db).
 
         Raises:
             HTTPException: If the token is invalid or the user does not exist.
@@ -61,10 +101,88 @@ class AuthenticationMiddleware:
         Returns:
             user (User): The user associated with the JWT token.
         """
-        email = self.verify_token(token)
+        claims = self.get_token_claims(token)
+        email = claims.get("sub") if claims else None
         if not email:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token is not authorized")
-        user = self.get_user_by_email(email, db)
+
+        user = principal_cache.get(email)
+        if user is not None:
+            return user
+
+        user = await self.get_user_by_email(email, db)
         if not user:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+        ttl = claims["exp"] - time.time() if "exp" in claims else None
+        principal_cache.set(email, self._detached_copy(user), ttl)
         return user
+
+
+class AdministratorAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    Middleware restricting FastAPI endpoints to administrators, the users with a row in the `administrator` table.
+
+    The user is authenticated as by `AuthenticationMiddleware`, then its administrator row is looked up on every
+    request, so revoking the privileges takes effect immediately.
+    """
+
+    async def is_administrator(self, user: User, db: AsyncSession) -> bool:
+        """
+        Check whether a user is an administrator.
+
+        Args:
+            user (User): The authenticated user.
+            db (AsyncSession): The SQLAlchemy async database session.
+
+        Returns:
+            bool: True if the user has a row in the `administrator` table, False otherwise.
+        """
+        result = await db.execute(select(Administrator.id).where(Administrator.user_id == user.id).limit(1))
+        return result.first() is not None
+
+    async def __call__(self, token: str = Depends(oauth2_schema), db: AsyncSession = Depends(get_async_db)):
+        """
+        Verify the JWT token and check that the user associated with it is an administrator.
+
+        Args:
+            token (str, optional): The JWT token to verify. Defaults to Depends(oauth2_schema).
+            db (AsyncSession, optional): The SQLAlchemy async database session. Defaults to Depends(get_async_db).
+
+        Raises:
+            HTTPException: If the token is invalid, the user does not exist or is not an administrator.
+
+        Returns:
+            user (User): The administrator associated with the JWT token.
+        """
+        user = await super().__call__(token, db)
+        if not await self.is_administrator(user, db):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Administrator privileges required")
+        return user
+
+
+class MetricsAuthenticationMiddleware(AdministratorAuthenticationMiddleware):
+    """
+    Middleware restricting the metrics endpoints to administrators and to the holder of the scrape token.
+
+    A scraper such as Prometheus cannot log in, so it may send `METRICS_SCRAPE_TOKEN` as its bearer token instead of
+    an administrator's access token. The token is compared in constant time, and is never accepted when it is empty.
+    """
+
+    async def __call__(self, token: str = Depends(oauth2_schema), db: AsyncSession = Depends(get_async_db)):
+        """
+        Accept the scrape token, or else check that the user associated with the JWT token is an administrator.
+
+        Args:
+            token (str, optional): The scrape token or the JWT token to verify. Defaults to Depends(oauth2_schema).
+            db (AsyncSession, optional): The SQLAlchemy async database session. Defaults to Depends(get_async_db).
+
+        Raises:
+            HTTPException: If the token is neither the scrape token nor the token of an administrator.
+
+        Returns:
+            user (Optional[User]): The administrator associated with the JWT token, or None for the scrape token.
+        """
+        scrape_token = settings.METRICS_SCRAPE_TOKEN
+        if scrape_token and hmac.compare_digest(token.encode(), scrape_token.encode()):
+            return None
+        return await super().__call__(token, db)
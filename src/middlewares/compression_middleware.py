@@ -0,0 +1,233 @@
+import zlib
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, responses are only gzipped without it
+    brotli = None
+
+
+class GzipCompressor:
+    """
+    Incremental gzip compressor.
+
+    Args:
+        level (int): The compression level, from 1 (fastest) to 9 (smallest).
+    """
+
+    encoding = "gzip"
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses a chunk, flushing it so the client can decode it without waiting for the next one.
+
+        Args:
+            data (bytes): The chunk to compress.
+
+        Returns:
+            bytes: The compressed chunk.
+        """
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """
+        Compresses the last chunk and ends the stream.
+
+        Args:
+            data (bytes): The last chunk to compress.
+
+        Returns:
+            bytes: The end of the compressed stream.
+        """
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    """
+    Incremental brotli compressor, available when the `brotli` package is installed.
+
+    Args:
+        quality (int): The compression quality, from 0 (fastest) to 11 (smallest).
+    """
+
+    encoding = "br"
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses a chunk, flushing it so the client can decode it without waiting for the next one.
+
+        Args:
+            data (bytes): The chunk to compress.
+
+        Returns:
+            bytes: The compressed chunk.
+        """
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """
+        Compresses the last chunk and ends the stream.
+
+        Args:
+            data (bytes): The last chunk to compress.
+
+        Returns:
+            bytes: The end of the compressed stream.
+        """
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+def parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """
+    Parses an `Accept-Encoding` header into the quality value of each coding.
+
+    Args:
+        accept_encoding (str): The value of the header, e.g. `"br;q=1.0, gzip;q=0.8, *;q=0.1"`.
+
+    Returns:
+        Dict[str, float]: The quality of each coding, in lower case. Malformed quality values count as 0.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, *parameters = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    return qualities
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with brotli or gzip, depending on what the client accepts.
+
+    Brotli is preferred when the `brotli` package is installed and the client accepts it equally well. Responses
+    sent in a single message smaller than `minimum_size` bytes, and responses that already have a `Content-Encoding`,
+    are sent unchanged. Streaming responses are compressed chunk by chunk, whatever their size since it is not known
+    when they start, and every chunk is flushed, so clients still receive the data progressively.
+
+    Every response the middleware could have compressed gets a `Vary: Accept-Encoding` header, including those sent
+    unchanged because they are small or the client accepts neither coding, so a shared cache never serves one
+    client the variant negotiated for another.
+
+    Args:
+        app (ASGIApp): The application to wrap.
+        minimum_size (int): The size (in bytes) below which a response is not compressed.
+        gzip_level (int): The gzip compression level, from 1 to 9.
+        brotli_quality (int): The brotli compression quality, from 0 to 11.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, gzip_level: int = 6, brotli_quality: int = 4) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def select_compressor(self, accept_encoding: str):
+        """
+        Chooses the compressor for a request.
+
+        Args:
+            accept_encoding (str): The `Accept-Encoding` header of the request.
+
+        Returns:
+            Optional[GzipCompressor | BrotliCompressor]: The compressor, or None if the client accepts neither coding.
+        """
+        qualities = parse_accept_encoding(accept_encoding)
+        wildcard = qualities.get("*", 0.0)
+        brotli_quality = qualities.get("br", wildcard) if brotli is not None else 0.0
+        gzip_quality = qualities.get("gzip", wildcard)
+        if brotli_quality > 0 and brotli_quality >= gzip_quality:
+            return BrotliCompressor(self.brotli_quality)
+        if gzip_quality > 0:
+            return GzipCompressor(self.gzip_level)
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            compressor = self.select_compressor(Headers(scope=scope).get("Accept-Encoding", ""))
+            await CompressionResponder(self.app, self.minimum_size, compressor)(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class CompressionResponder:
+    """
+    Compresses the response of a single request.
+
+    Args:
+        app (ASGIApp): The wrapped application.
+        minimum_size (int): The size (in bytes) below which a response is not compressed.
+        compressor (Optional[GzipCompressor | BrotliCompressor]): The compressor of the coding chosen for the request,
+            or None if the client accepts neither coding.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, compressor) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressor = compressor
+        self.send: Optional[Send] = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.encoded = False
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # The headers are held back until the first body message tells whether the response is compressed
+            self.initial_message = message
+            self.encoded = "content-encoding" in Headers(raw=message["headers"])
+            self.passthrough = self.encoded or self.compressor is None
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            self.started = True
+            if self.passthrough or (len(body) < self.minimum_size and not more_body):
+                self.passthrough = True
+                if not self.encoded:
+                    MutableHeaders(raw=self.initial_message["headers"]).add_vary_header("Accept-Encoding")
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.compressor.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+                message["body"] = self.compressor.compress(body)
+            else:
+                message["body"] = self.compressor.finish(body)
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if not self.passthrough:
+            message["body"] = self.compressor.compress(body) if more_body else self.compressor.finish(body)
+        await self.send(message)
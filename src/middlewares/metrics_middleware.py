@@ -0,0 +1,64 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.metrics_utils import (
+    QueryStats,
+    http_request_db_duration,
+    http_request_db_statements,
+    http_request_duration,
+    http_requests,
+    http_requests_in_flight,
+    request_queries,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording the latency, status and SQL statements of each HTTP request.
+
+    Requests are labelled by the template of the route that served them, e.g. `/api/users/{user_id}`, so the number
+    of series does not grow with the ids in the paths; requests that match no route share the `<unmatched>` label. The
+    SQL statements are counted through the `QueryStats` set in `request_queries` for the duration of the request, which
+    the engines instrumented with `instrument_queries` fill in. The duration covers the whole response, including the
+    body of streaming responses. A request failing with an exception is counted with the status 500.
+
+    Args:
+        app (ASGIApp): The application to wrap.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        queries = QueryStats()
+        token = request_queries.set(queries)
+        http_requests_in_flight.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            request_queries.reset(token)
+            http_requests_in_flight.dec(method)
+            # The router stores the matched route in the scope, which is shared with the wrapped application
+            route = getattr(scope.get("route"), "path_format", UNMATCHED_ROUTE)
+            http_requests.inc(method, route, status_code)
+            http_request_duration.observe(duration, method, route)
+            http_request_db_statements.observe(queries.count, route)
+            http_request_db_duration.observe(queries.duration, route)
@@ -0,0 +1,91 @@
+from typing import Callable
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.database import AsyncSessionLocal
+from src.utils.profiler_utils import ProfilerBusyError, check_mode, sampling_profile
+
+from .authentication_middleware import AdministratorAuthenticationMiddleware
+
+PROFILE_HEADER = "X-Profile"
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling the requests sent with an `X-Profile: wall` or `X-Profile: cpu` header by an
+    administrator.
+
+    The request is handled as usual while the process is sampled, then its response is replaced by the collapsed
+    stacks of the profile, with the original status in the `X-Profile-Status` header. The profile covers every thread
+    of the process, so concurrent requests show in it too. Requests without the header, and requests of clients who
+    are not administrators, are passed through untouched, so the header never breaks an ordinary request. The
+    middleware is only installed when `PROFILER_ENABLED` is set.
+
+    Args:
+        app (ASGIApp): The application to wrap.
+        interval (float): The time (in seconds) between two samples.
+        session_factory (Callable[[], AsyncSession]): Opens the session used to check that the user is an
+            administrator. Defaults to `AsyncSessionLocal`.
+    """
+
+    def __init__(
+        self, app: ASGIApp, interval: float = 0.005, session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+    ) -> None:
+        self.app = app
+        self.interval = interval
+        self.session_factory = session_factory
+
+    async def is_administrator(self, headers: Headers) -> bool:
+        """
+        Checks whether the request is sent by an administrator.
+
+        Args:
+            headers (Headers): The headers of the request.
+
+        Returns:
+            bool: True if the bearer token is valid and its user is an administrator, False otherwise.
+        """
+        scheme, _, token = headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        async with self.session_factory() as db:
+            try:
+                await AdministratorAuthenticationMiddleware()(token, db)
+            except HTTPException:
+                return False
+        return True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        mode = Headers(scope=scope).get(PROFILE_HEADER) if scope["type"] == "http" else None
+        if not mode or not await self.is_administrator(Headers(scope=scope)):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def discard(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        try:
+            try:
+                check_mode(mode)
+            except ValueError as error:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+            try:
+                with sampling_profile(mode, self.interval) as profiler:
+                    await self.app(scope, receive, discard)
+            except ProfilerBusyError as error:
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(error))
+        except HTTPException as error:
+            response = JSONResponse({"detail": error.detail}, status_code=error.status_code, headers=error.headers)
+            await response(scope, receive, send)
+            return
+
+        response = PlainTextResponse(profiler.collapsed(), headers={"X-Profile-Status": str(status_code)})
+        await response(scope, receive, send)
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.utils.query_budget_utils import QueryBudget, current_query_budget
+
+
+class QueryBudgetMiddleware:
+    """
+    ASGI middleware giving each HTTP request a budget of SQL statements, to catch N+1 queries in development.
+
+    A `QueryBudget` is set in `current_query_budget` for the duration of each request, and the engines instrumented with
+    `instrument_query_budget` record their statements in it. A request running more than `max_queries` statements, or
+    repeating a statement more than `max_repeats` times, is logged, or fails with `QueryBudgetExceeded` when
+    `raise_on_violation` is set.
+
+    Args:
+        app (ASGIApp): The application to wrap.
+        max_queries (Optional[int]): The maximum number of statements per request. None for no limit.
+        max_repeats (Optional[int]): The maximum number of statements sharing a fingerprint per request. None for no
+            limit.
+        raise_on_violation (bool): Whether a request going over its budget fails, instead of being logged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_queries: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+        raise_on_violation: bool = False,
+    ) -> None:
+        self.app = app
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+        self.raise_on_violation = raise_on_violation
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = QueryBudget(
+            self.max_queries, self.max_repeats, self.raise_on_violation, name=f"{scope['method']} {scope['path']}"
+        )
+        token = current_query_budget.set(budget)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_query_budget.reset(token)
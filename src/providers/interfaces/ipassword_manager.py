@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class IPasswordManagerProvider(ABC):
@@ -6,6 +7,26 @@ class IPasswordManagerProvider(ABC):
     def hash_generate(self, text: str) -> str:
         pass
 
+    @abstractmethod
+    def hash_generate_many(self, texts: List[str]) -> List[str]:
+        pass
+
     @abstractmethod
     def hash_verify(self, text: str, hash: str) -> bool:
         pass
+
+    @abstractmethod
+    def hash_needs_update(self, hash: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def hash_generate_async(self, text: str) -> str:
+        pass
+
+    @abstractmethod
+    async def hash_generate_many_async(self, texts: List[str]) -> List[str]:
+        pass
+
+    @abstractmethod
+    async def hash_verify_async(self, text: str, hash: str) -> bool:
+        pass
@@ -14,6 +14,14 @@ class ITokenManagerProvider(ABC):
     def decode_jwt_token(self, encoded_jwt_token: str) -> dict[str, any]:
         pass
 
+    @abstractmethod
+    def get_access_token_claims(self, token: str) -> dict[str, any]:
+        pass
+
     @abstractmethod
     def verify_access_token(self, token: str) -> str:
         pass
+
+    @abstractmethod
+    def forget_cached_token(self, token: str) -> None:
+        pass
@@ -1,19 +1,50 @@
+from typing import List, Optional
+
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+
+from src.config.settings import Settings
+from src.utils.metrics_utils import provider_call_duration, timed
 
 from .interfaces.ipassword_manager import IPasswordManagerProvider
 
 
+def build_crypt_context(settings: Settings = Settings()) -> CryptContext:
+    """
+    Builds the CryptContext described by the password hashing settings.
+
+    The first scheme of `PASSWORD_HASH_SCHEMES` hashes new passwords. The other schemes are marked as deprecated, so
+    hashes created with them, or with a cost different from the configured one, are reported as needing an update.
+
+    Args:
+        settings (Settings): Settings object with the app's configuration.
+
+    Returns:
+        CryptContext: The configured CryptContext.
+    """
+    schemes = [scheme.strip() for scheme in settings.PASSWORD_HASH_SCHEMES.split(",") if scheme.strip()]
+    options = {}
+    if "bcrypt" in schemes:
+        options["bcrypt__rounds"] = settings.PASSWORD_BCRYPT_ROUNDS
+    if "argon2" in schemes:
+        options["argon2__time_cost"] = settings.PASSWORD_ARGON2_TIME_COST
+        options["argon2__memory_cost"] = settings.PASSWORD_ARGON2_MEMORY_COST
+        options["argon2__parallelism"] = settings.PASSWORD_ARGON2_PARALLELISM
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
 class PasswordManagerProvider(IPasswordManagerProvider):
     """
     Implementation of IPasswordManagerProvider that uses PassLib to hash and verify passwords.
 
     Args:
-        pwd_context (CryptContext): An instance of passlib's CryptContext. Default is a CryptContext instance using the bcrypt scheme.
+        pwd_context (Optional[CryptContext]): An instance of passlib's CryptContext. Defaults to the CryptContext built from the password hashing settings.
     """
 
-    def __init__(self, pwd_context: CryptContext = CryptContext(schemes=["bcrypt"])):
-        self.pwd_context = pwd_context
+    def __init__(self, pwd_context: Optional[CryptContext] = None):
+        self.pwd_context = pwd_context if pwd_context else build_crypt_context()
 
+    @timed(provider_call_duration, "password", "hash")
     def hash_generate(self, text: str) -> str:
         """
         Hashes a password string.
@@ -26,6 +57,23 @@ class PasswordManagerProvider(IPasswordManagerProvider):
         """
         return self.pwd_context.hash(text)
 
+    @timed(provider_call_duration, "password", "hash_many")
+    def hash_generate_many(self, texts: List[str]) -> List[str]:
+        """
+        Hashes several password strings.
+
+        The batch is timed as a whole, so its passwords are hashed with the CryptContext rather than `hash_generate`,
+        which would also record each of them as a single hash.
+
+        Args:
+            texts (List[str]): The password strings to be hashed.
+
+        Returns:
+            List[str]: The hashed passwords, in the order of `texts`.
+        """
+        return [self.pwd_context.hash(text) for text in texts]
+
+    @timed(provider_call_duration, "password", "verify")
     def hash_verify(self, text, hash) -> bool:
         """
         Verifies a password string against a hash.
@@ -38,3 +86,52 @@ class PasswordManagerProvider(IPasswordManagerProvider):
             bool: True if the password matches the hash, False otherwise.
         """
         return self.pwd_context.verify(text, hash)
+
+    def hash_needs_update(self, hash: str) -> bool:
+        """
+        Checks whether a hash was created with a deprecated scheme or a cost different from the configured one.
+
+        Args:
+            hash (str): The hash string to be checked.
+
+        Returns:
+            bool: True if the password should be hashed again, False otherwise.
+        """
+        return self.pwd_context.needs_update(hash)
+
+    async def hash_generate_async(self, text: str) -> str:
+        """
+        Hashes a password string without blocking the event loop.
+
+        Args:
+            text (str): The password string to be hashed.
+
+        Returns:
+            str: The hashed password.
+        """
+        return await run_in_threadpool(self.hash_generate, text)
+
+    async def hash_generate_many_async(self, texts: List[str]) -> List[str]:
+        """
+        Hashes several password strings without blocking the event loop.
+
+        Args:
+            texts (List[str]): The password strings to be hashed.
+
+        Returns:
+            List[str]: The hashed passwords, in the order of `texts`.
+        """
+        return await run_in_threadpool(self.hash_generate_many, texts)
+
+    async def hash_verify_async(self, text: str, hash: str) -> bool:
+        """
+        Verifies a password string against a hash without blocking the event loop.
+
+        Args:
+            text (str): The password string to be verified.
+            hash (str): The hash string to be compared against.
+
+        Returns:
+            bool: True if the password matches the hash, False otherwise.
+        """
+        return await run_in_threadpool(self.hash_verify, text, hash)
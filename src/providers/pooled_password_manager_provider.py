@@ -0,0 +1,258 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from src.config.settings import Settings
+from src.utils.metrics_utils import provider_call_duration, timed
+
+from .interfaces.ipassword_manager import IPasswordManagerProvider
+from .password_manager_provider import PasswordManagerProvider
+
+settings = Settings()
+
+_worker_context: Optional[CryptContext] = None
+
+
+def _init_worker(context_config: str) -> None:
+    """
+    Build the CryptContext used by a worker process.
+
+    Args:
+        context_config (str): The serialized configuration of the parent's CryptContext.
+    """
+    global _worker_context
+    _worker_context = CryptContext.from_string(context_config)
+
+
+def _hash_generate(text: str) -> str:
+    return _worker_context.hash(text)
+
+
+def _hash_generate_many(texts: List[str]) -> List[str]:
+    return [_worker_context.hash(text) for text in texts]
+
+
+def _hash_verify(text: str, hash: str) -> bool:
+    return _worker_context.verify(text, hash)
+
+
+class PooledPasswordManagerProvider(PasswordManagerProvider):
+    """
+    Implementation of IPasswordManagerProvider that hashes and verifies passwords in a pool of worker processes.
+
+    Hashing is CPU bound and holds the GIL, so running it in separate processes spreads the load across cores and keeps
+    the serving threads and the event loop responsive. The number of jobs queued or running in the pool is bounded: once
+    `max_pending` jobs are in flight, new ones are rejected with an HTTP 503 instead of piling up.
+
+    Args:
+        pwd_context (Optional[CryptContext]): An instance of passlib's CryptContext. Defaults to the CryptContext built from the password hashing settings. Its configuration is replicated in every worker.
+        max_workers (int): The number of worker processes. Defaults to `PASSWORD_HASH_WORKERS`.
+        max_pending (int): The maximum number of jobs queued or running at once. Defaults to `PASSWORD_HASH_MAX_PENDING`.
+    """
+
+    def __init__(
+        self,
+        pwd_context: Optional[CryptContext] = None,
+        max_workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_pending: int = settings.PASSWORD_HASH_MAX_PENDING,
+    ):
+        super().__init__(pwd_context)
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Returns the process pool, starting it on first use.
+
+        Returns:
+            ProcessPoolExecutor: The pool running the hashing jobs.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.pwd_context.to_string(),),
+                )
+            return self._executor
+
+    def _submit(self, fn, *args) -> Future:
+        """
+        Submits a job to the pool, rejecting it when too many jobs are already pending.
+
+        Args:
+            fn: The module level function to run in a worker process.
+            *args: The arguments of the function.
+
+        Returns:
+            Future: The future of the submitted job.
+
+        Raises:
+            HTTPException: If `max_pending` jobs are already queued or running.
+        """
+        if not self._pending.acquire(blocking=False):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Password hashing capacity exhausted, try again later",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+        return future
+
+    @timed(provider_call_duration, "password", "hash")
+    def hash_generate(self, text: str) -> str:
+        """
+        Hashes a password string in a worker process, waiting for the result.
+
+        Args:
+            text (str): The password string to be hashed.
+
+        Returns:
+            str: The hashed password.
+        """
+        return self._submit(_hash_generate, text).result()
+
+    def _submit_many(self, texts: List[str]) -> List[Future]:
+        """
+        Splits a list of passwords into one hashing job per worker process.
+
+        A batch only takes as many of the `max_pending` slots as there are workers, and never more than `max_pending`,
+        whatever its size. When a job of the batch is rejected, the jobs already submitted are cancelled, so their
+        passwords are not hashed for nobody.
+
+        Args:
+            texts (List[str]): The password strings to be hashed.
+
+        Returns:
+            List[Future]: The futures of the jobs, each resolving to the hashes of a contiguous slice of `texts`.
+
+        Raises:
+            HTTPException: If too few of the `max_pending` slots are free for the batch.
+        """
+        size = max(-(-len(texts) // min(self.max_workers, self.max_pending)), 1)
+        futures: List[Future] = []
+        try:
+            for start in range(0, len(texts), size):
+                futures.append(self._submit(_hash_generate_many, texts[start : start + size]))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return futures
+
+    @timed(provider_call_duration, "password", "hash_many")
+    def hash_generate_many(self, texts: List[str]) -> List[str]:
+        """
+        Hashes several password strings in parallel across the worker processes, waiting for the results.
+
+        Args:
+            texts (List[str]): The password strings to be hashed.
+
+        Returns:
+            List[str]: The hashed passwords, in the order of `texts`.
+        """
+        return [hash for future in self._submit_many(texts) for hash in future.result()]
+
+    @timed(provider_call_duration, "password", "verify")
+    def hash_verify(self, text, hash) -> bool:
+        """
+        Verifies a password string against a hash in a worker process, waiting for the result.
+
+        Args:
+            text (str): The password string to be verified.
+            hash: The hash string to be compared against.
+
+        Returns:
+            bool: True if the password matches the hash, False otherwise.
+        """
+        return self._submit(_hash_verify, text, hash).result()
+
+    @timed(provider_call_duration, "password", "hash")
+    async def hash_generate_async(self, text: str) -> str:
+        """
+        Hashes a password string in a worker process without blocking the event loop.
+
+        Args:
+            text (str): The password string to be hashed.
+
+        Returns:
+            str: The hashed password.
+        """
+        return await asyncio.wrap_future(self._submit(_hash_generate, text))
+
+    @timed(provider_call_duration, "password", "hash_many")
+    async def hash_generate_many_async(self, texts: List[str]) -> List[str]:
+        """
+        Hashes several password strings in parallel across the worker processes without blocking the event loop.
+
+        Args:
+            texts (List[str]): The password strings to be hashed.
+
+        Returns:
+            List[str]: The hashed passwords, in the order of `texts`.
+        """
+        chunks = await asyncio.gather(*(asyncio.wrap_future(future) for future in self._submit_many(texts)))
+        return [hash for chunk in chunks for hash in chunk]
+
+    @timed(provider_call_duration, "password", "verify")
+    async def hash_verify_async(self, text: str, hash: str) -> bool:
+        """
+        Verifies a password string against a hash in a worker process without blocking the event loop.
+
+        Args:
+            text (str): The password string to be verified.
+            hash (str): The hash string to be compared against.
+
+        Returns:
+            bool: True if the password matches the hash, False otherwise.
+        """
+        return await asyncio.wrap_future(self._submit(_hash_verify, text, hash))
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes, if they were started.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+@lru_cache()
+def get_password_manager() -> IPasswordManagerProvider:
+    """
+    Returns the password manager shared by the application.
+
+    A `PooledPasswordManagerProvider` is used when `PASSWORD_HASH_WORKERS` is greater than zero, otherwise passwords
+    are hashed in the calling thread by a `PasswordManagerProvider`.
+
+    Returns:
+        IPasswordManagerProvider: The shared password manager.
+    """
+    if settings.PASSWORD_HASH_WORKERS > 0:
+        return PooledPasswordManagerProvider()
+    return PasswordManagerProvider()
+
+
+def shutdown_password_manager() -> None:
+    """
+    Stops the worker processes of the shared password manager, if it uses any.
+    """
+    password_manager = get_password_manager()
+    if isinstance(password_manager, PooledPasswordManagerProvider):
+        password_manager.shutdown()
@@ -1,9 +1,13 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
 
 from src.config.settings import Settings
+from src.utils.cache_utils import token_cache
+from src.utils.metrics_utils import provider_call_duration, timed
 
 from .interfaces.itoken_manager import ITokenManagerProvider
 
@@ -12,6 +16,10 @@ class TokenManagerProvider(ITokenManagerProvider):
     """
     TokenManagerProvider implements the ITokenManagerProvider interface to generate and verify access tokens.
 
+    When `TOKEN_CACHE_ENABLED` is set, the claims of verified tokens are cached under a digest of the token, so verifying
+    a token that was already seen is a dictionary lookup. A cached entry never outlives the token's `exp` claim nor
+    `TOKEN_CACHE_MAX_TTL_SECONDS`, and `forget_cached_token` drops it.
+
     Args:
         settings (Settings): Settings object with the app's configuration.
 
@@ -23,6 +31,62 @@ class TokenManagerProvider(ITokenManagerProvider):
     def __init__(self, settings=Settings()):
         self.settings = settings
 
+    def _token_digest(self, token: str) -> str:
+        """
+        Compute the key under which the claims of a token are cached.
+
+        The digest covers the signing key and algorithm, so claims verified with one configuration are never served to
+        a provider using another one.
+
+        Args:
+            token (str): Encoded JWT token.
+
+        Returns:
+            str: Hex digest identifying the token.
+
+        """
+        material = f"{self.settings.ALGORITHM}:{self.settings.SECRET_KEY}:{token}"
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    @timed(provider_call_duration, "token", "decode")
+    def _decode(self, token: str) -> dict[str, any]:
+        """
+        Verify a JWT token and return its claims, using the verified token cache when it is enabled.
+
+        Args:
+            token (str): Encoded JWT token.
+
+        Returns:
+            dict: Claims encoded in the token.
+
+        Raises:
+            JWTError: If the token is invalid or expired.
+
+        """
+        if not self.settings.TOKEN_CACHE_ENABLED:
+            return jwt.decode(token, self.settings.SECRET_KEY, algorithms=[self.settings.ALGORITHM])
+
+        key = self._token_digest(token)
+        claims = token_cache.get(key)
+        if claims is None:
+            claims = jwt.decode(token, self.settings.SECRET_KEY, algorithms=[self.settings.ALGORITHM])
+            ttl = claims["exp"] - time.time() if "exp" in claims else None
+            token_cache.set(key, claims, ttl)
+        return dict(claims)
+
+    def forget_cached_token(self, token: str) -> None:
+        """
+        Drop the cached verification of a token, so the next verification decodes it again.
+
+        This does not revoke the token: as long as its signature and `exp` claim are valid, it is accepted again.
+
+        Args:
+            token (str): Encoded JWT token.
+
+        """
+        token_cache.invalidate(self._token_digest(token))
+
+    @timed(provider_call_duration, "token", "create_access_token")
     def create_access_token(self, data: dict) -> str:
         """
         Create an access token with a given expiration time.
@@ -40,6 +104,7 @@ class TokenManagerProvider(ITokenManagerProvider):
         token_jwt = jwt.encode(data, self.settings.SECRET_KEY, algorithm=self.settings.ALGORITHM)
         return token_jwt
 
+    @timed(provider_call_duration, "token", "generate_jwt_token")
     def generate_jwt_token(self, user_email: str) -> str:
         """
         Generate a JWT token with a given expiration time.
@@ -72,13 +137,27 @@ class TokenManagerProvider(ITokenManagerProvider):
 
         """
         try:
-            decoded_jwt_token = jwt.decode(
-                encoded_jwt_token, self.settings.SECRET_KEY, algorithms=[self.settings.ALGORITHM]
-            )
+            decoded_jwt_token = self._decode(encoded_jwt_token)
             return decoded_jwt_token
         except JWTError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token")
 
+    def get_access_token_claims(self, token: str) -> dict[str, any]:
+        """
+        Verify an access token and return its claims.
+
+        Args:
+            token (str): Access token to verify.
+
+        Returns:
+            dict: Claims encoded in the access token.
+
+        Raises:
+            JWTError: If the token is invalid or expired.
+
+        """
+        return self._decode(token)
+
     def verify_access_token(self, token: str) -> str:
         """
         Verify if an access token is valid.
@@ -90,5 +169,5 @@ class TokenManagerProvider(ITokenManagerProvider):
             str: User id encoded in the access token.
 
         """
-        charge = jwt.decode(token, self.settings.SECRET_KEY, algorithms=[self.settings.ALGORITHM])
+        charge = self.get_access_token_claims(token)
         return charge.get("sub")
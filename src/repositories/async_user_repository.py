@@ -0,0 +1,389 @@
+from typing import AsyncIterator, Awaitable, Callable, Hashable, List, Optional, Sequence
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
+
+from src.config.replica import READ_REPLICA
+from src.config.settings import Settings
+from src.entities.user_entity import User
+from src.providers.interfaces.ipassword_manager import IPasswordManagerProvider
+from src.providers.pooled_password_manager_provider import get_password_manager
+from src.schemas.user_schema import UserCreate, UserUpdate
+from src.utils.cache_utils import principal_cache
+from src.utils.integrity_utils import insert_ignoring_conflicts
+from src.utils.session_utils import has_changes, release_connection
+from src.utils.single_flight_utils import async_user_lookups
+
+from .interfaces.iuser_repository import IUserRepository
+
+settings = Settings()
+
+
+class AsyncUserRepository(IUserRepository):
+    """Asynchronous implementation of the IUserRepository interface for User entity.
+
+    This class works on top of an `AsyncSession`: every method is a coroutine that awaits the database through the
+    async driver, and passwords are hashed with the password manager's async methods, so no call blocks the event
+    loop. No pooled connection is held while a password is hashed, unless the session has changes of its own to
+    commit. Read-only queries are marked with `READ_REPLICA`, so a `RoutingSession` may serve them from a read
+    replica.
+
+    Args:
+        db: SQLAlchemy AsyncSession instance
+        password_manager: Password manager instance, defaults to the application's shared password manager
+
+    Attributes:
+        db (AsyncSession): SQLAlchemy AsyncSession instance
+        password_manager (IPasswordManagerProvider): Password manager instance
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        password_manager: Optional[IPasswordManagerProvider] = None,
+    ) -> None:
+        """Constructor method to initialize AsyncUserRepository instance.
+
+        Args:
+            db (AsyncSession): SQLAlchemy AsyncSession instance
+            password_manager (Optional[IPasswordManagerProvider], optional): Password manager instance, defaults to None
+        """
+        self.db = db
+        self.password_manager = password_manager if password_manager else get_password_manager()
+
+    async def _hash_password(self, password: str) -> str:
+        """Hash a password without holding a pooled connection.
+
+        When the transaction opened by earlier reads has nothing to commit, it is ended first, which returns its
+        connection to the pool, so a slow hash does not keep a connection checked out. Pending changes of the caller
+        are never committed that way, see `release_connection`.
+
+        Args:
+            password (str): The password to hash.
+
+        Returns:
+            str: The hashed password.
+        """
+        await release_connection(self.db)
+        return await self.password_manager.hash_generate_async(password)
+
+    async def _hash_passwords(self, passwords: List[str]) -> List[str]:
+        """Hash several passwords without holding a pooled connection.
+
+        Args:
+            passwords (List[str]): The passwords to hash.
+
+        Returns:
+            List[str]: The hashed passwords, in the same order.
+        """
+        await release_connection(self.db)
+        return await self.password_manager.hash_generate_many_async(passwords)
+
+    async def create_user(self, user: UserCreate) -> User:
+        """Create a new User entity.
+
+        The row is inserted with `INSERT ... RETURNING`, so its generated columns come back without a second query.
+        Uniqueness of the email is left to the `uq_users_email` constraint instead of being checked beforehand.
+
+        Args:
+            user (UserCreate): User create schema.
+
+        Returns:
+            User: User entity.
+
+        Raises:
+            IntegrityError: If the row violates a constraint, e.g. the email is already registered. The transaction is
+                rolled back before the error is raised.
+        """
+        user.password = await self._hash_password(user.password)
+        try:
+            db_user = await self.db.scalar(
+                insert(User).values(name=user.name, email=user.email, password=user.password).returning(User)
+            )
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        return db_user
+
+    async def create_users(self, users: List[UserCreate]) -> List[str]:
+        """Create a batch of User entities with a single `INSERT ... ON CONFLICT DO NOTHING RETURNING` statement.
+
+        The passwords of the batch are hashed together, in parallel when the password manager uses worker processes.
+        Users whose email is already registered are skipped instead of aborting the batch.
+
+        Args:
+            users (List[UserCreate]): User create schemas, with distinct emails.
+
+        Returns:
+            List[str]: Emails of the User entities created.
+        """
+        if not users:
+            return []
+        passwords = await self._hash_passwords([user.password for user in users])
+        statement = insert_ignoring_conflicts(User.__table__, self.db.get_bind().dialect.name)
+        rows = [
+            {"name": user.name, "email": user.email, "password": password} for user, password in zip(users, passwords)
+        ]
+        emails = list(await self.db.scalars(statement.values(rows).returning(User.email)))
+        await self.db.commit()
+        return emails
+
+    @staticmethod
+    def _only(statement: Select, fields: Optional[Sequence[str]]) -> Select:
+        """Restrict the columns of User loaded by a query.
+
+        The primary key is always loaded. Columns left out, such as the password, are not read from the database and
+        are loaded on first access, which async sessions do not allow.
+
+        Args:
+            statement (Select): Query selecting User entities.
+            fields (Optional[Sequence[str]]): Names of the columns to load. None loads all of them.
+
+        Returns:
+            Select: The query, loading only the given columns.
+        """
+        if fields is None:
+            return statement
+        return statement.options(load_only(*(getattr(User, field) for field in fields)))
+
+    @staticmethod
+    def _lookup_key(column: str, value: object, fields: Optional[Sequence[str]] = None) -> Hashable:
+        """Build the key identifying the lookups of a user that load the same columns.
+
+        Args:
+            column (str): Name of the column the user is looked up by.
+            value (object): Value looked up.
+            fields (Optional[Sequence[str]]): Names of the columns loaded. None loads all of them.
+
+        Returns:
+            Hashable: The key.
+        """
+        return column, value, tuple(fields) if fields is not None else None
+
+    @staticmethod
+    def _copy(user: User) -> User:
+        """Copy the loaded columns of a user into a new instance, which is not bound to any session.
+
+        Args:
+            user (User): User entity, possibly loaded by another session.
+
+        Returns:
+            User: Transient copy of the user.
+        """
+        loaded = user.__dict__
+        return User(**{column.key: loaded[column.key] for column in User.__table__.columns if column.key in loaded})
+
+    async def _lookup(self, key: Hashable, load: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        """Look a user up, sharing one query between the identical lookups made concurrently on the event loop.
+
+        The request running the query gets the user loaded by its session, and the requests that joined it get
+        copies, so no session ever holds an entity loaded by another one. A session that has changes of its own, see
+        `has_changes`, always runs its own query, as a query in flight may have started before its writes, or run on a
+        read replica its reads are not sent to anymore. Disabled by `USER_LOOKUP_COALESCING_ENABLED`.
+
+        Args:
+            key (Hashable): Key identifying identical lookups, see `_lookup_key`.
+            load (Callable[[], Awaitable[Optional[User]]]): Function running the query.
+
+        Returns:
+            Optional[User]: User entity, or None if the user was not found.
+        """
+        if not settings.USER_LOOKUP_COALESCING_ENABLED or has_changes(self.db.sync_session):
+            return await load()
+        user, shared = await async_user_lookups.do(key, load)
+        return self._copy(user) if shared and user is not None else user
+
+    async def get_user_by_id(self, user_id: int, fields: Optional[Sequence[str]] = None) -> User:
+        """Retrieve a User entity by id.
+
+        Args:
+            user_id (int): User id.
+            fields (Optional[Sequence[str]]): Only these columns are loaded. Defaults to all of them.
+
+        Returns:
+            User: User entity.
+        """
+        statement = self._only(select(User), fields).where(User.id == user_id)
+        return await self._lookup(
+            self._lookup_key("id", user_id, fields),
+            lambda: self.db.scalar(statement, bind_arguments=READ_REPLICA),
+        )
+
+    async def get_user_version(self, user_id: int) -> Optional[Row]:
+        """Retrieve only the modification times of a User entity, to check whether a client's copy is current.
+
+        Args:
+            user_id (int): User id.
+
+        Returns:
+            Optional[Row]: Row with the updated_at and created_at columns, or None if no user has this id.
+        """
+        statement = select(User.updated_at, User.created_at).where(User.id == user_id)
+        return (await self.db.execute(statement, bind_arguments=READ_REPLICA)).first()
+
+    async def get_user_by_email(self, email: str) -> User:
+        """Retrieve a User entity by email.
+
+        Args:
+            email (str): User email.
+
+        Returns:
+            User: User entity.
+        """
+        statement = select(User).where(User.email == email)
+        return await self._lookup(
+            self._lookup_key("email", email), lambda: self.db.scalar(statement, bind_arguments=READ_REPLICA)
+        )
+
+    async def get_users_by_ids(self, user_ids: List[int], fields: Optional[Sequence[str]] = None) -> List[User]:
+        """Retrieve the User entities with the given ids using a single `WHERE id IN (...)` query.
+
+        Args:
+            user_ids (List[int]): User ids.
+            fields (Optional[Sequence[str]]): Only these columns are loaded. Defaults to all of them.
+
+        Returns:
+            List[User]: List of the User entities found, in no particular order.
+        """
+        if not user_ids:
+            return []
+        statement = self._only(select(User), fields).where(User.id.in_(user_ids))
+        return list(await self.db.scalars(statement, bind_arguments=READ_REPLICA))
+
+    async def get_all_users(self) -> List[User]:
+        """Retrieve all User entities.
+
+        Returns:
+            List[User]: List of User entities.
+        """
+        return list(await self.db.scalars(select(User), bind_arguments=READ_REPLICA))
+
+    async def get_users_page(
+        self, limit: int, after_id: Optional[int] = None, fields: Optional[Sequence[str]] = None
+    ) -> List[User]:
+        """Retrieve a page of User entities using keyset pagination on the primary key.
+
+        Args:
+            limit (int): Maximum number of users to return.
+            after_id (Optional[int]): Only users with an id greater than this value are returned.
+            fields (Optional[Sequence[str]]): Only these columns, and the id, are loaded. Defaults to all of them.
+
+        Returns:
+            List[User]: List of User entities ordered by id.
+        """
+        statement = self._only(select(User), fields)
+        if after_id is not None:
+            statement = statement.where(User.id > after_id)
+        return list(await self.db.scalars(statement.order_by(User.id).limit(limit), bind_arguments=READ_REPLICA))
+
+    async def stream_users(self, batch_size: int) -> AsyncIterator[List[Row]]:
+        """Stream the public columns of all User entities using a server-side cursor.
+
+        Rows are fetched `batch_size` at a time, so memory use does not grow with the size of the table.
+
+        Args:
+            batch_size (int): Number of rows fetched from the cursor per batch.
+
+        Returns:
+            AsyncIterator[List[Row]]: Batches of rows with the id, name, email and created_at columns, ordered by id.
+        """
+        statement = (
+            select(User.id, User.name, User.email, User.created_at)
+            .order_by(User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(statement, bind_arguments=READ_REPLICA)
+        try:
+            async for rows in result.partitions():
+                yield rows
+        finally:
+            await result.close()
+
+    async def update_user(self, user: User, user_update: UserUpdate) -> User:
+        """Update a User entity.
+
+        Args:
+            user (User): User entity to update.
+            user_update (UserUpdate): User update schema.
+
+        Returns:
+            User: Updated User entity.
+        """
+        return await self.update_user_by_id(user.id, user_update)
+
+    async def update_user_by_id(self, user_id: int, user_update: UserUpdate) -> Optional[User]:
+        """Update a User entity by id with a single `UPDATE ... RETURNING` statement.
+
+        Args:
+            user_id (int): User id.
+            user_update (UserUpdate): User update schema.
+
+        Returns:
+            Optional[User]: Updated User entity, or None if no user has this id.
+        """
+        values = {key: value for key, value in {"name": user_update.name, "email": user_update.email}.items() if value}
+        if user_update.password:
+            values["password"] = await self._hash_password(user_update.password)
+        # from_statement with populate_existing also refreshes a user already loaded in the session
+        user = await self.db.scalar(
+            select(User)
+            .from_statement(update(User).where(User.id == user_id).values(**values).returning(User))
+            .execution_options(populate_existing=True)
+        )
+        await self.db.commit()
+        principal_cache.invalidate_where(lambda principal: principal.id == user_id)
+        return user
+
+    async def update_user_password(self, user: User, password: str) -> User:
+        """Update the password of a User entity.
+
+        Args:
+            user (User): User entity to update.
+            password (str): New password.
+
+        Returns:
+            User: Updated User entity.
+        """
+        password = await self._hash_password(password)
+        user = await self.db.scalar(
+            select(User)
+            .from_statement(update(User).where(User.id == user.id).values(password=password).returning(User))
+            .execution_options(populate_existing=True)
+        )
+        await self.db.commit()
+        principal_cache.invalidate(user.email)
+        return user
+
+    async def delete_user(self, user: User) -> None:
+        """
+        Deletes a User entity from the database.
+
+        Args:
+            user (User): The User entity to be deleted.
+
+        Returns:
+            None
+        """
+        await self.delete_user_by_id(user.id)
+
+    async def delete_user_by_id(self, user_id: int) -> bool:
+        """
+        Deletes a User entity by id with a single `DELETE ... RETURNING` statement.
+
+        Args:
+            user_id (int): User id.
+
+        Returns:
+            bool: True if the user was deleted, False if no user has this id.
+        """
+        email = await self.db.scalar(delete(User).where(User.id == user_id).returning(User.email))
+        await self.db.commit()
+        if email is None:
+            return False
+        principal_cache.invalidate(email)
+        return True
@@ -0,0 +1,250 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import orjson
+from sqlalchemy import DateTime
+from sqlalchemy.engine import Row
+
+from src.entities.user_entity import User
+from src.schemas.user_schema import UserCreate, UserUpdate
+from src.utils.cache_utils import SharedCache, TTLCache, shared_user_cache, user_cache
+from src.utils.user_utils import VERSION_FIELDS
+
+from .interfaces.iuser_repository import IUserRepository
+
+# Columns kept in the cache: the password hash is left out, so neither tier ever holds it
+CACHED_COLUMNS = tuple(column for column in User.__table__.columns if column.key != "password")
+CACHED_KEYS = frozenset(column.key for column in CACHED_COLUMNS)
+
+
+class AsyncCachedUserRepository(IUserRepository):
+    """Decorator of an `AsyncUserRepository` serving the users read by id or email from a read-through cache.
+
+    The cache has two tiers: a bounded in-process LRU cache, and optionally a cache shared by every process, stored in
+    Redis and reached through its asyncio client, so cache lookups do not block the event loop. A lookup tries them in
+    this order before reading the database, and the user read is stored in both. Updates and deletions made through
+    this repository invalidate the user in both tiers; the in-process tier of the other processes keeps it until its
+    time to live expires.
+
+    Whole users are cached, so a miss loads every column whatever `fields` asks for, and a hit serves any of them, set
+    on the returned user as the decorated repository would.
+    Users are cached by id, and emails are only mapped to ids: a user found through an email it no longer has is
+    treated as a miss, so an update of the email needs no invalidation of the email.
+
+    The password hash is never cached, so a user served from the cache has no password: code checking or replacing a
+    password, such as logging in, must read the user through an uncached repository. The modification times used for
+    entity tags are read through the cache too, so a tag always matches the cached user it describes.
+
+    Args:
+        repository (IUserRepository): The async repository reading and writing the database.
+        local (TTLCache): The in-process tier. Defaults to `user_cache`.
+        shared (Optional[SharedCache]): The shared tier, if any. Defaults to `shared_user_cache`.
+
+    Attributes:
+        repository (IUserRepository): The async repository reading and writing the database.
+        local (TTLCache): The in-process tier.
+        shared (Optional[SharedCache]): The shared tier, if any.
+    """
+
+    def __init__(
+        self,
+        repository: IUserRepository,
+        local: TTLCache = user_cache,
+        shared: Optional[SharedCache] = shared_user_cache,
+    ) -> None:
+        self.repository = repository
+        self.local = local
+        self.shared = shared
+
+    @staticmethod
+    def _id_key(user_id: int) -> str:
+        return f"users:id:{user_id}"
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"users:email:{email}"
+
+    @staticmethod
+    def _values(user: User) -> Dict[str, Any]:
+        """Copy the column values of a user, but its password, so the cached user is not bound to the session that loaded
+        it.
+
+        Args:
+            user (User): User entity.
+
+        Returns:
+            Dict[str, Any]: Value of each cached column, keyed by attribute name.
+        """
+        return {column.key: getattr(user, column.key) for column in CACHED_COLUMNS}
+
+    @staticmethod
+    def _user(values: Dict[str, Any], fields: Optional[Sequence[str]] = None) -> User:
+        """Build a user from its cached values, with the same columns the decorated repository would have loaded.
+
+        Args:
+            values (Dict[str, Any]): Value of each cached column, keyed by attribute name.
+            fields (Optional[Sequence[str]]): Only these columns are set, along with the id. Defaults to all of them.
+
+        Returns:
+            User: User entity, not bound to a session.
+        """
+        if fields is None:
+            return User(**values)
+        return User(**{key: values[key] for key in ("id", *fields)})
+
+    @staticmethod
+    def _cacheable(fields: Optional[Sequence[str]]) -> bool:
+        """Tell whether the columns a lookup asks for can be served from the cache.
+
+        Args:
+            fields (Optional[Sequence[str]]): Names of the columns to load. None loads all of them.
+
+        Returns:
+            bool: False if a column that is not cached, i.e. the password, is asked for explicitly.
+        """
+        return fields is None or all(field in CACHED_KEYS for field in fields)
+
+    @staticmethod
+    def _loads(data: bytes) -> Dict[str, Any]:
+        """Decode the column values of a user read from the shared tier.
+
+        Args:
+            data (bytes): JSON document, with the datetimes in ISO 8601 format.
+
+        Returns:
+            Dict[str, Any]: Value of each column, keyed by attribute name.
+        """
+        values = orjson.loads(data)
+        for column in CACHED_COLUMNS:
+            if isinstance(column.type, DateTime) and values.get(column.key) is not None:
+                values[column.key] = datetime.fromisoformat(values[column.key])
+        return values
+
+    async def _cached_values(self, user_id: int) -> Optional[Dict[str, Any]]:
+        key = self._id_key(user_id)
+        values = self.local.get(key)
+        if values is None and self.shared is not None:
+            data = await self.shared.get(key)
+            if data is not None:
+                values = self._loads(data)
+                self.local.set(key, values)
+        return values
+
+    async def _cached_id(self, email: str) -> Optional[int]:
+        key = self._email_key(email)
+        user_id = self.local.get(key)
+        if user_id is None and self.shared is not None:
+            data = await self.shared.get(key)
+            if data is not None:
+                user_id = int(data)
+                self.local.set(key, user_id)
+        return user_id
+
+    async def _store(self, user: User) -> None:
+        values = self._values(user)
+        self.local.set(self._id_key(user.id), values)
+        self.local.set(self._email_key(user.email), user.id)
+        if self.shared is not None:
+            await self.shared.set(self._id_key(user.id), orjson.dumps(values))
+            await self.shared.set(self._email_key(user.email), str(user.id).encode())
+
+    async def _invalidate(self, user_id: int) -> None:
+        self.local.invalidate(self._id_key(user_id))
+        if self.shared is not None:
+            await self.shared.invalidate(self._id_key(user_id))
+
+    async def create_user(self, user: UserCreate) -> User:
+        return await self.repository.create_user(user)
+
+    async def create_users(self, users: List[UserCreate]) -> List[str]:
+        return await self.repository.create_users(users)
+
+    async def get_user_by_id(self, user_id: int, fields: Optional[Sequence[str]] = None) -> Optional[User]:
+        """Retrieve a User entity by id, from the cache if possible.
+
+        Args:
+            user_id (int): User id.
+            fields (Optional[Sequence[str]]): Only these columns are set on a user served from the cache. Every column
+                is loaded on a miss, to be cached.
+
+        Returns:
+            Optional[User]: User entity, not bound to a session and without its password when it comes from the cache,
+            or None.
+        """
+        if not self._cacheable(fields):
+            return await self.repository.get_user_by_id(user_id, fields)
+        values = await self._cached_values(user_id)
+        if values is not None:
+            return self._user(values, fields)
+        user = await self.repository.get_user_by_id(user_id)
+        if user is not None:
+            await self._store(user)
+        return user
+
+    async def get_user_version(self, user_id: int) -> Optional[User]:
+        """Retrieve the modification times of a User entity through the cache, like `get_user_by_id` does.
+
+        Args:
+            user_id (int): User id.
+
+        Returns:
+            Optional[User]: User entity with at least its updated_at and created_at columns, or None.
+        """
+        return await self.get_user_by_id(user_id, VERSION_FIELDS)
+
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        """Retrieve a User entity by email, from the cache if possible.
+
+        Args:
+            email (str): User email.
+
+        Returns:
+            Optional[User]: User entity, not bound to a session and without its password when it comes from the cache,
+            or None.
+        """
+        user_id = await self._cached_id(email)
+        values = await self._cached_values(user_id) if user_id is not None else None
+        if values is not None and values["email"] == email:
+            return self._user(values)
+        user = await self.repository.get_user_by_email(email)
+        if user is not None:
+            await self._store(user)
+        return user
+
+    async def get_users_by_ids(self, user_ids: List[int], fields: Optional[Sequence[str]] = None) -> List[User]:
+        return await self.repository.get_users_by_ids(user_ids, fields)
+
+    async def get_all_users(self) -> List[User]:
+        return await self.repository.get_all_users()
+
+    async def get_users_page(
+        self, limit: int, after_id: Optional[int] = None, fields: Optional[Sequence[str]] = None
+    ) -> List[User]:
+        return await self.repository.get_users_page(limit, after_id, fields)
+
+    def stream_users(self, batch_size: int) -> AsyncIterator[List[Row]]:
+        return self.repository.stream_users(batch_size)
+
+    async def update_user(self, user: User, user_update: UserUpdate) -> User:
+        updated_user = await self.repository.update_user(user, user_update)
+        await self._invalidate(user.id)
+        return updated_user
+
+    async def update_user_by_id(self, user_id: int, user_update: UserUpdate) -> Optional[User]:
+        user = await self.repository.update_user_by_id(user_id, user_update)
+        await self._invalidate(user_id)
+        return user
+
+    async def update_user_password(self, user: User, password: str) -> User:
+        updated_user = await self.repository.update_user_password(user, password)
+        await self._invalidate(user.id)
+        return updated_user
+
+    async def delete_user(self, user: User) -> None:
+        await self.repository.delete_user(user)
+        await self._invalidate(user.id)
+
+    async def delete_user_by_id(self, user_id: int) -> bool:
+        deleted = await self.repository.delete_user_by_id(user_id)
+        await self._invalidate(user_id)
+        return deleted
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Optional, Sequence
+
+from sqlalchemy.engine import Row
 
 from src.entities.user_entity import User
 from src.schemas.user_schema import UserCreate, UserUpdate
@@ -9,7 +11,7 @@ class IUserRepository(ABC):
     """
     An abstract base class that defines the interface for a repository responsible for managing user entities in a data store.
 
-    Concrete implementations of this interface will provide the necessary functionality to interact with a specific data store.
+    Concrete implementations of this interface will provide the necessary functionality to interact with a specific data store. Every method is a coroutine, but `stream_users`, which returns an asynchronous iterator.
 
     Attributes:
         ABC (class): A helper class that has ABCMeta as its metaclass. With this class, an abstract base class can be defined by simply deriving from ABC avoiding sometimes-confusing metaclass usage.
@@ -18,27 +20,49 @@ class IUserRepository(ABC):
         create_user(user: UserCreate) -> User:
             Creates a new user entity and returns it after persisting it to the data store.
 
-        get_user_by_id(user_id: int) -> User:
+        create_users(users: List[UserCreate]) -> List[str]:
+            Creates a batch of user entities, skipping those whose email is already registered, and returns the emails
+            of the created ones.
+
+        get_user_by_id(user_id: int, fields: Optional[Sequence[str]] = None) -> User:
             Retrieves a user entity by its unique identifier from the data store.
 
+        get_user_version(user_id: int) -> Optional[Row]:
+            Retrieves only the modification times of a user entity, to tell whether a cached copy is current.
+
         get_user_by_email(email: str) -> User:
             Retrieves a user entity by its email address from the data store.
 
+        get_users_by_ids(user_ids: List[int], fields: Optional[Sequence[str]] = None) -> List[User]:
+            Retrieves the user entities with the given unique identifiers from the data store.
+
         get_all_users() -> List[User]:
             Retrieves all user entities from the data store.
 
+        get_users_page(limit: int, after_id: Optional[int] = None, fields: Optional[Sequence[str]] = None) -> List[User]:
+            Retrieves a page of user entities ordered by their unique identifier.
+
+        stream_users(batch_size: int) -> AsyncIterator[List[Row]]:
+            Streams the public columns of every user entity from the data store in batches.
+
         update_user(user: User, user_update: UserUpdate) -> User:
             Updates an existing user entity and returns it after persisting the changes to the data store.
 
+        update_user_by_id(user_id: int, user_update: UserUpdate) -> Optional[User]:
+            Updates the user entity with the given identifier in a single statement and returns it, if it exists.
+
         update_user_password(user: User, password: str) -> User:
             Updates the password of an existing user entity and returns it after persisting the changes to the data store.
 
         delete_user(user: User):
             Deletes an existing user entity from the data store.
+
+        delete_user_by_id(user_id: int) -> bool:
+            Deletes the user entity with the given identifier in a single statement, telling whether it existed.
     """
 
     @abstractmethod
-    def create_user(self, user: UserCreate) -> User:
+    async def create_user(self, user: UserCreate) -> User:
         """
         Creates a new user entity and returns it after persisting it to the data store.
 
@@ -51,12 +75,26 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    def get_user_by_id(self, user_id: int) -> User:
+    async def create_users(self, users: List[UserCreate]) -> List[str]:
+        """
+        Creates a batch of user entities, skipping those whose email is already registered.
+
+        Args:
+            users (List[UserCreate]): `UserCreate` objects containing the users' details, with distinct emails.
+
+        Returns:
+            A list with the emails of the user entities that were created.
+        """
+        pass
+
+    @abstractmethod
+    async def get_user_by_id(self, user_id: int, fields: Optional[Sequence[str]] = None) -> User:
         """
         Retrieves a user entity by its unique identifier from the data store.
 
         Args:
             user_id (int): An integer representing the unique identifier of the user entity.
+            fields (Optional[Sequence[str]]): The names of the only attributes to load. Defaults to all of them.
 
         Returns:
             A `User` object representing the retrieved user entity.
@@ -67,7 +105,20 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    def get_user_by_email(self, email: str) -> User:
+    async def get_user_version(self, user_id: int) -> Optional[Row]:
+        """
+        Retrieves only the modification times of a user entity, to tell whether a cached copy is current.
+
+        Args:
+            user_id (int): An integer representing the unique identifier of the user entity.
+
+        Returns:
+            A row with the `updated_at` and `created_at` attributes, or None if the user does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def get_user_by_email(self, email: str) -> User:
         """
         Retrieves a user entity by its email address from the data store.
 
@@ -83,7 +134,21 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all_users(self) -> List[User]:
+    async def get_users_by_ids(self, user_ids: List[int], fields: Optional[Sequence[str]] = None) -> List[User]:
+        """
+        Retrieves the user entities with the given unique identifiers from the data store.
+
+        Args:
+            user_ids (List[int]): The unique identifiers of the user entities.
+            fields (Optional[Sequence[str]]): The names of the only attributes to load. Defaults to all of them.
+
+        Returns:
+            A list of the `User` objects found, in no particular order. Identifiers without a user entity are skipped.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all_users(self) -> List[User]:
         """
         Retrieves all user entities from the data store.
 
@@ -93,7 +158,37 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    def update_user(self, user: User, user_update: UserUpdate) -> User:
+    async def get_users_page(
+        self, limit: int, after_id: Optional[int] = None, fields: Optional[Sequence[str]] = None
+    ) -> List[User]:
+        """
+        Retrieves a page of user entities ordered by their unique identifier.
+
+        Args:
+            limit (int): The maximum number of user entities to retrieve.
+            after_id (Optional[int]): Only user entities with an identifier greater than this one are retrieved.
+            fields (Optional[Sequence[str]]): The names of the only attributes to load. Defaults to all of them.
+
+        Returns:
+            A list of `User` objects representing the requested page.
+        """
+        pass
+
+    @abstractmethod
+    def stream_users(self, batch_size: int) -> AsyncIterator[List[Row]]:
+        """
+        Streams the public columns of every user entity from the data store in batches.
+
+        Args:
+            batch_size (int): The number of rows fetched from the data store at a time.
+
+        Returns:
+            An asynchronous iterator of lists of rows holding the `id`, `name`, `email` and `created_at` of the user entities.
+        """
+        pass
+
+    @abstractmethod
+    async def update_user(self, user: User, user_update: UserUpdate) -> User:
         """
         Updates an existing user entity and returns it after persisting the changes to the data store.
 
@@ -106,7 +201,21 @@ class IUserRepository(ABC):
         """
 
     @abstractmethod
-    def update_user_password(self, user: User, password: str) -> User:
+    async def update_user_by_id(self, user_id: int, user_update: UserUpdate) -> Optional[User]:
+        """
+        Updates the user entity with the given identifier in a single statement and returns it, if it exists.
+
+        Args:
+            user_id (int): The unique identifier of the user entity to update.
+            user_update (UserUpdate): A `UserUpdate` object containing the updated user details.
+
+        Returns:
+            A `User` object representing the updated user entity, or None if no user has this identifier.
+        """
+        pass
+
+    @abstractmethod
+    async def update_user_password(self, user: User, password: str) -> User:
         """
         Updates the password of an existing user entity and returns it after persisting the changes to the data store.
 
@@ -120,7 +229,7 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    def delete_user(self, user: User):
+    async def delete_user(self, user: User):
         """
         Deletes an existing user entity from the data store.
 
@@ -128,3 +237,16 @@ class IUserRepository(ABC):
             user (User): A `User` object representing the existing user entity to delete.
         """
         pass
+
+    @abstractmethod
+    async def delete_user_by_id(self, user_id: int) -> bool:
+        """
+        Deletes the user entity with the given identifier in a single statement.
+
+        Args:
+            user_id (int): The unique identifier of the user entity to delete.
+
+        Returns:
+            True if a user entity was deleted, False if no user has this identifier.
+        """
+        pass
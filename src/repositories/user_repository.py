@@ -1,19 +1,23 @@
 from typing import List, Optional
 
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.entities.user_entity import User
 from src.providers.password_manager_provider import PasswordManagerProvider
+from src.providers.pooled_password_manager_provider import get_password_manager
 from src.schemas.user_schema import UserCreate, UserUpdate
+from src.utils.cache_utils import principal_cache
 
-from .interfaces.iuser_repository import IUserRepository
 
-
-class UserRepository(IUserRepository):
-    """Implementation of the IUserRepository interface for User entity.
+class UserRepository:
+    """Synchronous repository of the User entity.
 
     This class handles database interactions with the User entity, including creating, reading, updating, and deleting
-    User records.
+    User records. The application serves users through `AsyncUserRepository`, which implements `IUserRepository`; this
+    class is only kept for the synchronous authentication helper and the test fixtures, so new features are not
+    added to it.
 
     Args:
         db: SQLAlchemy Session instance
@@ -36,21 +40,31 @@ class UserRepository(IUserRepository):
             password_manager (Optional[PasswordManagerProvider], optional): Password manager instance, defaults to None
         """
         self.db = db
-        self.password_manager = password_manager if password_manager else PasswordManagerProvider()
+        self.password_manager = password_manager if password_manager else get_password_manager()
 
     def create_user(self, user: UserCreate) -> User:
         """Create a new User entity.
 
+        Uniqueness of the email is left to the `uq_users_email` constraint instead of being checked beforehand.
+
         Args:
             user (UserCreate): User create schema.
 
         Returns:
             User: User entity.
+
+        Raises:
+            IntegrityError: If the row violates a constraint, e.g. the email is already registered. The transaction is
+                rolled back before the error is raised.
         """
         user.password = self.password_manager.hash_generate(user.password)
         db_user = User(name=user.name, email=user.email, password=user.password)
         self.db.add(db_user)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise
         self.db.refresh(db_user)
         return db_user
 
@@ -63,7 +77,8 @@ class UserRepository(IUserRepository):
         Returns:
             User: User entity.
         """
-        return self.db.query(User).filter(User.id == user_id).first()
+        statement = select(User).where(User.id == user_id)
+        return self.db.scalars(statement).first()
 
     def get_user_by_email(self, email: str) -> User:
         """Retrieve a User entity by email.
@@ -74,7 +89,8 @@ class UserRepository(IUserRepository):
         Returns:
             User: User entity.
         """
-        return self.db.query(User).filter(User.email == email).first()
+        statement = select(User).where(User.email == email)
+        return self.db.scalars(statement).first()
 
     def get_all_users(self) -> List[User]:
         """Retrieve all User entities.
@@ -82,7 +98,7 @@ class UserRepository(IUserRepository):
         Returns:
             List[User]: List of User entities.
         """
-        return self.db.query(User).all()
+        return self.db.scalars(select(User)).all()
 
     def update_user(self, user: User, user_update: UserUpdate) -> User:
         """Update a User entity.
@@ -94,6 +110,7 @@ class UserRepository(IUserRepository):
         Returns:
             User: Updated User entity.
         """
+        previous_email = user.email
         user.name = user_update.name or user.name
         user.email = user_update.email or user.email
 
@@ -101,6 +118,8 @@ class UserRepository(IUserRepository):
             user.password = self.password_manager.hash_generate(user_update.password)
         self.db.commit()
         self.db.refresh(user)
+        principal_cache.invalidate(previous_email)
+        principal_cache.invalidate(user.email)
         return user
 
     def update_user_password(self, user: User, password: str) -> User:
@@ -116,6 +135,7 @@ class UserRepository(IUserRepository):
         user.password = self.password_manager.hash_generate(password)
         self.db.commit()
         self.db.refresh(user)
+        principal_cache.invalidate(user.email)
         return user
 
     def delete_user(self, user: User) -> None:
@@ -128,5 +148,7 @@ class UserRepository(IUserRepository):
         Returns:
             None
         """
+        email = user.email
         self.db.delete(user)
         self.db.commit()
+        principal_cache.invalidate(email)
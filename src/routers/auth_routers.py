@@ -1,29 +1,32 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from typing import Optional
 
-from src.config.database import get_db
+from fastapi import APIRouter, Depends, Header, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.database import get_async_db
 from src.middlewares.authentication_middleware import AuthenticationMiddleware
 from src.schemas.login_schema import LoginData, SuccessLogin
 from src.schemas.user_schema import UserIn, UserOut
-from src.services.auth_service import AuthService
+from src.services.async_auth_service import AsyncAuthService
 from src.services.interfaces.i_auth_services import IAuthService
+from src.utils.etag_utils import etag_matches, make_etag
 
 from .interfaces.iauth_routers import IAuthRouters
 
 router = APIRouter()
 
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+def get_async_auth_service(db: AsyncSession = Depends(get_async_db)) -> AsyncAuthService:
     """
-    Get an instance of the AuthService with the database session provided by the get_db function.
+    Get an instance of the AsyncAuthService with the async database session provided by the get_async_db function.
 
     Args:
-        db (Session): The SQLAlchemy database session provided by the get_db function.
+        db (AsyncSession): The SQLAlchemy async database session provided by the get_async_db function.
 
     Returns:
-        AuthService: An instance of the AuthService class.
+        AsyncAuthService: An instance of the AsyncAuthService class.
     """
-    return AuthService(db)
+    return AsyncAuthService(db)
 
 
 class AuthRouters(IAuthRouters):
@@ -33,9 +36,9 @@ class AuthRouters(IAuthRouters):
 
     @staticmethod
     @router.post("/token", status_code=status.HTTP_200_OK, response_model=SuccessLogin)
-    def login_for_access_token(
+    async def login_for_access_token(
         login_data: LoginData,
-        auth_service: IAuthService = Depends(get_auth_service),
+        auth_service: IAuthService = Depends(get_async_auth_service),
     ) -> SuccessLogin:
         """
         Log in a user and generate an access token.
@@ -47,18 +50,31 @@ class AuthRouters(IAuthRouters):
         Returns:
             SuccessLogin: A schema representing a successful login attempt, containing a UserOut instance and an access token.
         """
-        return auth_service.login_for_access_token(login_data)
+        return await auth_service.login_for_access_token(login_data)
 
     @staticmethod
     @router.get("/profile", status_code=status.HTTP_200_OK, response_model=UserOut)
-    async def get_profile(user: UserIn = Depends(AuthenticationMiddleware())):
+    async def get_profile(
+        response: Response,
+        if_none_match: Optional[str] = Header(default=None),
+        user: UserIn = Depends(AuthenticationMiddleware()),
+    ):
         """
         Get a user's profile information.
 
+        The response carries a weak ETag computed from the user's id and modification times. A client sending it
+        back in `If-None-Match` gets a `304 Not Modified` response while the profile is unchanged.
+
         Args:
+            response (Response): The response, to set the ETag header on.
+            if_none_match (Optional[str]): The ETags of the copies the client holds, if any.
             user (UserIn): The currently logged-in user.
 
         Returns:
             UserOut: A schema representing a user's profile information.
         """
+        etag = make_etag(user.id, user.created_at, user.updated_at)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
         return user
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from fastapi import Response
 
 from src.schemas.login_schema import LoginData, SuccessLogin
 from src.schemas.user_schema import UserIn
@@ -27,12 +30,16 @@ class IAuthRouters(ABC):
         pass
 
     @abstractmethod
-    def get_profile(user: UserIn):
+    def get_profile(response: Response, if_none_match: Optional[str], user: UserIn):
         """
-        Abstract method for getting a user's profile information.
+        Abstract method for getting a user's profile information, or telling the client that its copy is current.
 
         Args:
         -----
+        response: Response
+            The response, to set the ETag header on.
+        if_none_match: Optional[str]
+            The ETags of the copies the client holds, if any.
         user: UserIn
             The currently logged-in user.
 
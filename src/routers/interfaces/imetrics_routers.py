@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from fastapi.responses import PlainTextResponse
+
+from src.schemas.user_schema import UserIn
+
+
+class IMetricsRouters(ABC):
+    """
+    Interface for the routers exposing internal metrics of the application.
+    """
+
+    @abstractmethod
+    def get_cache_metrics(user: Optional[UserIn]) -> Dict[str, Any]:
+        """
+        Abstract method to retrieve the usage counters of the in-process caches.
+
+        Args:
+            user (Optional[UserIn]): The currently logged-in administrator, or None for the scrape token.
+
+        Returns:
+            Dict[str, Any]: The counters of each cache, keyed by cache name.
+        """
+        pass
+
+    @abstractmethod
+    def get_coalescing_metrics(user: Optional[UserIn]) -> Dict[str, Any]:
+        """
+        Abstract method to retrieve the counters of the coalesced user lookups.
+
+        Args:
+            user (Optional[UserIn]): The currently logged-in administrator, or None for the scrape token.
+
+        Returns:
+            Dict[str, Any]: The counters of the user lookups.
+        """
+        pass
+
+    @abstractmethod
+    def get_prometheus_metrics(user: Optional[UserIn]) -> PlainTextResponse:
+        """
+        Abstract method to retrieve the application metrics in the Prometheus text exposition format.
+
+        Args:
+            user (Optional[UserIn]): The currently logged-in administrator, or None for the scrape token.
+
+        Returns:
+            PlainTextResponse: The exposition of every metric.
+        """
+        pass
+
+    @abstractmethod
+    def get_pool_metrics(user: Optional[UserIn]) -> Dict[str, Any]:
+        """
+        Abstract method to retrieve the usage counters of the database connection pools.
+
+        Args:
+            user (Optional[UserIn]): The currently logged-in administrator, or None for the scrape token.
+
+        Returns:
+            Dict[str, Any]: The counters of each pool, keyed by pool name.
+        """
+        pass
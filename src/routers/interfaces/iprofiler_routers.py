@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.schemas.user_schema import UserIn
+
+
+class IProfilerRouters(ABC):
+    """
+    Interface for the routers profiling the process.
+    """
+
+    @abstractmethod
+    def get_process_profile(seconds: float, mode: str, user: UserIn, db: AsyncSession) -> PlainTextResponse:
+        """
+        Abstract method to profile the process and return its stacks in the collapsed format.
+
+        Args:
+            seconds (float): The duration of the profile.
+            mode (str): `wall` or `cpu`.
+            user (UserIn): The currently logged-in administrator.
+            db (AsyncSession): The session that authenticated the administrator.
+
+        Returns:
+            PlainTextResponse: The collapsed stacks of the profile.
+        """
+        pass
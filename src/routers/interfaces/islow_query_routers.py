@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+from src.schemas.user_schema import UserIn
+
+
+class ISlowQueryRouters(ABC):
+    """
+    Interface for the routers exposing the slow query log.
+    """
+
+    @abstractmethod
+    def get_slow_queries(limit: int, order_by: str, user: UserIn) -> Dict[str, Any]:
+        """
+        Abstract method to retrieve the SQL statement fingerprints taking the most time.
+
+        Args:
+            limit (int): The number of fingerprints to return.
+            order_by (str): The figure to rank them by.
+            user (UserIn): The currently logged-in administrator.
+
+        Returns:
+            Dict[str, Any]: The durations of the top fingerprints.
+        """
+        pass
+
+    @abstractmethod
+    def reset_slow_queries(user: UserIn) -> None:
+        """
+        Abstract method to forget the SQL statements aggregated so far.
+
+        Args:
+            user (UserIn): The currently logged-in administrator.
+        """
+        pass
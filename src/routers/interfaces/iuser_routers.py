@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Optional
 
 from fastapi import BackgroundTasks, Request
+from fastapi.responses import Response, StreamingResponse
 
 from src.schemas.token_schema import TokenOut
-from src.schemas.user_schema import PasswordReset, UserCreate, UserOut, UserUpdate
+from src.schemas.user_schema import (
+    PasswordReset,
+    UserBatch,
+    UserCreate,
+    UserExportFormat,
+    UserIds,
+    UserImportReport,
+    UserOut,
+    UserPage,
+    UserPartialOut,
+    UserUpdate,
+)
 from src.services.interfaces.i_user_services import IUserService
 
 
@@ -28,29 +40,87 @@ class IUserRouters(ABC):
         pass
 
     @abstractmethod
-    def get_user(self, user_id: int, user_service: IUserService) -> UserOut:
+    def import_users(self, request: Request, user_service: IUserService) -> UserImportReport:
         """
-        Abstract method to retrieve a user by its ID.
+        Abstract method to create users in bulk from a JSON array or a CSV file.
+
+        Args:
+            request (Request): The request, whose body holds the users to create.
+            user_service (IUserService): The UserService instance that will handle the import of the users.
+
+        Returns:
+            UserImportReport: The number of users created and the rows that were not.
+        """
+        pass
+
+    @abstractmethod
+    def export_users(self, export_format: UserExportFormat, user_service: IUserService) -> StreamingResponse:
+        """
+        Abstract method to stream every user in the given format.
+
+        Args:
+            export_format (UserExportFormat): The format of the exported data.
+            user_service (IUserService): The UserService instance that will handle the export of the users.
+
+        Returns:
+            StreamingResponse: A response streaming the users in chunks.
+        """
+        pass
+
+    @abstractmethod
+    def get_user(
+        self,
+        user_id: int,
+        response: Response,
+        fields: Optional[str],
+        if_none_match: Optional[str],
+        user_service: IUserService,
+    ) -> UserPartialOut:
+        """
+        Abstract method to retrieve a user by its ID, or to tell the client that its copy is still current.
 
         Args:
             user_id (int): The ID of the user to be retrieved.
+            response (Response): The response, to set the ETag header on.
+            fields (Optional[str]): The comma-separated attributes to return.
+            if_none_match (Optional[str]): The ETags of the copies the client holds, if any.
             user_service (IUserService): The UserService instance that will handle the retrieval of the user.
 
         Returns:
-            UserOut: The UserOut object representing the user that was retrieved.
+            UserPartialOut: The user that was retrieved, with the requested attributes.
+        """
+        pass
+
+    @abstractmethod
+    def get_users(self, user_ids: UserIds, fields: Optional[str], user_service: IUserService) -> UserBatch:
+        """
+        Abstract method to retrieve several users by their IDs.
+
+        Args:
+            user_ids (UserIds): The IDs of the users to be retrieved.
+            fields (Optional[str]): The comma-separated attributes to return.
+            user_service (IUserService): The UserService instance that will handle the retrieval of the users.
+
+        Returns:
+            UserBatch: The users found, in the order of the IDs, and the IDs without a user.
         """
         pass
 
     @abstractmethod
-    def list_users(self, user_service: IUserService) -> List[UserOut]:
+    def list_users(
+        self, limit: int, cursor: Optional[str], fields: Optional[str], user_service: IUserService
+    ) -> UserPage:
         """
-        Abstract method to retrieve a list of all users.
+        Abstract method to retrieve a page of users.
 
         Args:
+            limit (int): The maximum number of users in the page.
+            cursor (Optional[str]): The opaque cursor returned with the previous page.
+            fields (Optional[str]): The comma-separated attributes to return.
             user_service (IUserService): The UserService instance that will handle the retrieval of the list of users.
 
         Returns:
-            List[UserOut]: A list of UserOut objects representing all users.
+            UserPage: The users in the page and the cursor of the next page.
         """
         pass
 
@@ -0,0 +1,96 @@
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
+
+from src.config.database import pool_metrics, pooled_engines
+from src.middlewares.authentication_middleware import MetricsAuthenticationMiddleware
+from src.schemas.user_schema import UserIn
+from src.utils.cache_utils import principal_cache, shared_user_cache, token_cache, user_cache
+from src.utils.metrics_utils import registry
+from src.utils.single_flight_utils import async_user_lookups
+
+from .interfaces.imetrics_routers import IMetricsRouters
+
+router = APIRouter()
+
+
+class MetricsRouters(IMetricsRouters):
+    """
+    Class containing endpoints exposing internal metrics of the application.
+
+    The endpoints are only mounted when `METRICS_ENABLED` is set, and are restricted to administrators and to the
+    holder of `METRICS_SCRAPE_TOKEN`. The profiler and the slow query log live in `ProfilerRouters` and
+    `SlowQueryRouters`, each mounted on its own setting.
+    """
+
+    @staticmethod
+    @router.get("/cache", status_code=status.HTTP_200_OK)
+    def get_cache_metrics(user: Optional[UserIn] = Depends(MetricsAuthenticationMiddleware())) -> Dict[str, Any]:
+        """
+        Get the usage counters of the in-process caches.
+
+        Args:
+            user (Optional[UserIn]): The currently logged-in administrator, or None for the scrape token.
+
+        Returns:
+            Dict[str, Any]: The hits, misses, hit ratio and size of each cache, keyed by cache name. The shared user
+            cache is only listed when it is configured.
+        """
+        metrics = {
+            "principal_cache": principal_cache.stats(),
+            "token_cache": token_cache.stats(),
+            "user_cache": user_cache.stats(),
+        }
+        if shared_user_cache is not None:
+            metrics["shared_user_cache"] = shared_user_cache.stats()
+        return metrics
+
+    @staticmethod
+    @router.get("/coalescing", status_code=status.HTTP_200_OK)
+    def get_coalescing_metrics(user: Optional[UserIn] = Depends(MetricsAuthenticationMiddleware())) -> Dict[str, Any]:
+        """
+        Get the counters of the user lookups sharing a query with identical concurrent lookups.
+
+        Args:
+            user (Optional[UserIn]): The currently logged-in administrator, or None for the scrape token.
+
+        Returns:
+            Dict[str, Any]: The calls, coalesced calls and calls in flight of the user lookups.
+        """
+        return async_user_lookups.stats()
+
+    @staticmethod
+    @router.get("/prometheus", status_code=status.HTTP_200_OK, response_class=PlainTextResponse)
+    def get_prometheus_metrics(
+        user: Optional[UserIn] = Depends(MetricsAuthenticationMiddleware()),
+    ) -> PlainTextResponse:
+        """
+        Get the HTTP, database and provider metrics in the Prometheus text exposition format.
+
+        The same metrics are served at `/metrics`, where Prometheus scrapes them by default, with `METRICS_SCRAPE_TOKEN`
+        set as its bearer token.
+
+        Args:
+            user (Optional[UserIn]): The currently logged-in administrator, or None for the scrape token.
+
+        Returns:
+            PlainTextResponse: The latency histograms, in-flight gauges and status counters of each route, the SQL
+            statements run per request and the time spent in the password and token providers.
+        """
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+    @staticmethod
+    @router.get("/pool", status_code=status.HTTP_200_OK)
+    def get_pool_metrics(user: Optional[UserIn] = Depends(MetricsAuthenticationMiddleware())) -> Dict[str, Any]:
+        """
+        Get the usage counters of the database connection pools.
+
+        Args:
+            user (Optional[UserIn]): The currently logged-in administrator, or None for the scrape token.
+
+        Returns:
+            Dict[str, Any]: The connections in use, overflow, checkouts, timeouts and checkout wait times of the sync
+            and async pools of the primary, and of each read replica as `sync_replica_<n>` and `async_replica_<n>`.
+        """
+        return {name: pool_metrics[name].snapshot(pooled_engine.pool) for name, pooled_engine in pooled_engines.items()}
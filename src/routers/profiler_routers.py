@@ -0,0 +1,66 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.database import get_async_db
+from src.config.settings import Settings
+from src.middlewares.authentication_middleware import AdministratorAuthenticationMiddleware
+from src.schemas.user_schema import UserIn
+from src.utils.profiler_utils import ProfilerBusyError, check_mode, sampling_profile
+from src.utils.session_utils import release_connection
+
+from .interfaces.iprofiler_routers import IProfilerRouters
+
+router = APIRouter()
+settings = Settings()
+
+
+class ProfilerRouters(IProfilerRouters):
+    """
+    Class containing the endpoint profiling the process.
+
+    The endpoint is only mounted when `PROFILER_ENABLED` is set, whatever `METRICS_ENABLED` is, and is restricted to
+    administrators.
+    """
+
+    @staticmethod
+    @router.get("/profile", status_code=status.HTTP_200_OK, response_class=PlainTextResponse)
+    async def get_process_profile(
+        seconds: float = Query(default=5, gt=0, le=settings.PROFILER_MAX_SECONDS),
+        mode: str = Query(default="wall"),
+        user: UserIn = Depends(AdministratorAuthenticationMiddleware()),
+        db: AsyncSession = Depends(get_async_db),
+    ) -> PlainTextResponse:
+        """
+        Profile the whole process for some seconds, sampling the stacks of every thread. Restricted to administrators.
+
+        The session that authenticated the administrator is the one of the request, as FastAPI resolves a dependency
+        once per request. Its connection is returned to the pool before sampling starts, so a long profile does not
+        keep a connection checked out.
+
+        Args:
+            seconds (float): The duration of the profile, up to `PROFILER_MAX_SECONDS`.
+            mode (str): `wall` to sample every thread, or `cpu` to weigh each sample by the CPU time of its thread.
+            user (UserIn): The currently logged-in administrator.
+            db (AsyncSession): The session that authenticated the administrator.
+
+        Returns:
+            PlainTextResponse: The profile in the collapsed stack format, one `frame;frame;frame weight` line per
+            stack, to render with flamegraph.pl or speedscope.
+
+        Raises:
+            HTTPException: If the mode is not supported (400) or another profile is running (409).
+        """
+        try:
+            check_mode(mode)
+        except ValueError as error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+        await release_connection(db)
+        try:
+            with sampling_profile(mode, settings.PROFILER_INTERVAL_MS / 1000) as profiler:
+                await asyncio.sleep(seconds)
+        except ProfilerBusyError as error:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(error))
+        return PlainTextResponse(profiler.collapsed())
@@ -1,8 +1,11 @@
 """
 A module that defines an APIRouter instance and registers various routes.
 
-This module imports two modules: auth_routers and user_routers from the src.routers package.
-These modules define the authentication and user routes respectively.
+This module imports five modules: auth_routers, metrics_routers, profiler_routers, slow_query_routers and user_routers
+from the src.routers package. These modules define the authentication, internal metrics, profiler, slow query log and
+user routes respectively. The internal metrics routes are only included when `METRICS_ENABLED` is set. The profiler
+and slow query log routes, also served under `/metrics`, are included on their own settings, `PROFILER_ENABLED` and
+`SLOW_QUERY_LOG_ENABLED`.
 
 Attributes:
     router (APIRouter): An instance of the APIRouter class provided by FastAPI.
@@ -22,11 +25,22 @@ Examples:
 """
 from fastapi import APIRouter
 
+from src.config.settings import Settings
 from src.routers import auth_routers as auth
+from src.routers import metrics_routers as metrics
+from src.routers import profiler_routers as profiler
+from src.routers import slow_query_routers as slow_queries
 from src.routers import user_routers as user
 
 router = APIRouter()
+settings = Settings()
 
 
 router.include_router(user.router, prefix="/users", tags=["User"])
 router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
+if settings.METRICS_ENABLED:
+    router.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
+if settings.PROFILER_ENABLED:
+    router.include_router(profiler.router, prefix="/metrics", tags=["Profiler"])
+if settings.SLOW_QUERY_LOG_ENABLED:
+    router.include_router(slow_queries.router, prefix="/metrics", tags=["Slow Queries"])
@@ -0,0 +1,53 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Query, status
+
+from src.middlewares.authentication_middleware import AdministratorAuthenticationMiddleware
+from src.schemas.user_schema import UserIn
+from src.utils.slow_query_utils import ORDERS, slow_query_log
+
+from .interfaces.islow_query_routers import ISlowQueryRouters
+
+router = APIRouter()
+
+
+class SlowQueryRouters(ISlowQueryRouters):
+    """
+    Class containing the endpoints exposing the slow query log.
+
+    The endpoints are only mounted when `SLOW_QUERY_LOG_ENABLED` is set, whatever `METRICS_ENABLED` is, and are
+    restricted to administrators.
+    """
+
+    @staticmethod
+    @router.get("/slow-queries", status_code=status.HTTP_200_OK)
+    def get_slow_queries(
+        limit: int = Query(default=10, ge=1, le=100),
+        order_by: str = Query(default="total", regex=f"^({'|'.join(ORDERS)})$"),
+        user: UserIn = Depends(AdministratorAuthenticationMiddleware()),
+    ) -> Dict[str, Any]:
+        """
+        Get the SQL statement fingerprints taking the most time. Restricted to administrators.
+
+        Args:
+            limit (int): The number of fingerprints to return.
+            order_by (str): The figure to rank them by: `total`, `count`, `p50`, `p99` or `max`.
+            user (UserIn): The currently logged-in administrator.
+
+        Returns:
+            Dict[str, Any]: The slow query threshold, the number of fingerprints tracked and of statements dropped,
+            and the count and total, mean, p50, p99 and maximum durations (in milliseconds) of the top fingerprints.
+        """
+        return {**slow_query_log.stats(), "queries": slow_query_log.top(limit, order_by)}
+
+    @staticmethod
+    @router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+    def reset_slow_queries(user: UserIn = Depends(AdministratorAuthenticationMiddleware())) -> None:
+        """
+        Forget the SQL statements aggregated so far, e.g. to measure the effect of a new index. Restricted to
+        administrators.
+
+        Args:
+            user (UserIn): The currently logged-in administrator.
+        """
+        slow_query_log.reset()
@@ -1,30 +1,88 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Any, Dict, Mapping, Optional, Union
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config.database import get_db
+from src.config.database import get_async_db
+from src.config.settings import Settings
 from src.schemas.token_schema import TokenOut
-from src.schemas.user_schema import PasswordReset, UserCreate, UserOut, UserUpdate
+from src.schemas.user_schema import (
+    PasswordReset,
+    UserBatch,
+    UserCreate,
+    UserExportFormat,
+    UserIds,
+    UserImportReport,
+    UserOut,
+    UserPage,
+    UserPartialOut,
+    UserUpdate,
+)
+from src.services.async_user_service import AsyncUserService
 from src.services.interfaces.i_user_services import IUserService
-from src.services.user_service import UserService
+from src.utils.etag_utils import etag_matches
+from src.utils.json_utils import FastJSONResponse
 
 from .interfaces.iuser_routers import IUserRouters
 
 router = APIRouter()
+settings = Settings()
+
+IMPORT_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {"schema": {"type": "array", "items": UserCreate.schema()}},
+        "text/csv": {
+            "schema": {"type": "string"},
+            "example": "name,email,password\nJohn Doe,john@example.com,secret\n",
+        },
+    },
+}
+
+FIELDS_QUERY = Query(
+    default=None,
+    description="Comma-separated attributes to return, among id, name, email and created_at. Defaults to all of them.",
+    example="id,name",
+)
+
+EXPORT_MEDIA_TYPES = {
+    UserExportFormat.ndjson: "application/x-ndjson",
+    UserExportFormat.csv: "text/csv",
+}
+
+
+def get_async_user_service(db: AsyncSession = Depends(get_async_db)) -> AsyncUserService:
+    """Dependency to get an instance of the AsyncUserService with the async session provided by the get_async_db function.
 
+    Args:
+        db (AsyncSession): The async database session.
+
+    Returns:
+        AsyncUserService: An instance of the AsyncUserService.
+    """
+    return AsyncUserService(db)
 
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
-    """Dependency to get an instance of the UserService with the database session provided by the get_db function.
+
+def render(content: Any, headers: Optional[Mapping[str, str]] = None) -> Union[Any, Response]:
+    """Prepares the content returned by a user read endpoint.
+
+    When `FAST_JSON_RESPONSES` is enabled, the content is rendered right away with orjson: it is built from database
+    rows, so validating it against the response model and converting it with `jsonable_encoder` would only cost time.
+    Otherwise it is returned as is, for FastAPI to validate and serialize.
 
     Args:
-        db (Session): The database session.
+        content (Any): The content of the response.
+        headers (Optional[Mapping[str, str]]): The headers the endpoint set on its `Response` parameter. FastAPI adds
+            them to the responses it renders, but not to a response returned by the endpoint.
 
     Returns:
-        UserService: An instance of the UserService.
+        Union[Any, Response]: The content, or a FastJSONResponse rendering it.
     """
-    return UserService(db)
+    if settings.FAST_JSON_RESPONSES:
+        return FastJSONResponse(content, headers=headers)
+    return content
 
 
 @dataclass
@@ -37,7 +95,7 @@ class UserRouters(IUserRouters):
 
     @staticmethod
     @router.post("/", status_code=status.HTTP_201_CREATED, response_model=UserOut)
-    def create_user(user: UserCreate, user_service: IUserService = Depends(get_user_service)) -> UserOut:
+    async def create_user(user: UserCreate, user_service: IUserService = Depends(get_async_user_service)) -> UserOut:
         """Endpoint to create a new user.
 
         Args:
@@ -47,41 +105,132 @@ class UserRouters(IUserRouters):
         Returns:
             UserOut: The UserOut object representing the user that was created.
         """
-        return user_service.create_user(user)
+        return await user_service.create_user(user)
+
+    @staticmethod
+    @router.post(
+        "/bulk",
+        status_code=status.HTTP_200_OK,
+        response_model=UserImportReport,
+        openapi_extra={"requestBody": IMPORT_REQUEST_BODY},
+    )
+    async def import_users(
+        request: Request, user_service: IUserService = Depends(get_async_user_service)
+    ) -> UserImportReport:
+        """Endpoint to create users in bulk from a JSON array or a CSV file with a `name,email,password` header.
+
+        Args:
+            request (Request): The request, whose body holds the users to create.
+            user_service (IUserService): The UserService instance that will handle the import of the users.
+
+        Returns:
+            UserImportReport: The number of users created and the rows that were not, with the reason.
+        """
+        return await user_service.import_users(await request.body(), request.headers.get("content-type", ""))
+
+    @staticmethod
+    @router.get("/export", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+    async def export_users(
+        export_format: UserExportFormat = Query(default=UserExportFormat.ndjson, alias="format"),
+        user_service: IUserService = Depends(get_async_user_service),
+    ) -> StreamingResponse:
+        """Endpoint to stream every user as NDJSON or CSV.
+
+        Args:
+            export_format (UserExportFormat): The format of the exported data, passed as the `format` query parameter.
+            user_service (IUserService): The UserService instance that will handle the export of the users.
+
+        Returns:
+            StreamingResponse: A response streaming the users in chunks as they are read from the database.
+        """
+        return StreamingResponse(
+            user_service.export_users(export_format),
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="users.{export_format.value}"'},
+        )
 
     @staticmethod
-    @router.get("/{user_id}", status_code=status.HTTP_200_OK, response_model=UserOut)
-    def get_user(user_id: int, user_service: IUserService = Depends(get_user_service)) -> UserOut:
+    @router.post(
+        "/batch-get", status_code=status.HTTP_200_OK, response_model=UserBatch, response_model_exclude_unset=True
+    )
+    async def get_users(
+        user_ids: UserIds,
+        fields: Optional[str] = FIELDS_QUERY,
+        user_service: IUserService = Depends(get_async_user_service),
+    ) -> UserBatch:
+        """Endpoint to retrieve several users by their IDs with a single query.
+
+        Args:
+            user_ids (UserIds): The IDs of the users to be retrieved.
+            fields (Optional[str]): The comma-separated attributes to return, e.g. `id,name`. Defaults to all of them.
+            user_service (IUserService): The UserService instance that will handle the retrieval of the users.
+
+        Returns:
+            UserBatch: The users found, in the order of the IDs, and the IDs without a user.
+        """
+        return render(await user_service.get_users(user_ids.ids, fields))
+
+    @staticmethod
+    @router.get(
+        "/{user_id}", status_code=status.HTTP_200_OK, response_model=UserPartialOut, response_model_exclude_unset=True
+    )
+    async def get_user(
+        user_id: int,
+        response: Response,
+        fields: Optional[str] = FIELDS_QUERY,
+        if_none_match: Optional[str] = Header(default=None),
+        user_service: IUserService = Depends(get_async_user_service),
+    ) -> UserPartialOut:
         """Endpoint to retrieve a user by its ID.
 
+        The response carries a weak ETag. A client sending it back in `If-None-Match` gets a `304 Not Modified`
+        response while the user is unchanged, which only reads the user's modification times from the database.
+
         Args:
             user_id (int): The ID of the user to be retrieved.
+            response (Response): The response, to set the ETag header on.
+            fields (Optional[str]): The comma-separated attributes to return, e.g. `id,name`. Defaults to all of them.
+            if_none_match (Optional[str]): The ETags of the copies the client holds, if any.
             user_service (IUserService): The UserService instance that will handle the retrieval of the user.
 
         Returns:
-            UserOut: The UserOut object representing the user that was retrieved.
+            UserPartialOut: The user that was retrieved, with the requested attributes.
         """
-        return user_service.get_user(user_id)
+        if if_none_match:
+            etag = await user_service.get_user_etag(user_id, fields)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        user, etag = await user_service.get_user_with_etag(user_id, fields)
+        response.headers["ETag"] = etag
+        return render(user, response.headers)
 
     @staticmethod
-    @router.get("/", status_code=status.HTTP_200_OK, response_model=List[UserOut])
-    def list_users(user_service: IUserService = Depends(get_user_service)) -> List[UserOut]:
-        """Endpoint to retrieve all users.
+    @router.get("/", status_code=status.HTTP_200_OK, response_model=UserPage, response_model_exclude_unset=True)
+    async def list_users(
+        limit: int = Query(default=settings.USERS_PAGE_DEFAULT_LIMIT, ge=1, le=settings.USERS_PAGE_MAX_LIMIT),
+        cursor: Optional[str] = None,
+        fields: Optional[str] = FIELDS_QUERY,
+        user_service: IUserService = Depends(get_async_user_service),
+    ) -> UserPage:
+        """Endpoint to retrieve users one page at a time.
 
         Args:
+            limit (int): The maximum number of users in the page.
+            cursor (Optional[str]): The `next_cursor` returned with the previous page, if any.
+            fields (Optional[str]): The comma-separated attributes to return, e.g. `id,name`. Defaults to all of them.
             user_service (IUserService): The UserService instance that will handle the retrieval of the users.
 
         Returns:
-            List[UserOut]: A list of UserOut objects representing all users in the database.
+            UserPage: The users in the page and the cursor of the next page.
         """
-        return user_service.list_users()
+        return render(await user_service.list_users(limit, cursor, fields))
 
     @staticmethod
     @router.patch("/{user_id}", status_code=status.HTTP_200_OK, response_model=UserOut)
-    def update_user(
+    async def update_user(
         user_id: int,
         user_update: UserUpdate,
-        user_service: IUserService = Depends(get_user_service),
+        user_service: IUserService = Depends(get_async_user_service),
     ) -> UserOut:
         """Endpoint to update a user by its ID.
 
@@ -93,11 +242,11 @@ class UserRouters(IUserRouters):
         Returns:
             UserOut: The UserOut object representing the user that was updated.
         """
-        return user_service.update_user(user_id, user_update)
+        return await user_service.update_user(user_id, user_update)
 
     @staticmethod
     @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-    def delete_user(user_id: int, user_service: IUserService = Depends(get_user_service)):
+    async def delete_user(user_id: int, user_service: IUserService = Depends(get_async_user_service)):
         """Deletes a user by its ID.
 
         Args:
@@ -107,7 +256,7 @@ class UserRouters(IUserRouters):
         Returns:
             A dictionary containing a message indicating that the user was deleted successfully.
         """
-        user_service.delete_user(user_id)
+        await user_service.delete_user(user_id)
         return {"detail": "User deleted successfully"}
 
     @staticmethod
@@ -116,7 +265,7 @@ class UserRouters(IUserRouters):
         email: str,
         request: Request,
         background_tasks: BackgroundTasks,
-        user_service: IUserService = Depends(get_user_service),
+        user_service: IUserService = Depends(get_async_user_service),
     ) -> Dict[str, str]:
         """Initiates the password reset process for a user.
 
@@ -134,7 +283,7 @@ class UserRouters(IUserRouters):
     @staticmethod
     @router.post("/password-reset", status_code=status.HTTP_200_OK, response_model=TokenOut)
     async def password_reset(
-        password_reset: PasswordReset, user_service: IUserService = Depends(get_user_service)
+        password_reset: PasswordReset, user_service: IUserService = Depends(get_async_user_service)
     ) -> Dict[str, str]:
         """Resets a user's password.
 
@@ -145,4 +294,4 @@ class UserRouters(IUserRouters):
         Returns:
             A dictionary containing a message indicating that the password was reset successfully.
         """
-        return user_service.reset_password(password_reset)
+        return await user_service.reset_password(password_reset)
@@ -1,5 +1,6 @@
 from datetime import datetime
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 
 from pydantic import BaseModel, EmailStr
 
@@ -77,6 +78,103 @@ class UserOut(UserBase):
         orm_mode = True
 
 
+class UserPartialOut(BaseModel):
+    """
+    Pydantic schema representing the attributes returned for a user when the client selects them with `fields`.
+
+    Only the selected attributes are set, and responses are serialized without the unset ones.
+
+    Attributes:
+        id (Optional[int]): The user's ID
+        name (Optional[str]): The user's name
+        email (Optional[EmailStr]): The user's email address
+        created_at (Optional[datetime]): The date and time when the user was created
+    """
+
+    id: Optional[int]
+    name: Optional[str]
+    email: Optional[EmailStr]
+    created_at: Optional[datetime]
+
+
+class UserPage(BaseModel):
+    """
+    Pydantic schema representing a page of users returned by a keyset paginated listing.
+
+    Attributes:
+        items (List[UserPartialOut]): The users in the current page, with the selected attributes
+        next_cursor (Optional[str]): Opaque cursor pointing to the next page, or None when there are no more users
+    """
+
+    items: List[UserPartialOut]
+    next_cursor: Optional[str]
+
+
+class UserIds(BaseModel):
+    """
+    Pydantic schema representing the IDs of the users to retrieve in one request.
+
+    Attributes:
+        ids (List[int]): The IDs of the users
+    """
+
+    ids: List[int]
+
+
+class UserBatch(BaseModel):
+    """
+    Pydantic schema representing the users retrieved by their IDs.
+
+    Attributes:
+        items (List[UserPartialOut]): The users found, in the order of the requested IDs, with the selected attributes
+        missing_ids (List[int]): The requested IDs for which no user exists
+    """
+
+    items: List[UserPartialOut]
+    missing_ids: List[int]
+
+
+class UserExportFormat(str, Enum):
+    """
+    Formats supported when exporting users.
+
+    Attributes:
+        ndjson: One JSON document per line
+        csv: Comma-separated values with a header row
+    """
+
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+class UserImportFailure(BaseModel):
+    """
+    Pydantic schema representing a row of a bulk import that was not created.
+
+    Attributes:
+        row (int): The position of the row in the import, starting at 1 (the CSV header is not counted)
+        email (Optional[str]): The email of the row, if it has one
+        detail (str): Why the row was not created
+    """
+
+    row: int
+    email: Optional[str]
+    detail: str
+
+
+class UserImportReport(BaseModel):
+    """
+    Pydantic schema representing the outcome of a bulk import of users.
+
+    Attributes:
+        created (int): The number of users created
+        failed (List[UserImportFailure]): The rows that were not created, ordered by row
+    """
+
+    created: int
+    failed: List[UserImportFailure]
+
+
 class PasswordReset(BaseModel):
     """
     Pydantic schema representing the attributes required to reset a user's password.
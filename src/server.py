@@ -6,6 +6,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import RedirectResponse
 
 from src.config.settings import Settings
+from src.middlewares.compression_middleware import CompressionMiddleware
+from src.middlewares.metrics_middleware import MetricsMiddleware
+from src.middlewares.profiling_middleware import ProfilingMiddleware
+from src.middlewares.query_budget_middleware import QueryBudgetMiddleware
+from src.providers.pooled_password_manager_provider import shutdown_password_manager
+from src.routers.metrics_routers import MetricsRouters
 from src.routers.router import router
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -24,6 +30,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+if settings.QUERY_BUDGET_ENABLED:
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        max_queries=settings.QUERY_BUDGET_MAX_QUERIES,
+        max_repeats=settings.QUERY_BUDGET_MAX_REPEATS,
+        raise_on_violation=settings.QUERY_BUDGET_RAISE,
+    )
+
+if settings.PROFILER_ENABLED:
+    app.add_middleware(ProfilingMiddleware, interval=settings.PROFILER_INTERVAL_MS / 1000)
+
+if settings.METRICS_ENABLED:
+    # Added last, so it is the outermost middleware and times the work of the others
+    app.add_middleware(MetricsMiddleware)
+
+
+@app.on_event("shutdown")
+def shutdown():
+    shutdown_password_manager()
+
 
 @app.get("/", tags=["Doc Redirect"])
 def redirect():
@@ -31,3 +65,5 @@ def redirect():
 
 
 app.include_router(router, prefix="/api")
+if settings.METRICS_ENABLED:
+    app.add_api_route("/metrics", MetricsRouters.get_prometheus_metrics, include_in_schema=False)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.providers.interfaces.ipassword_manager import IPasswordManagerProvider
+from src.providers.pooled_password_manager_provider import get_password_manager
+from src.providers.token_manager_provider import TokenManagerProvider
+from src.repositories.async_user_repository import AsyncUserRepository
+from src.repositories.interfaces.iuser_repository import IUserRepository
+from src.schemas.login_schema import LoginData, SuccessLogin
+from src.utils.session_utils import release_connection
+
+from .interfaces.i_auth_services import IAuthService
+
+
+@dataclass
+class AsyncAuthService(IAuthService):
+    """
+    Asynchronous implementation of the IAuthService interface for authentication.
+
+    The user is loaded through an `AsyncUserRepository` and the password is verified with the password manager's async
+    method, so logging in never blocks the event loop.
+
+    Args:
+        db: SQLAlchemy AsyncSession instance
+        password_manager: Password manager instance, defaults to the application's shared password manager
+
+    Attributes:
+        db (AsyncSession): SQLAlchemy AsyncSession instance
+        password_manager (IPasswordManagerProvider): Password manager instance
+        token_manager (TokenManagerProvider): Token manager instance
+    """
+
+    db: AsyncSession
+    password_manager: IPasswordManagerProvider = get_password_manager()
+    token_manager = TokenManagerProvider()
+
+    def __post_init__(self):
+        self._user_repository: IUserRepository = AsyncUserRepository(self.db, self.password_manager)
+
+    async def login_for_access_token(self, login_data: LoginData) -> SuccessLogin:
+        """
+        Verifies user's email and password and returns a SuccessLogin object with an access token.
+
+        When the stored hash was created with a deprecated scheme or a different cost, the password is hashed again with
+        the current policy and persisted, so hashes migrate transparently as users log in.
+
+        Args:
+            login_data (LoginData): User login data including email and password.
+
+        Returns:
+            SuccessLogin: A SuccessLogin object containing user data and access token.
+
+        Raises:
+            HTTPException: If the provided email or password is incorrect.
+        """
+        email = login_data.email
+        password = login_data.password
+        user = await self._user_repository.get_user_by_email(email)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email or password does not match",
+            )
+        await release_connection(self.db)  # return the connection to the pool while the password is verified
+        valid_password = await self.password_manager.hash_verify_async(password, user.password)
+
+        if not valid_password:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email or password does not match",
+            )
+        if self.password_manager.hash_needs_update(user.password):
+            user = await self._user_repository.update_user_password(user, password)
+        access_token = self.token_manager.create_access_token({"sub": user.email})
+        return SuccessLogin(user=user, access_token=access_token)
@@ -0,0 +1,432 @@
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from fastapi import BackgroundTasks, HTTPException, Request, status
+from fastapi.templating import Jinja2Templates
+from fastapi_mail import MessageType
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import Settings
+from src.entities.user_entity import User
+from src.providers.email_provider import EmailProvider
+from src.providers.interfaces.iemail_provider import IEmailProvider
+from src.providers.interfaces.itoken_manager import ITokenManagerProvider
+from src.providers.token_manager_provider import TokenManagerProvider
+from src.repositories.async_user_repository import AsyncUserRepository
+from src.repositories.cached_user_repository import AsyncCachedUserRepository
+from src.repositories.interfaces.iuser_repository import IUserRepository
+from src.schemas.user_schema import (
+    PasswordReset,
+    UserBatch,
+    UserCreate,
+    UserExportFormat,
+    UserImportReport,
+    UserPage,
+    UserPartialOut,
+    UserUpdate,
+)
+from src.utils.fields_utils import parse_fields
+from src.utils.integrity_utils import is_unique_violation
+from src.utils.pagination_utils import decode_cursor, encode_cursor
+from src.utils.user_utils import (
+    CSV_HEADER,
+    IMPORT_MEDIA_TYPES,
+    USER_FIELDS,
+    VERSION_FIELDS,
+    csv_chunk,
+    csv_records,
+    import_conflicts,
+    ndjson_chunk,
+    parse_import_rows,
+    project_user,
+    user_etag,
+    validate_import_rows,
+)
+
+from .interfaces.i_user_services import IUserService
+
+settings = Settings()
+
+
+@dataclass
+class AsyncUserService(IUserService):
+    """
+    This class acts as the middle layer between the data access layer and the user interface layer. It encapsulates the business logic required for interacting with user data and leverages a repository layer to perform database operations. The class provides a comprehensive set of CRUD (Create, Read, Update, Delete) methods to manage user data effectively.
+    Additionally, it includes methods for password reset functionality.
+
+    It is built on an `AsyncSession` and an `AsyncUserRepository`: every database call is awaited on the event loop
+    instead of holding a threadpool thread, so the `async def` endpoints using this service can keep many requests in
+    flight per worker.
+
+    Args:
+        db (AsyncSession): The SQLAlchemy async session object used for database operations.
+        token_manager (ITokenManagerProvider, optional): The token manager provider used for generating and decoding JWT tokens. Defaults to TokenManagerProvider().
+        email_provider (IEmailProvider, optional): The email provider used for sending emails. Defaults to EmailProvider().
+        templates (Jinja2Templates, optional): The Jinja2Templates object used for rendering email templates. Defaults to Jinja2Templates(directory="src/templates").
+
+    Attributes:
+        db (AsyncSession): The SQLAlchemy async session object used for database operations.
+        token_manager (ITokenManagerProvider): The token manager provider used for generating and decoding JWT tokens.
+        email_provider (IEmailProvider): The email provider used for sending emails.
+        templates (Jinja2Templates): The Jinja2Templates object used for rendering email templates.
+    """
+
+    db: AsyncSession
+    token_manager: ITokenManagerProvider = TokenManagerProvider()
+    email_provider: IEmailProvider = EmailProvider()
+    templates: Jinja2Templates = Jinja2Templates(directory="src/templates")
+
+    def __post_init__(self):
+        """
+        Initializes the `_user_repository` instance variable with a new `AsyncUserRepository` bound to `db`, wrapped in
+        an `AsyncCachedUserRepository` when `USER_CACHE_ENABLED` is set.
+        """
+        self._user_repository: IUserRepository = AsyncUserRepository(self.db)
+        if settings.USER_CACHE_ENABLED:
+            self._user_repository = AsyncCachedUserRepository(self._user_repository)
+
+    async def create_user(self, user: UserCreate):
+        """Creates a new user.
+
+        The user is inserted right away and a duplicate email is detected from the violation of the unique constraint
+        on the email, which saves a lookup per signup and also holds when two signups for the same email race.
+
+        Args:
+            user (UserCreate): The user information.
+
+        Raises:
+            HTTPException: If the email is already registered.
+
+        Returns:
+            User: The created user.
+        """
+        try:
+            return await self._user_repository.create_user(user)
+        except IntegrityError as error:
+            if not is_unique_violation(error, User.__table__.c.email):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered",
+            )
+
+    async def get_user(self, user_id: int, fields: Optional[str] = None) -> UserPartialOut:
+        """Gets a user by id.
+
+        Args:
+            user_id (int): The user id.
+            fields (Optional[str]): The comma-separated attributes to return. Defaults to all of them.
+
+        Raises:
+            HTTPException: If the user is not found or a field is unknown.
+
+        Returns:
+            UserPartialOut: The user information, with only the requested attributes set.
+        """
+        selected = self._select_fields(fields)
+        user = await self._user_repository.get_user_by_id(user_id, selected)
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+
+        return project_user(user, selected)
+
+    async def get_user_with_etag(self, user_id: int, fields: Optional[str] = None) -> Tuple[UserPartialOut, str]:
+        """Gets a user by id along with the entity tag of the response.
+
+        Args:
+            user_id (int): The user id.
+            fields (Optional[str]): The comma-separated attributes to return. Defaults to all of them.
+
+        Raises:
+            HTTPException: If the user is not found or a field is unknown.
+
+        Returns:
+            Tuple[UserPartialOut, str]: The user information, with only the requested attributes set, and its ETag.
+        """
+        selected = self._select_fields(fields)
+        user = await self._user_repository.get_user_by_id(user_id, list(dict.fromkeys([*selected, *VERSION_FIELDS])))
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+
+        return project_user(user, selected), user_etag(user_id, user, selected)
+
+    async def get_user_etag(self, user_id: int, fields: Optional[str] = None) -> str:
+        """Gets the entity tag of a user without loading the user.
+
+        Args:
+            user_id (int): The user id.
+            fields (Optional[str]): The comma-separated attributes of the representation. Defaults to all of them.
+
+        Raises:
+            HTTPException: If the user is not found or a field is unknown.
+
+        Returns:
+            str: The weak ETag of the user's representation.
+        """
+        selected = self._select_fields(fields)
+        version = await self._user_repository.get_user_version(user_id)
+
+        if not version:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+
+        return user_etag(user_id, version, selected)
+
+    async def get_users(self, user_ids: List[int], fields: Optional[str] = None) -> UserBatch:
+        """Gets several users by id with a single query.
+
+        Args:
+            user_ids (List[int]): The user ids. Repeated ids are only returned once.
+            fields (Optional[str]): The comma-separated attributes to return. Defaults to all of them.
+
+        Raises:
+            HTTPException: If more than `USERS_BATCH_GET_MAX_IDS` ids are requested or a field is unknown.
+
+        Returns:
+            UserBatch: The users found, in the order of `user_ids`, and the ids without a user.
+        """
+        selected = self._select_fields(fields)
+        user_ids = list(dict.fromkeys(user_ids))
+        if len(user_ids) > settings.USERS_BATCH_GET_MAX_IDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Too many ids, at most {settings.USERS_BATCH_GET_MAX_IDS} users can be retrieved at once",
+            )
+        users = {user.id: user for user in await self._user_repository.get_users_by_ids(user_ids, selected)}
+        return UserBatch.construct(
+            items=[project_user(users[user_id], selected) for user_id in user_ids if user_id in users],
+            missing_ids=[user_id for user_id in user_ids if user_id not in users],
+        )
+
+    async def list_users(
+        self, limit: int = settings.USERS_PAGE_DEFAULT_LIMIT, cursor: Optional[str] = None, fields: Optional[str] = None
+    ) -> UserPage:
+        """Lists users one page at a time using keyset pagination.
+
+        Args:
+            limit (int): The maximum number of users in the page.
+            cursor (Optional[str]): The opaque cursor returned with the previous page, if any.
+            fields (Optional[str]): The comma-separated attributes to return. Defaults to all of them.
+
+        Raises:
+            HTTPException: If the cursor is malformed or a field is unknown.
+
+        Returns:
+            UserPage: The users in the page and the cursor of the next page.
+        """
+        try:
+            after_id = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+
+        selected = self._select_fields(fields)
+        users = await self._user_repository.get_users_page(limit + 1, after_id, selected)
+        next_cursor = encode_cursor(users[limit - 1].id) if len(users) > limit else None
+        items = [project_user(user, selected) for user in users[:limit]]
+        return UserPage.construct(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _select_fields(fields: Optional[str]) -> List[str]:
+        """Parses the attributes a client selected with the `fields` query parameter.
+
+        Args:
+            fields (Optional[str]): The comma-separated attributes, if any.
+
+        Raises:
+            HTTPException: If an attribute is unknown.
+
+        Returns:
+            List[str]: The selected attributes, all of `USER_FIELDS` by default.
+        """
+        try:
+            return parse_fields(fields, USER_FIELDS)
+        except ValueError as error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+    async def export_users(self, export_format: UserExportFormat) -> AsyncIterator[str]:
+        """Exports every user as a stream of text chunks.
+
+        Rows are read from the database in batches of `USERS_EXPORT_BATCH_SIZE` and each batch is encoded into a
+        single chunk, so the first chunk is produced before the whole table has been read.
+
+        Args:
+            export_format (UserExportFormat): The format of the exported data.
+
+        Returns:
+            AsyncIterator[str]: The encoded chunks, one per batch of users.
+        """
+        if export_format == UserExportFormat.csv:
+            yield csv_chunk([CSV_HEADER])
+        async for rows in self._user_repository.stream_users(settings.USERS_EXPORT_BATCH_SIZE):
+            if export_format == UserExportFormat.csv:
+                yield csv_chunk(csv_records(rows))
+            else:
+                yield ndjson_chunk(rows)
+
+    async def import_users(self, content: bytes, content_type: str) -> UserImportReport:
+        """Creates users in bulk from a JSON array or a CSV file.
+
+        Every row is validated on its own and the valid ones are created in batches of `USERS_IMPORT_BATCH_SIZE`: the
+        passwords of a batch are hashed together and the batch is inserted with a single statement. Invalid rows and
+        rows whose email is repeated or already registered are reported instead of failing the import.
+
+        Args:
+            content (bytes): The body of the request.
+            content_type (str): The media type of the body, `application/json` or `text/csv`.
+
+        Raises:
+            HTTPException: If the body cannot be parsed, has too many rows or is of an unsupported media type.
+
+        Returns:
+            UserImportReport: The number of users created and the rows that were not.
+        """
+        users, failed = validate_import_rows(self._parse_import(content, content_type))
+        created = 0
+        for start in range(0, len(users), settings.USERS_IMPORT_BATCH_SIZE):
+            batch = users[start : start + settings.USERS_IMPORT_BATCH_SIZE]
+            emails = set(await self._user_repository.create_users([user for _, user in batch]))
+            created += len(emails)
+            failed.extend(import_conflicts(batch, emails))
+        return UserImportReport(created=created, failed=sorted(failed, key=lambda failure: failure.row))
+
+    @staticmethod
+    def _parse_import(content: bytes, content_type: str) -> List[Any]:
+        """Parses the rows of a bulk import.
+
+        Args:
+            content (bytes): The body of the request.
+            content_type (str): The media type of the body, `application/json` or `text/csv`.
+
+        Raises:
+            HTTPException: If the body cannot be parsed, has too many rows or is of an unsupported media type.
+
+        Returns:
+            List[Any]: The rows, which still have to be validated.
+        """
+        media_type = content_type.split(";")[0].strip().lower()
+        if media_type not in IMPORT_MEDIA_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"Unsupported media type, expected one of: {', '.join(IMPORT_MEDIA_TYPES)}",
+            )
+        try:
+            rows = parse_import_rows(content, media_type)
+        except ValueError as error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+        if len(rows) > settings.USERS_IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Too many rows, at most {settings.USERS_IMPORT_MAX_ROWS} users can be imported at once",
+            )
+        return rows
+
+    async def update_user(self, user_id: int, user_update: UserUpdate):
+        """Updates a user.
+
+        Args:
+            user_id (int): The id of the user to update.
+            user_update (UserUpdate): The updated user data.
+
+        Returns:
+            The updated user.
+
+        Raises:
+            HTTPException: If the user is not found.
+        """
+        user = await self._user_repository.update_user_by_id(user_id, user_update)
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+
+        return user
+
+    async def delete_user(self, user_id: int):
+        """Deletes a user.
+
+        Args:
+            user_id (int): The id of the user to delete.
+
+        Returns:
+            The deleted user.
+
+        Raises:
+            HTTPException: If the user is not found.
+        """
+        if not await self._user_repository.delete_user_by_id(user_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+
+    async def reset_password_request(self, email: str, request: Request, background_tasks: BackgroundTasks) -> dict:
+        """
+        Sends a password reset link to the user's email address.
+
+        Args:
+            email (str): The email address of the user requesting a password reset.
+            request (Request): The incoming request object.
+            background_tasks (BackgroundTasks): The background task manager.
+
+        Returns:
+            dict: A dictionary with a "detail" key indicating the success of the password reset link send operation.
+
+        Raises:
+            HTTPException: If no user is found with the provided email address.
+        """
+        user = await self._user_repository.get_user_by_email(email)
+
+        if not user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+        jwt_token = self.token_manager.generate_jwt_token(user_email=user.email)
+        html = self.templates.TemplateResponse(
+            "password_reset_request.html",
+            {"request": request, "jwt_token": jwt_token, "user_name": user.name},
+        ).body
+        await self.email_provider.send_email(
+            recipients=[user.email],
+            subject="Reset Password",
+            body=html,
+            subtype=MessageType.html,
+            background_tasks=background_tasks,
+        )
+        return {"detail": "Password reset link sent successfully"}
+
+    async def reset_password(self, password_reset: PasswordReset):
+        """
+        Resets a user's password.
+
+        Args:
+            password_reset (PasswordReset): A `PasswordReset` object containing the password reset token and the new password.
+
+        Returns:
+            dict: A dictionary containing an "access_token" key with a JWT token for the user.
+
+        Raises:
+            HTTPException: If no user is found with the email address in the password reset token.
+        """
+        decoded_token = self.token_manager.decode_jwt_token(password_reset.token)
+        user = await self._user_repository.get_user_by_email(decoded_token["email"])
+
+        if not user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+        await self._user_repository.update_user_password(user, password_reset.password)
+        return {"access_token": self.token_manager.generate_jwt_token(user.email)}
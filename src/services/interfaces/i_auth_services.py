@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.schemas.login_schema import LoginData, SuccessLogin
 
@@ -12,16 +12,16 @@ class IAuthService(ABC):
     """Abstract base class for authentication services.
 
     Args:
-        db: SQLAlchemy Session instance
+        db: SQLAlchemy AsyncSession instance
 
     Attributes:
-        db (Session): SQLAlchemy Session instance
+        db (AsyncSession): SQLAlchemy AsyncSession instance
     """
 
-    db: Session
+    db: AsyncSession
 
     @abstractmethod
-    def login_for_access_token(self, login_data: LoginData) -> SuccessLogin:
+    async def login_for_access_token(self, login_data: LoginData) -> SuccessLogin:
         """Validate user login credentials and return an access token.
 
         Args:
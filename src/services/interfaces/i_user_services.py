@@ -1,20 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
 
 from fastapi import BackgroundTasks, Request
 
-from src.schemas.user_schema import UserCreate, UserUpdate
+from src.schemas.user_schema import (
+    PasswordReset,
+    UserBatch,
+    UserCreate,
+    UserExportFormat,
+    UserImportReport,
+    UserPage,
+    UserPartialOut,
+    UserUpdate,
+)
 
 
 class IUserService(ABC):
     """Interface for User Service.
 
-    This interface defines the methods that should be implemented by any User Service class.
+    This interface defines the methods that should be implemented by any User Service class. They are coroutines, so
+    implementations can await the database without blocking the event loop.
 
     """
 
     @abstractmethod
-    def create_user(self, user: UserCreate) -> dict:
+    async def create_user(self, user: UserCreate) -> dict:
         """Create a new user.
 
         Args:
@@ -28,32 +38,112 @@ class IUserService(ABC):
         pass
 
     @abstractmethod
-    def get_user(self, user_id: int) -> dict:
+    async def get_user(self, user_id: int, fields: Optional[str] = None) -> UserPartialOut:
         """Get a user by ID.
 
         Args:
             user_id (int): User ID.
+            fields (Optional[str]): Comma-separated attributes to return.
 
         Returns:
-            dict: User information.
+            UserPartialOut: User information.
+
+        """
+
+        pass
+
+    @abstractmethod
+    async def get_user_with_etag(self, user_id: int, fields: Optional[str] = None) -> Tuple[UserPartialOut, str]:
+        """Get a user by ID along with its entity tag.
+
+        Args:
+            user_id (int): User ID.
+            fields (Optional[str]): Comma-separated attributes to return.
+
+        Returns:
+            Tuple[UserPartialOut, str]: User information and its ETag.
+
+        """
+
+        pass
+
+    @abstractmethod
+    async def get_user_etag(self, user_id: int, fields: Optional[str] = None) -> str:
+        """Get the entity tag of a user without loading the user.
+
+        Args:
+            user_id (int): User ID.
+            fields (Optional[str]): Comma-separated attributes of the representation.
+
+        Returns:
+            str: The ETag of the user.
 
         """
 
         pass
 
     @abstractmethod
-    def list_users(self) -> List[dict]:
-        """List all users.
+    async def get_users(self, user_ids: List[int], fields: Optional[str] = None) -> UserBatch:
+        """Get several users by id.
+
+        Args:
+            user_ids (List[int]): User ids.
+            fields (Optional[str]): Comma-separated attributes to return.
+
+        Returns:
+            UserBatch: Users found, in the order of the ids, and ids without a user.
+
+        """
+
+        pass
+
+    @abstractmethod
+    async def list_users(self, limit: int, cursor: Optional[str] = None, fields: Optional[str] = None) -> UserPage:
+        """List users one page at a time.
+
+        Args:
+            limit (int): Maximum number of users in the page.
+            cursor (Optional[str]): Opaque cursor returned with the previous page.
+            fields (Optional[str]): Comma-separated attributes to return.
+
+        Returns:
+            UserPage: Users in the page and the cursor of the next page.
+
+        """
+
+        pass
+
+    @abstractmethod
+    def export_users(self, export_format: UserExportFormat) -> AsyncIterator[str]:
+        """Export every user as a stream of text chunks.
+
+        Args:
+            export_format (UserExportFormat): Format of the exported data.
+
+        Returns:
+            AsyncIterator[str]: Encoded chunks of users, produced by an async generator.
+
+        """
+
+        pass
+
+    @abstractmethod
+    async def import_users(self, content: bytes, content_type: str) -> UserImportReport:
+        """Create users in bulk from a JSON array or a CSV file.
+
+        Args:
+            content (bytes): Body of the request.
+            content_type (str): Media type of the body.
 
         Returns:
-            List[dict]: List of user information.
+            UserImportReport: Number of users created and rows that were not.
 
         """
 
         pass
 
     @abstractmethod
-    def update_user(self, user_id: int, user_update: UserUpdate) -> dict:
+    async def update_user(self, user_id: int, user_update: UserUpdate) -> dict:
         """Update a user.
 
         Args:
@@ -68,7 +158,7 @@ class IUserService(ABC):
         pass
 
     @abstractmethod
-    def delete_user(self, user_id: int) -> dict:
+    async def delete_user(self, user_id: int) -> dict:
         """Delete a user.
 
         Args:
@@ -98,12 +188,11 @@ class IUserService(ABC):
         pass
 
     @abstractmethod
-    def reset_password(self, token: str, password: str) -> dict:
+    async def reset_password(self, password_reset: PasswordReset) -> dict:
         """Reset a user's password.
 
         Args:
-            token (str): Password reset token.
-            password (str): New password.
+            password_reset (PasswordReset): Password reset token and new password.
 
         Returns:
             dict: Response message.
@@ -0,0 +1,116 @@
+from typing import Optional
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.config.database import Base
+from src.config.replica import READ_REPLICA, ReplicaSet, RoutingSession
+from src.entities.user_entity import User
+from src.repositories.async_user_repository import AsyncUserRepository
+
+
+def create_database(engine, email: str):
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(User).values(name="Seed", email=email, password="hash"))
+    return engine
+
+
+def find_user(session: Session, email: str) -> Optional[User]:
+    return session.scalars(select(User).where(User.email == email), bind_arguments=READ_REPLICA).first()
+
+
+class TestReplicaRouting:
+    """
+    Test suite for routing read-only queries to read replicas.
+    """
+
+    @pytest.fixture
+    def primary(self, tmp_path):
+        engine = create_database(create_engine(f"sqlite:///{tmp_path / 'primary.db'}"), "primary@example.com")
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture
+    def replica(self, tmp_path):
+        engine = create_database(create_engine(f"sqlite:///{tmp_path / 'replica.db'}"), "replica@example.com")
+        yield engine
+        engine.dispose()
+
+    def test_reads_are_served_by_replica(self, primary, replica):
+        """
+        Test that queries marked with `READ_REPLICA` run on the replica.
+
+        Expected Results:
+            The user only present on the replica should be found, and the one only on the primary should not.
+        """
+        with RoutingSession(bind=primary, replicas=ReplicaSet([replica])) as session:
+            assert find_user(session, "replica@example.com") is not None
+            assert find_user(session, "primary@example.com") is None
+
+    def test_writes_and_later_reads_stay_on_primary(self, primary, replica, user_data: dict):
+        """
+        Test that writes go to the primary and that the session reads its own writes afterwards.
+
+        Expected Results:
+            The created user should be refreshed and found again through the primary, and never reach the replica.
+        """
+        with RoutingSession(bind=primary, replicas=ReplicaSet([replica])) as session:
+            user = User(**user_data)
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+
+            assert user.created_at is not None
+            assert find_user(session, user_data["email"]).id == user.id
+            assert find_user(session, "replica@example.com") is None
+
+        with RoutingSession(bind=replica) as session:
+            assert find_user(session, user_data["email"]) is None
+
+    def test_unhealthy_replica_falls_back_to_primary(self, primary, tmp_path):
+        """
+        Test that reads go to the primary when no replica can be reached.
+
+        Expected Results:
+            The replica should be reported as unhealthy and the read served by the primary.
+        """
+        unreachable = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        replicas = ReplicaSet([unreachable], health_check_interval=60)
+
+        with RoutingSession(bind=primary, replicas=replicas) as session:
+            assert find_user(session, "primary@example.com") is not None
+        assert replicas.is_healthy(unreachable) is False
+
+    def test_round_robin(self, primary, replica):
+        """
+        Test that healthy replicas are used in turn.
+
+        Expected Results:
+            Successive choices should alternate between the replicas.
+        """
+        replicas = ReplicaSet([primary, replica])
+
+        assert [replicas.choose() for _ in range(4)] == [primary, replica, primary, replica]
+
+    @pytest.mark.asyncio
+    async def test_async_reads_are_served_by_replica(self, primary, replica, tmp_path):
+        """
+        Test that the async repository reads from the replica through an AsyncSession.
+
+        Expected Results:
+            The user only present on the replica should be found.
+        """
+        async_primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+        async_replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+        try:
+            async with AsyncSession(
+                async_primary, sync_session_class=RoutingSession, replicas=ReplicaSet([async_replica.sync_engine])
+            ) as session:
+                user = await AsyncUserRepository(session).get_user_by_email("replica@example.com")
+                assert user is not None
+        finally:
+            await async_primary.dispose()
+            await async_replica.dispose()
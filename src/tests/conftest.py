@@ -1,18 +1,25 @@
 import os
 import sys
 from contextlib import contextmanager
-from typing import Any, Generator, Union
+from typing import Any, AsyncGenerator, Callable, ContextManager, Generator, Optional, Union
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
+import pytest_asyncio
 from faker import Faker
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
-from src.config.database import Base, get_db
+from src.config.database import Base, get_async_db, get_db
 from src.routers.router import router
+from src.utils.cache_utils import principal_cache, token_cache, user_cache
+from src.utils.pool_metrics_utils import PoolMetrics
+from src.utils.query_budget_utils import QueryBudget
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # this is to include backend dir in sys.path so that we can import from db,main.py
@@ -22,7 +29,14 @@ faker = Faker()
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 # Use connect_args parameter only with sqlite
-SessionTesting = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionTesting = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+# NullPool opens a new connection per session, so no connection outlives the event loop that created it
+AsyncSessionTesting = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession)
+
+QueryCounter = Callable[..., ContextManager[QueryBudget]]
 
 
 def start_application() -> FastAPI:
@@ -52,6 +66,15 @@ def db() -> Generator[Session, Any, None]:
             pass
 
 
+@pytest_asyncio.fixture
+async def async_db(db: Session) -> AsyncGenerator[AsyncSession, Any]:
+    """
+    Create an async session on the test database, whose tables are created by the `db` fixture.
+    """
+    async with AsyncSessionTesting() as session:
+        yield session
+
+
 @pytest.fixture(scope="function")
 def app() -> Generator[FastAPI, Any, None]:
     """
@@ -63,11 +86,9 @@ def app() -> Generator[FastAPI, Any, None]:
     Base.metadata.drop_all(engine)
 
 
-@pytest.fixture(scope="function")
-def client(app: FastAPI, db: SessionTesting) -> Generator[TestClient, Any, None]:
+def override_db_dependencies(app: FastAPI, db: Session) -> None:
     """
-    Create a new FastAPI TestClient that uses the `db` fixture to override
-    the `get_db` dependency that is injected into routes.
+    Make the routes of `app` use the `db` session and async sessions on the test database.
     """
 
     def _get_test_db() -> Union[SessionTesting, None]:
@@ -76,11 +97,68 @@ def client(app: FastAPI, db: SessionTesting) -> Generator[TestClient, Any, None]
         finally:
             pass
 
+    async def _get_test_async_db() -> AsyncGenerator[AsyncSession, Any]:
+        async with AsyncSessionTesting() as session:
+            yield session
+
     app.dependency_overrides[get_db] = _get_test_db
+    app.dependency_overrides[get_async_db] = _get_test_async_db
+
+
+@pytest.fixture(scope="function")
+def client(app: FastAPI, db: SessionTesting) -> Generator[TestClient, Any, None]:
+    """
+    Create a new FastAPI TestClient that uses the `db` fixture to override
+    the `get_db` dependency that is injected into routes, and a session on
+    the same test database to override the `get_async_db` dependency.
+    """
+
+    override_db_dependencies(app, db)
     with TestClient(app) as client:
         yield client
 
 
+@pytest_asyncio.fixture
+async def async_client(app: FastAPI, db: SessionTesting) -> AsyncGenerator[httpx.AsyncClient, Any]:
+    """
+    Create an httpx AsyncClient that calls the application on the test's event loop, with the same
+    dependency overrides as the `client` fixture.
+    """
+    override_db_dependencies(app, db)
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def async_connections() -> Generator[PoolMetrics, Any, None]:
+    """
+    Count the connections checked out from the test async engine while the test runs.
+    """
+    metrics = PoolMetrics()
+    listeners = [("checkout", lambda *_: metrics.record_checkout()), ("checkin", lambda *_: metrics.record_checkin())]
+    for identifier, listener in listeners:
+        event.listen(async_engine.sync_engine, identifier, listener)
+    yield metrics
+    for identifier, listener in listeners:
+        event.remove(async_engine.sync_engine, identifier, listener)
+
+
+@pytest.fixture
+def query_counter() -> QueryCounter:
+    """
+    Count the SQL statements sent to the test database within a block, optionally failing over a budget.
+
+    Usage: `with query_counter(max_queries=1) as queries: client.get(...)`. The block raises `QueryBudgetExceeded` as
+    soon as a statement goes over `max_queries`, or repeats more than `max_repeats` times, and `queries.statements`
+    holds the statements run.
+    """
+
+    def _query_counter(max_queries: Optional[int] = None, max_repeats: Optional[int] = None):
+        return QueryBudget(max_queries, max_repeats, name="The block").watch(engine, async_engine.sync_engine)
+
+    return _query_counter
+
+
 @pytest.fixture(scope="function")
 def user_data():
     """
@@ -93,6 +171,17 @@ def user_data():
     }
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> Generator[None, Any, None]:
+    """
+    Empty the in-process caches so no entry leaks from one test to another.
+    """
+    yield
+    principal_cache.clear()
+    token_cache.clear()
+    user_cache.clear()
+
+
 @pytest.fixture
 def mocker():
     return MagicMock()
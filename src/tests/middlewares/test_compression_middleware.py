@@ -0,0 +1,179 @@
+import asyncio
+import gzip
+import zlib
+from typing import List
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.middlewares.compression_middleware import CompressionMiddleware, parse_accept_encoding
+
+LARGE_BODY = "user@example.com," * 200
+CHUNKS = ["first chunk " * 50, "second chunk " * 50, "third chunk " * 50]
+
+
+@pytest.fixture
+def compressed_app() -> FastAPI:
+    """
+    Create an application wrapped in a CompressionMiddleware compressing responses of 100 bytes or more.
+    """
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(LARGE_BODY)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(LARGE_BODY.encode()), headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter(CHUNKS), media_type="text/plain")
+
+    return app
+
+
+class TestCompressionMiddleware:
+    """
+    Test suite for the CompressionMiddleware class.
+    """
+
+    def test_compresses_large_responses(self, compressed_app: FastAPI):
+        """
+        Test that a large response is gzipped for a client accepting gzip.
+
+        Args:
+            compressed_app (FastAPI): The application under test.
+
+        Expected Results:
+            The response should be gzip encoded, vary on Accept-Encoding and advertise its compressed length.
+        """
+        with TestClient(compressed_app).stream("GET", "/large", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert int(response.headers["Content-Length"]) == len(raw) < len(LARGE_BODY)
+        assert gzip.decompress(raw).decode() == LARGE_BODY
+
+    @pytest.mark.parametrize(
+        "path, accept_encoding",
+        [("/small", "gzip"), ("/large", "identity"), ("/large", "gzip;q=0"), ("/encoded", "gzip")],
+    )
+    def test_skips_responses(self, compressed_app: FastAPI, path: str, accept_encoding: str):
+        """
+        Test the responses that are sent unchanged.
+
+        Args:
+            compressed_app (FastAPI): The application under test.
+            path (str): The path of a small response, or of a response that is already encoded.
+            accept_encoding (str): The Accept-Encoding header of the request.
+
+        Expected Results:
+            Small responses, clients refusing gzip and encoded responses should not be compressed (again). Except for
+            the encoded response, which the middleware leaves alone, they should still vary on Accept-Encoding.
+        """
+        with TestClient(compressed_app).stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+            raw = b"".join(response.iter_raw())
+
+        if path == "/encoded":
+            assert gzip.decompress(raw).decode() == LARGE_BODY
+            assert "Vary" not in response.headers
+        else:
+            assert "Content-Encoding" not in response.headers
+            assert len(raw) == int(response.headers["Content-Length"])
+            assert response.headers["Vary"] == "Accept-Encoding"
+
+    @pytest.mark.asyncio
+    async def test_compresses_streaming_responses_chunk_by_chunk(self, compressed_app: FastAPI):
+        """
+        Test compressing a streaming response.
+
+        Args:
+            compressed_app (FastAPI): The application under test.
+
+        Expected Results:
+            Every chunk should be compressed and flushed as it is produced, so each one can be decoded as soon as it is
+            received, and the response should have no Content-Length.
+        """
+        messages: List[dict] = []
+        request_received = False
+        response_complete = asyncio.Event()
+
+        async def receive():
+            nonlocal request_received
+            if not request_received:
+                request_received = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/stream",
+            "raw_path": b"/stream",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"accept-encoding", b"gzip")],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+        await compressed_app(scope, receive, send)
+
+        headers = dict(messages[0]["headers"])
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        bodies = [message["body"] for message in messages[1:]]
+        for chunk, body in zip(CHUNKS, bodies):
+            assert decompressor.decompress(body).decode() == chunk
+        assert decompressor.decompress(b"".join(bodies[len(CHUNKS) :])) == b""
+        assert decompressor.eof
+
+    def test_prefers_brotli_when_installed(self, compressed_app: FastAPI):
+        """
+        Test that brotli is used when the client accepts it and the brotli package is installed.
+
+        Args:
+            compressed_app (FastAPI): The application under test.
+
+        Expected Results:
+            The response should be brotli encoded.
+        """
+        brotli = pytest.importorskip("brotli")
+        with TestClient(compressed_app).stream("GET", "/large", headers={"Accept-Encoding": "gzip, br"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["Content-Encoding"] == "br"
+        assert brotli.decompress(raw).decode() == LARGE_BODY
+
+    def test_parse_accept_encoding(self):
+        """
+        Test parsing the Accept-Encoding header.
+
+        Expected Results:
+            Each coding should be mapped to its quality value, 1 by default and 0 when malformed.
+        """
+        assert parse_accept_encoding("gzip, br;q=0.5, *;q=0, deflate;q=x") == {
+            "gzip": 1.0,
+            "br": 0.5,
+            "*": 0.0,
+            "deflate": 0.0,
+        }
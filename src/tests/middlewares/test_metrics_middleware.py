@@ -0,0 +1,85 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.middlewares.metrics_middleware import UNMATCHED_ROUTE, MetricsMiddleware
+from src.repositories.user_repository import UserRepository
+from src.schemas.user_schema import UserCreate
+from src.tests.conftest import async_engine, override_db_dependencies
+from src.utils.metrics_utils import (
+    http_request_db_statements,
+    http_request_duration,
+    http_requests,
+    http_requests_in_flight,
+    instrument_queries,
+)
+
+
+@pytest.fixture
+def metered_client(app: FastAPI, db: Session):
+    """
+    Create a TestClient for the application wrapped in a MetricsMiddleware, with the test async engine instrumented.
+    """
+    instrument_queries(async_engine.sync_engine)
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/fail")
+    def fail():
+        raise HTTPException(status_code=418)
+
+    override_db_dependencies(app, db)
+    with TestClient(app) as client:
+        yield client
+
+
+class TestMetricsMiddleware:
+    """
+    Test suite for the MetricsMiddleware class.
+    """
+
+    def test_labels_requests_by_route_template(self, db: Session, metered_client: TestClient, user_data: dict):
+        """
+        Test the metrics recorded for a request to a route with a path parameter.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            metered_client (TestClient): A TestClient for the application under test.
+            user_data (dict): A dictionary containing mock user data.
+
+        Expected Results:
+            The request should be counted under the route template with its status, its duration should be recorded,
+            the single statement loading the user should be counted, and no request should be left in flight.
+        """
+        route = "/api/users/{user_id}"
+        user = UserRepository(db).create_user(UserCreate(**user_data))
+        requests = http_requests.get("GET", route, 200)
+        durations = http_request_duration.get("GET", route)[0]
+        statements = http_request_db_statements.get(route)
+
+        assert metered_client.get(f"/api/users/{user.id}").status_code == 200
+
+        assert http_requests.get("GET", route, 200) == requests + 1
+        assert http_request_duration.get("GET", route)[0] == durations + 1
+        assert http_request_db_statements.get(route) == (statements[0] + 1, statements[1] + 1)
+        assert http_requests_in_flight.get("GET") == 0
+
+    @pytest.mark.parametrize("path, route, status_code", [("/fail", "/fail", 418), ("/missing", UNMATCHED_ROUTE, 404)])
+    def test_counts_error_statuses(self, metered_client: TestClient, path: str, route: str, status_code: int):
+        """
+        Test the status label of requests that fail or match no route.
+
+        Args:
+            metered_client (TestClient): A TestClient for the application under test.
+            path (str): The path requested.
+            route (str): The expected route label.
+            status_code (int): The expected status.
+
+        Expected Results:
+            The request should be counted under its route label with the status of its response.
+        """
+        requests = http_requests.get("GET", route, status_code)
+
+        assert metered_client.get(path).status_code == status_code
+
+        assert http_requests.get("GET", route, status_code) == requests + 1
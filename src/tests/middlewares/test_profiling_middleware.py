@@ -0,0 +1,66 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.entities.administrator_entity import Administrator
+from src.middlewares.profiling_middleware import ProfilingMiddleware
+from src.providers.token_manager_provider import TokenManagerProvider
+from src.repositories.user_repository import UserRepository
+from src.schemas.user_schema import UserCreate
+from src.tests.conftest import AsyncSessionTesting, override_db_dependencies
+
+
+@pytest.fixture
+def profiled_client(app: FastAPI, db: Session):
+    """
+    Create a TestClient for the application wrapped in a ProfilingMiddleware checking administrators on the test
+    database.
+    """
+    app.add_middleware(ProfilingMiddleware, interval=0.001, session_factory=AsyncSessionTesting)
+    override_db_dependencies(app, db)
+    with TestClient(app) as client:
+        yield client
+
+
+class TestProfilingMiddleware:
+    """
+    Test suite for the ProfilingMiddleware class.
+    """
+
+    def test_profiles_requests_of_administrators(self, db: Session, profiled_client: TestClient, user_data: dict):
+        """
+        Test requests sent with and without the X-Profile header.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            profiled_client (TestClient): A TestClient for the application under test.
+            user_data (dict): A dictionary containing mock user data.
+
+        Expected Results:
+            A request without the header should get its usual response. With the header, a user who is not an
+            administrator or a client without a token should also get the usual response, and an administrator should
+            get the collapsed stacks of the profile with the status of the response it replaces.
+        """
+        user = UserRepository(db).create_user(UserCreate(**user_data))
+        token = TokenManagerProvider().create_access_token({"sub": user.email})
+        profile_headers = {"Authorization": f"Bearer {token}", "X-Profile": "wall"}
+
+        response = profiled_client.get(f"/api/users/{user.id}")
+        assert response.status_code == 200
+        assert response.json()["email"] == user.email
+
+        for headers in (profile_headers, {"X-Profile": "wall"}, {**profile_headers, "Authorization": "Bearer bad"}):
+            response = profiled_client.get(f"/api/users/{user.id}", headers=headers)
+            assert response.status_code == 200
+            assert response.json()["email"] == user.email
+
+        db.add(Administrator(user_id=user.id))
+        db.commit()
+        response = profiled_client.get(f"/api/users/{user.id}", headers=profile_headers)
+        assert response.status_code == 200
+        assert response.headers["X-Profile-Status"] == "200"
+        assert response.headers["Content-Type"].startswith("text/plain")
+
+        response = profiled_client.get(f"/api/users/{user.id}", headers={**profile_headers, "X-Profile": "memory"})
+        assert response.status_code == 400
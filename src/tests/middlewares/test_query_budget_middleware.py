@@ -0,0 +1,81 @@
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.config.database import get_async_db
+from src.middlewares.query_budget_middleware import QueryBudgetMiddleware
+from src.repositories.user_repository import UserRepository
+from src.schemas.user_schema import UserCreate
+from src.tests.conftest import async_engine, override_db_dependencies
+from src.utils.query_budget_utils import QueryBudgetExceeded, instrument_query_budget
+
+
+@pytest.fixture
+def budgeted_app(app: FastAPI, db: Session) -> FastAPI:
+    """
+    Instrument the test async engine and return the application, with a route running two statements, on which the
+    tests add a QueryBudgetMiddleware.
+    """
+    instrument_query_budget(async_engine.sync_engine)
+
+    @app.get("/two-statements")
+    async def two_statements(session: AsyncSession = Depends(get_async_db)):
+        await session.execute(text("SELECT 1"))
+        await session.execute(text("SELECT 2"))
+
+    override_db_dependencies(app, db)
+    return app
+
+
+class TestQueryBudgetMiddleware:
+    """
+    Test suite for the QueryBudgetMiddleware class.
+    """
+
+    def test_raises_over_budget(self, db: Session, budgeted_app: FastAPI, user_data: dict):
+        """
+        Test a request going over a budget of no statement, with `raise_on_violation` set.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            budgeted_app (FastAPI): The application under test.
+            user_data (dict): A dictionary containing mock user data.
+
+        Expected Results:
+            The request should fail with QueryBudgetExceeded, naming the request.
+        """
+        user = UserRepository(db).create_user(UserCreate(**user_data))
+        budgeted_app.add_middleware(QueryBudgetMiddleware, max_queries=0, raise_on_violation=True)
+
+        with TestClient(budgeted_app) as client:
+            with pytest.raises(QueryBudgetExceeded, match=f"GET /api/users/{user.id} ran more than 0"):
+                client.get(f"/api/users/{user.id}")
+
+    def test_logs_over_budget(
+        self, db: Session, budgeted_app: FastAPI, user_data: dict, caplog: pytest.LogCaptureFixture
+    ):
+        """
+        Test requests within and over their budget, with violations logged.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            budgeted_app (FastAPI): The application under test.
+            user_data (dict): A dictionary containing mock user data.
+            caplog (pytest.LogCaptureFixture): Captures the log records.
+
+        Expected Results:
+            Both requests should succeed, and only the request running two statements should log a warning.
+        """
+        user = UserRepository(db).create_user(UserCreate(**user_data))
+        budgeted_app.add_middleware(QueryBudgetMiddleware, max_queries=1)
+
+        with TestClient(budgeted_app) as client, caplog.at_level(logging.WARNING):
+            assert client.get(f"/api/users/{user.id}").status_code == 200
+            assert client.get("/two-statements").status_code == 200
+
+        assert [record.getMessage() for record in caplog.records] == ["GET /two-statements ran more than 1 SQL statements"]
@@ -0,0 +1,52 @@
+from passlib.context import CryptContext
+
+from src.config.settings import Settings
+from src.providers.password_manager_provider import PasswordManagerProvider, build_crypt_context
+from src.utils.metrics_utils import provider_call_duration
+
+
+class TestPasswordManagerProvider:
+    """
+    Test suite for the PasswordManagerProvider class.
+    """
+
+    def test_build_crypt_context_from_settings(self):
+        """
+        Test building the CryptContext from the password hashing settings.
+
+        Expected Results:
+            New hashes should use the first configured scheme and cost, and the other schemes should be deprecated.
+        """
+        settings = Settings(PASSWORD_HASH_SCHEMES="bcrypt, md5_crypt", PASSWORD_BCRYPT_ROUNDS=5)
+        context = build_crypt_context(settings)
+
+        assert context.hash("secret").startswith("$2b$05$")
+        assert context.needs_update(CryptContext(schemes=["md5_crypt"]).hash("secret")) is True
+
+    def test_hash_needs_update(self):
+        """
+        Test detecting hashes created with a different cost.
+
+        Expected Results:
+            Only hashes that do not match the configured cost should need an update.
+        """
+        password_manager = PasswordManagerProvider(CryptContext(schemes=["bcrypt"], bcrypt__rounds=5))
+        outdated_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret")
+
+        assert password_manager.hash_needs_update(outdated_hash) is True
+        assert password_manager.hash_needs_update(password_manager.hash_generate("secret")) is False
+
+    def test_hash_generate_many_is_timed_once(self):
+        """
+        Test timing a batch of hashes.
+
+        Expected Results:
+            The batch should be recorded once as `hash_many`, without recording each of its passwords as `hash`.
+        """
+        password_manager = PasswordManagerProvider(CryptContext(schemes=["bcrypt"], bcrypt__rounds=4))
+        hashes, _ = provider_call_duration.get("password", "hash")
+        batches, _ = provider_call_duration.get("password", "hash_many")
+
+        assert len(password_manager.hash_generate_many(["secret", "other secret"])) == 2
+        assert provider_call_duration.get("password", "hash")[0] == hashes
+        assert provider_call_duration.get("password", "hash_many")[0] == batches + 1
@@ -0,0 +1,148 @@
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from src.providers.pooled_password_manager_provider import PooledPasswordManagerProvider
+
+
+@pytest.fixture
+def pooled_password_manager():
+    """
+    Create a pooled password manager with a single worker and a single pending slot.
+    """
+    password_manager = PooledPasswordManagerProvider(
+        CryptContext(schemes=["bcrypt"], bcrypt__rounds=4), max_workers=1, max_pending=1
+    )
+    yield password_manager
+    password_manager.shutdown()
+
+
+class TestPooledPasswordManagerProvider:
+    """
+    Test suite for the PooledPasswordManagerProvider class.
+    """
+
+    def test_hash_generate_and_verify(self, pooled_password_manager: PooledPasswordManagerProvider):
+        """
+        Test hashing and verifying a password in the worker process.
+
+        Args:
+            pooled_password_manager (PooledPasswordManagerProvider): The provider under test.
+
+        Expected Results:
+            The hash should be produced with the configured context and verify only the original password.
+        """
+        hashed = pooled_password_manager.hash_generate("secret")
+        assert hashed.startswith("$2b$04$")
+        assert pooled_password_manager.hash_verify("secret", hashed) is True
+        assert pooled_password_manager.hash_verify("wrong", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_hash_generate_and_verify_async(self, pooled_password_manager: PooledPasswordManagerProvider):
+        """
+        Test hashing and verifying a password from a coroutine.
+
+        Args:
+            pooled_password_manager (PooledPasswordManagerProvider): The provider under test.
+
+        Expected Results:
+            The awaited hash should verify the original password.
+        """
+        hashed = await pooled_password_manager.hash_generate_async("secret")
+        assert await pooled_password_manager.hash_verify_async("secret", hashed) is True
+
+    @pytest.mark.asyncio
+    async def test_hash_generate_many(self, pooled_password_manager: PooledPasswordManagerProvider):
+        """
+        Test hashing a batch of passwords across the worker processes.
+
+        Args:
+            pooled_password_manager (PooledPasswordManagerProvider): The provider under test, with one pending slot.
+
+        Expected Results:
+            A batch larger than the number of pending slots should be accepted, and each hash should verify the
+            password at the same position.
+        """
+        passwords = ["first", "second", "third"]
+
+        hashes = pooled_password_manager.hash_generate_many(passwords)
+        hashes_async = await pooled_password_manager.hash_generate_many_async(passwords)
+
+        for password, hashed, hashed_async in zip(passwords, hashes, hashes_async):
+            assert pooled_password_manager.hash_verify(password, hashed) is True
+            assert pooled_password_manager.hash_verify(password, hashed_async) is True
+
+    @pytest.mark.asyncio
+    async def test_rejects_jobs_when_saturated(self, pooled_password_manager: PooledPasswordManagerProvider):
+        """
+        Test the backpressure applied when the pool is saturated.
+
+        Args:
+            pooled_password_manager (PooledPasswordManagerProvider): The provider under test.
+
+        Expected Results:
+            A job submitted while the only pending slot is taken should be rejected with an HTTP 503, and the pool
+            should accept jobs again once the slot is released.
+        """
+        first_job = asyncio.ensure_future(pooled_password_manager.hash_generate_async("first"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as error:
+            await pooled_password_manager.hash_generate_async("second")
+        assert error.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+        await first_job
+        assert await pooled_password_manager.hash_generate_async("third")
+
+    def test_hash_generate_many_with_fewer_slots_than_workers(self):
+        """
+        Test hashing a batch when `max_pending` is smaller than `max_workers`.
+
+        Expected Results:
+            The batch should be split into no more jobs than there are pending slots, and be hashed instead of being
+            rejected with an HTTP 503.
+        """
+        password_manager = PooledPasswordManagerProvider(
+            CryptContext(schemes=["bcrypt"], bcrypt__rounds=4), max_workers=2, max_pending=1
+        )
+        try:
+            hashes = password_manager.hash_generate_many(["first", "second", "third"])
+            assert password_manager.hash_verify("third", hashes[2]) is True
+        finally:
+            password_manager.shutdown()
+
+    def test_hash_generate_many_cancels_partly_rejected_batches(self, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test a batch whose second job is rejected because another job holds a pending slot.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to replace the pool with one that never starts its jobs.
+
+        Expected Results:
+            The batch should be rejected with an HTTP 503, its first job should be cancelled, and its pending slot
+            released.
+        """
+        password_manager = PooledPasswordManagerProvider(
+            CryptContext(schemes=["bcrypt"], bcrypt__rounds=4), max_workers=2, max_pending=2
+        )
+        submitted = []
+
+        class IdleExecutor:
+            def submit(self, fn, *args) -> Future:
+                submitted.append(Future())
+                return submitted[-1]
+
+        monkeypatch.setattr(password_manager, "_get_executor", IdleExecutor)
+        password_manager._submit(len, "another job")
+
+        with pytest.raises(HTTPException) as error:
+            password_manager.hash_generate_many(["first", "second"])
+        assert error.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+        assert len(submitted) == 2
+        assert submitted[1].cancelled() is True
+        assert password_manager._pending.acquire(blocking=False) is True
+        assert password_manager._pending.acquire(blocking=False) is False
@@ -0,0 +1,88 @@
+import time
+from unittest.mock import patch
+
+from jose import jwt
+
+from src.config.settings import Settings
+from src.providers.token_manager_provider import TokenManagerProvider
+from src.utils.cache_utils import token_cache
+
+
+class TestTokenManagerProvider:
+    """
+    Test suite for the verified token cache of the TokenManagerProvider class.
+    """
+
+    def test_cache_disabled_by_default(self):
+        """
+        Test that tokens are decoded on every verification when the cache is disabled.
+
+        Expected Results:
+            Each verification should decode the token and nothing should be cached.
+        """
+        token_manager = TokenManagerProvider(Settings(TOKEN_CACHE_ENABLED=False))
+        token = token_manager.create_access_token({"sub": "user@example.com"})
+
+        with patch("src.providers.token_manager_provider.jwt.decode", wraps=jwt.decode) as decode:
+            token_manager.verify_access_token(token)
+            token_manager.verify_access_token(token)
+
+        assert decode.call_count == 2
+        assert token_cache.stats()["size"] == 0
+
+    def test_cache_hit_skips_decoding(self):
+        """
+        Test that a verified token is served from the cache.
+
+        Expected Results:
+            The token should be decoded once, and callers should receive copies of the cached claims.
+        """
+        token_manager = TokenManagerProvider(Settings(TOKEN_CACHE_ENABLED=True))
+        token = token_manager.create_access_token({"sub": "user@example.com"})
+
+        with patch("src.providers.token_manager_provider.jwt.decode", wraps=jwt.decode) as decode:
+            claims = token_manager.get_access_token_claims(token)
+            claims["sub"] = "tampered@example.com"
+            assert token_manager.verify_access_token(token) == "user@example.com"
+            assert token_manager.decode_jwt_token(token)["sub"] == "user@example.com"
+
+        assert decode.call_count == 1
+
+    def test_forget_cached_token(self):
+        """
+        Test that forgetting a token drops its cached verification.
+
+        Expected Results:
+            The token should be decoded again, and still be accepted, after it is forgotten.
+        """
+        token_manager = TokenManagerProvider(Settings(TOKEN_CACHE_ENABLED=True))
+        token = token_manager.create_access_token({"sub": "user@example.com"})
+
+        with patch("src.providers.token_manager_provider.jwt.decode", wraps=jwt.decode) as decode:
+            token_manager.verify_access_token(token)
+            token_manager.forget_cached_token(token)
+            assert token_manager.verify_access_token(token) == "user@example.com"
+
+        assert decode.call_count == 2
+
+    def test_cached_claims_follow_expiry(self):
+        """
+        Test that cached claims expire together with the token.
+
+        Expected Results:
+            Once the token's `exp` has passed, the cached entry should be gone and the token decoded again.
+        """
+        token_manager = TokenManagerProvider(Settings(TOKEN_CACHE_ENABLED=True))
+        token = jwt.encode(
+            {"sub": "user@example.com", "exp": int(time.time()) + 60},
+            token_manager.settings.SECRET_KEY,
+            algorithm=token_manager.settings.ALGORITHM,
+        )
+        later = time.monotonic() + 61
+
+        with patch("src.providers.token_manager_provider.jwt.decode", wraps=jwt.decode) as decode:
+            token_manager.verify_access_token(token)
+            with patch("src.utils.cache_utils.time.monotonic", return_value=later):
+                assert token_cache.get(token_manager._token_digest(token)) is None
+
+        assert decode.call_count == 1
@@ -0,0 +1,330 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.replica import RoutingSession
+from src.entities.user_entity import User
+from src.repositories.async_user_repository import AsyncUserRepository
+from src.schemas.user_schema import UserCreate, UserUpdate
+from src.tests.conftest import AsyncSessionTesting, async_engine
+from src.utils.single_flight_utils import async_user_lookups
+
+
+class TestAsyncUserRepository:
+    """
+    Test suite for the AsyncUserRepository class.
+    """
+
+    @pytest.mark.asyncio
+    async def test_create_and_get_user(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test creating a user and retrieving it by id and by email.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - The created user should have a generated ID and a hashed password.
+            - The user should be retrieved by both its ID and its email.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        user = await user_repo.create_user(UserCreate(**user_data))
+
+        assert user.id is not None
+        assert user.password != user_data["password"]
+        assert (await user_repo.get_user_by_id(user.id)).email == user_data["email"]
+        assert (await user_repo.get_user_by_email(user_data["email"])).id == user.id
+
+    @pytest.mark.asyncio
+    async def test_create_users(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test creating a batch of users with a single statement.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - The users whose email is free should be created with a hashed password.
+            - The user whose email is already registered should be skipped without failing the batch.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        await user_repo.create_user(UserCreate(**user_data))
+        users = [
+            UserCreate(name="Jane Doe", email="janedoe@example.com", password="secret"),
+            UserCreate(**user_data),
+            UserCreate(name="Jim Doe", email="jimdoe@example.com", password="secret"),
+        ]
+
+        emails = await user_repo.create_users(users)
+
+        assert sorted(emails) == ["janedoe@example.com", "jimdoe@example.com"]
+        jane = await user_repo.get_user_by_email("janedoe@example.com")
+        assert user_repo.password_manager.hash_verify("secret", jane.password) is True
+        assert len(await user_repo.get_all_users()) == 3
+        assert await user_repo.create_users([]) == []
+
+    @pytest.mark.asyncio
+    async def test_get_user_by_id_loads_only_the_given_fields(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test retrieving a user with only some of its columns.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - The requested columns and the primary key should be loaded.
+            - The other columns, such as the password, should not be read.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        user_id = (await user_repo.create_user(UserCreate(**user_data))).id
+        async_db.expunge_all()
+
+        user = await user_repo.get_user_by_id(user_id, fields=["email"])
+        assert user.email == user_data["email"]
+        assert "password" in inspect(user).unloaded
+        assert "id" not in inspect(user).unloaded
+
+    @pytest.mark.asyncio
+    async def test_get_users_by_ids(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test retrieving several users with a single query.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - Only the users with one of the given ids should be returned.
+            - Unknown ids should be ignored, and no ids should return no users.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        first = await user_repo.create_user(UserCreate(**user_data))
+        second = await user_repo.create_user(UserCreate(name="Jane Doe", email="janedoe@example.com", password="p"))
+        await user_repo.create_user(UserCreate(name="John Roe", email="johnroe@example.com", password="p"))
+        first_id, second_id = first.id, second.id
+
+        users = await user_repo.get_users_by_ids([first_id, second_id, second_id + 100])
+        assert {user.id for user in users} == {first_id, second_id}
+        assert await user_repo.get_users_by_ids([]) == []
+
+    @pytest.mark.asyncio
+    async def test_get_user_version(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test retrieving only the modification times of a user.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - The row should hold the created_at and updated_at columns of the user.
+            - No row should be returned for an unknown id.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        user = await user_repo.create_user(UserCreate(**user_data))
+        user_id, created_at = user.id, user.created_at
+
+        version = await user_repo.get_user_version(user_id)
+        assert version.created_at == created_at
+        assert set(version._fields) == {"updated_at", "created_at"}
+        assert await user_repo.get_user_version(user_id + 1) is None
+
+    @pytest.mark.asyncio
+    async def test_create_user_keeps_pending_changes_uncommitted(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test a signup failing while the session has a pending change.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            The connection should not be released by committing the pending change before the password is hashed, so
+            the change is rolled back with the failed insert instead of being persisted.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        user_id = (await user_repo.create_user(UserCreate(**user_data))).id
+        (await user_repo.get_user_by_id(user_id)).name = "Pending Name"
+
+        with pytest.raises(IntegrityError):
+            await user_repo.create_user(UserCreate(**user_data))
+
+        async with AsyncSessionTesting() as session:
+            assert (await AsyncUserRepository(session).get_user_by_id(user_id)).name == user_data["name"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test looking the same user up concurrently from five sessions.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - A single query should be sent to the database, and the other four lookups counted as coalesced.
+            - Every session should get the user, and only the session that ran the query should hold it.
+        """
+        user = await AsyncUserRepository(async_db).create_user(UserCreate(**user_data))
+        coalesced = async_user_lookups.coalesced
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sessions = [AsyncSessionTesting() for _ in range(5)]
+        event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            users = await asyncio.gather(*(AsyncUserRepository(session).get_user_by_id(user.id) for session in sessions))
+            held = [found in session for found, session in zip(users, sessions)]
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+            for session in sessions:
+                await session.close()
+
+        assert len(statements) == 1
+        assert async_user_lookups.coalesced - coalesced == 4
+        assert [found.email for found in users] == [user_data["email"]] * 5
+        assert held.count(True) == 1
+
+    @pytest.mark.asyncio
+    async def test_read_after_write_skips_lookups_in_flight(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test reading a user back after updating it, while another lookup of the user started before the update.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Result:
+            The session that wrote should run its own query and read its write, instead of joining the lookup in
+            flight, which returns the user as it was before the update.
+        """
+        user_id = (await AsyncUserRepository(async_db).create_user(UserCreate(**user_data))).id
+        release = asyncio.Event()
+
+        async def stale_lookup():
+            await release.wait()
+            return User(id=user_id, name=user_data["name"], email=user_data["email"])
+
+        in_flight = asyncio.create_task(
+            async_user_lookups.do(AsyncUserRepository._lookup_key("id", user_id, None), stale_lookup)
+        )
+        await asyncio.sleep(0)
+        asyncio.get_running_loop().call_later(0.5, release.set)
+        try:
+            async with AsyncSession(async_engine, sync_session_class=RoutingSession, expire_on_commit=False) as session:
+                user_repo = AsyncUserRepository(session)
+                await user_repo.update_user_by_id(user_id, UserUpdate(name="Updated Name", email=user_data["email"]))
+                user = await user_repo.get_user_by_id(user_id)
+        finally:
+            release.set()
+            await in_flight
+
+        assert user.name == "Updated Name"
+
+    @pytest.mark.asyncio
+    async def test_get_users_page(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test retrieving users one page at a time.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - The first page should hold the oldest users ordered by id.
+            - The next page should start after the last id of the previous one.
+            - The page after the last user should be empty.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        first = await user_repo.create_user(UserCreate(**user_data))
+        second = await user_repo.create_user(UserCreate(name="Jane Doe", email="janedoe@example.com", password="p"))
+
+        assert [user.id for user in await user_repo.get_users_page(limit=1)] == [first.id]
+        assert [user.id for user in await user_repo.get_users_page(limit=5, after_id=first.id)] == [second.id]
+        assert await user_repo.get_users_page(limit=5, after_id=second.id) == []
+        assert len(await user_repo.get_all_users()) == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_users(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test streaming all users from the database in batches.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - The rows should be split into batches of at most `batch_size` rows.
+            - Every user should be streamed exactly once, without its password.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        await user_repo.create_user(UserCreate(**user_data))
+        await user_repo.create_user(UserCreate(name="Jane Doe", email="janedoe@example.com", password="p"))
+        await user_repo.create_user(UserCreate(name="John Roe", email="johnroe@example.com", password="p"))
+
+        batches = [batch async for batch in user_repo.stream_users(batch_size=2)]
+        assert [len(batch) for batch in batches] == [2, 1]
+
+        rows = [row for batch in batches for row in batch]
+        assert {row.email for row in rows} == {user_data["email"], "janedoe@example.com", "johnroe@example.com"}
+        assert "password" not in rows[0]._fields
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_user(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test updating and then deleting a user.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - The updated user should keep its ID and have the new name, email and a new hashed password.
+            - The user should no longer be found once deleted.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        user = await user_repo.create_user(UserCreate(**user_data))
+        previous_password = user.password
+
+        updated_user = await user_repo.update_user(
+            user, UserUpdate(name="Jane Doe", email="janedoe@example.com", password="newpassword789")
+        )
+        assert updated_user.id == user.id
+        assert updated_user.email == "janedoe@example.com"
+        assert updated_user.password != previous_password
+
+        await user_repo.delete_user(updated_user)
+        assert await user_repo.get_user_by_id(user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_user_by_id(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test updating and deleting users by id with single statements.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            - Updating an existing user should return it with the new values.
+            - Deleting an existing user should return True, and False once it no longer exists.
+            - Updating a missing user should return None.
+        """
+        user_repo = AsyncUserRepository(async_db)
+        user_id = (await user_repo.create_user(UserCreate(**user_data))).id
+
+        updated_user = await user_repo.update_user_by_id(user_id, UserUpdate(name="Jane Doe", email=user_data["email"]))
+        assert updated_user.name == "Jane Doe"
+        assert updated_user.updated_at is not None
+
+        assert await user_repo.delete_user_by_id(user_id) is True
+        assert await user_repo.delete_user_by_id(user_id) is False
+        assert await user_repo.update_user_by_id(user_id, UserUpdate(**user_data)) is None
@@ -0,0 +1,178 @@
+from datetime import datetime
+from typing import List
+
+import fakeredis
+import pytest
+from fakeredis import aioredis
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.entities.user_entity import User
+from src.repositories.async_user_repository import AsyncUserRepository
+from src.repositories.cached_user_repository import AsyncCachedUserRepository
+from src.schemas.user_schema import UserCreate, UserUpdate
+from src.tests.conftest import AsyncSessionTesting, async_engine
+from src.utils.cache_utils import SharedCache, TTLCache
+
+
+@pytest.fixture
+def statements() -> List[str]:
+    """
+    Record the statements sent to the test database through the async engine while the test runs.
+    """
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+def cached_repository(db: AsyncSession, shared: SharedCache = None) -> AsyncCachedUserRepository:
+    """
+    Create a cached repository with an empty in-process tier, as in a new process.
+    """
+    return AsyncCachedUserRepository(AsyncUserRepository(db), local=TTLCache(maxsize=10, ttl=60), shared=shared)
+
+
+class TestCachedUserRepository:
+    """
+    Test suite for the AsyncCachedUserRepository class.
+    """
+
+    @pytest.mark.asyncio
+    async def test_get_user_reads_through(self, async_db: AsyncSession, user_data: dict, statements: List[str]):
+        """
+        Test retrieving a user by id and by email twice.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+            statements (List[str]): The statements sent to the database.
+
+        Expected Results:
+            Only the first lookup should query the database: it also maps the email to the cached user, so the
+            lookups by email are served from the cache too. A lookup of some fields should only get those fields.
+        """
+        user_repo = cached_repository(async_db)
+        user = await user_repo.create_user(UserCreate(**user_data))
+        statements.clear()
+
+        assert (await user_repo.get_user_by_id(user.id)).email == user_data["email"]
+        projected_user = await user_repo.get_user_by_id(user.id, ["name"])
+        assert (projected_user.id, projected_user.name, projected_user.email) == (user.id, user_data["name"], None)
+        assert (await user_repo.get_user_by_email(user_data["email"])).id == user.id
+        assert (await user_repo.get_user_by_email(user_data["email"])).id == user.id
+
+        assert len(statements) == 1
+        assert user_repo.local.stats()["hits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_the_user(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test that updates and deletions through the repository invalidate the cached user.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            The user should be read again after an update of its name or email, and not be found after its deletion,
+            neither by id nor by its former email.
+        """
+        user_repo = cached_repository(async_db)
+        user_id = (await user_repo.create_user(UserCreate(**user_data))).id
+        await user_repo.get_user_by_email(user_data["email"])
+
+        await user_repo.update_user_by_id(user_id, UserUpdate(name="Updated Name", email="updated@example.com"))
+        assert (await user_repo.get_user_by_id(user_id)).name == "Updated Name"
+        assert await user_repo.get_user_by_email(user_data["email"]) is None
+        assert (await user_repo.get_user_by_email("updated@example.com")).id == user_id
+
+        await user_repo.delete_user_by_id(user_id)
+        assert await user_repo.get_user_by_id(user_id) is None
+        assert await user_repo.get_user_by_email("updated@example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_tier(self, async_db: AsyncSession, user_data: dict, statements: List[str]):
+        """
+        Test that a user cached by one process is served to another one from the shared tier.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+            statements (List[str]): The statements sent to the database.
+
+        Expected Results:
+            A repository with an empty in-process tier should find the user in the shared tier without querying the
+            database, with the same column values but the password, which is never cached, until a write invalidates
+            it.
+        """
+        shared = SharedCache(aioredis.FakeRedis(server=fakeredis.FakeServer()), ttl=60, prefix="test:")
+        user_repo = cached_repository(async_db, shared)
+        user = await user_repo.create_user(UserCreate(**user_data))
+        user_id, created_at = user.id, user.created_at
+        await user_repo.get_user_by_id(user_id)
+        statements.clear()
+
+        async with AsyncSessionTesting() as session:
+            cached_user = await cached_repository(session, shared).get_user_by_email(user_data["email"])
+        assert statements == []
+        assert (cached_user.id, cached_user.created_at) == (user_id, created_at)
+        assert cached_user.password is None
+        cached_documents = [await shared.client.get(key) for key in await shared.client.keys("test:users:id:*")]
+        assert cached_documents and all(b"password" not in document for document in cached_documents)
+
+        await user_repo.delete_user_by_id(user_id)
+        async with AsyncSessionTesting() as session:
+            assert await cached_repository(session, shared).get_user_by_id(user_id) is None
+        assert shared.stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_outage(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test looking a user up while the server of the shared tier cannot be reached.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            The user should be read from the database, and the failed commands counted as errors.
+        """
+        server = fakeredis.FakeServer()
+        server.connected = False
+        shared = SharedCache(aioredis.FakeRedis(server=server), ttl=60)
+        user_repo = cached_repository(async_db, shared)
+        user_id = (await user_repo.create_user(UserCreate(**user_data))).id
+
+        assert (await user_repo.get_user_by_id(user_id)).email == user_data["email"]
+        assert shared.stats()["errors"] == 3
+
+    @pytest.mark.asyncio
+    async def test_password_and_version(self, async_db: AsyncSession, user_data: dict):
+        """
+        Test reading the password and the modification times of a cached user.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+            user_data (dict): Dictionary containing user data.
+
+        Expected Results:
+            The password should only be read from the database, and the modification times should be those of the
+            cached user, even after the row was updated behind the cache's back.
+        """
+        user_repo = cached_repository(async_db)
+        user = await user_repo.create_user(UserCreate(**user_data))
+        user_id, password = user.id, user.password
+        await user_repo.get_user_by_id(user_id)
+        cached_user = await user_repo.get_user_by_id(user_id)
+        assert cached_user.password is None
+        assert (await user_repo.get_user_by_id(user_id, ["password"])).password == password
+
+        await async_db.execute(update(User).where(User.id == user_id).values(updated_at=datetime(2030, 1, 1)))
+        await async_db.commit()
+        version = await user_repo.get_user_version(user_id)
+        assert (version.created_at, version.updated_at) == (cached_user.created_at, cached_user.updated_at)
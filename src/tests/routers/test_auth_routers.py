@@ -7,8 +7,10 @@ from sqlalchemy.orm import Session
 
 from src.providers.password_manager_provider import PasswordManagerProvider
 from src.providers.token_manager_provider import TokenManagerProvider
+from src.repositories.async_user_repository import AsyncUserRepository
 from src.repositories.user_repository import UserRepository
-from src.schemas.user_schema import UserCreate
+from src.schemas.user_schema import UserCreate, UserUpdate
+from src.utils.pool_metrics_utils import PoolMetrics
 
 
 class TestAuthController:
@@ -46,6 +48,38 @@ class TestAuthController:
         assert response.status_code == status.HTTP_200_OK
         assert response.headers["Content-Type"] == "application/json"
 
+    def test_login_holds_no_connection_while_verifying_password(
+        self, db: Session, client: TestClient, user_data: dict, async_connections: PoolMetrics
+    ):
+        """
+        Test that logging in returns its database connection to the pool before verifying the password.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            client (TestClient): A TestClient instance from FastAPI.
+            user_data (dict): A dictionary containing mock user data.
+            async_connections (PoolMetrics): Counters of the connections checked out from the test async engine.
+
+        Expected Results:
+            The login should succeed, and no connection should be checked out while the password is verified.
+        """
+        UserRepository(db).create_user(UserCreate(**user_data))
+        checked_out_while_hashing = []
+        hash_verify_async = PasswordManagerProvider.hash_verify_async
+
+        async def verify(password_manager, text, hash):
+            checked_out_while_hashing.append(async_connections.checked_out)
+            return await hash_verify_async(password_manager, text, hash)
+
+        with patch.object(PasswordManagerProvider, "hash_verify_async", verify):
+            response = client.post(
+                "/api/auth/token", json={"email": user_data["email"], "password": user_data["password"]}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert async_connections.checkouts >= 1
+        assert checked_out_while_hashing == [0]
+
     def test_login_for_access_token_failure(
         self,
         db: Session,
@@ -102,6 +136,66 @@ class TestAuthController:
         assert response.status_code == status.HTTP_200_OK
         assert response.headers["Content-Type"] == "application/json"
 
+    def test_get_profile_uses_principal_cache(
+        self, db: Session, client: TestClient, user_data: dict, async_connections: PoolMetrics
+    ):
+        """
+        Test that authenticated users are served from the principal cache until they are updated.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            client (TestClient): A TestClient instance from FastAPI.
+            user_data (dict): A dictionary containing mock user data.
+            async_connections (PoolMetrics): Counters of the connections checked out from the test async engine.
+
+        Expected Results:
+            The second request should not query the database, neither request should check out a connection, and an update of the user should invalidate the
+            cached entry so the next request returns the new name.
+        """
+        user_repository = UserRepository(db)
+        user = user_repository.create_user(UserCreate(**user_data))
+        access_token = TokenManagerProvider().create_access_token({"sub": user_data["email"]})
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        with patch.object(AsyncUserRepository, "get_user_by_email", autospec=True) as lookup:
+            lookup.return_value = user
+            assert client.get("/api/auth/profile", headers=headers).status_code == status.HTTP_200_OK
+            assert client.get("/api/auth/profile", headers=headers).status_code == status.HTTP_200_OK
+            assert lookup.call_count == 1
+        assert async_connections.checkouts == 0
+
+        user_repository.update_user(user, UserUpdate(name="Updated Name", email=user_data["email"]))
+        response = client.get("/api/auth/profile", headers=headers)
+        assert response.json()["name"] == "Updated Name"
+
+    def test_get_profile_not_modified(self, db: Session, client: TestClient, user_data: dict):
+        """
+        Test revalidating a profile with the ETag of a previous response.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            client (TestClient): A TestClient instance from FastAPI.
+            user_data (dict): A dictionary containing mock user data.
+
+        Expected Results:
+            The revalidation should return a 304 response without a body until the user is updated, after which the
+            full profile should be returned with a new ETag.
+        """
+        user_repository = UserRepository(db)
+        user = user_repository.create_user(UserCreate(**user_data))
+        access_token = TokenManagerProvider().create_access_token({"sub": user_data["email"]})
+        headers = {"Authorization": f"Bearer {access_token}"}
+        etag = client.get("/api/auth/profile", headers=headers).headers["ETag"]
+
+        response = client.get("/api/auth/profile", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+        user_repository.update_user(user, UserUpdate(name="Updated Name", email=user_data["email"]))
+        response = client.get("/api/auth/profile", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
     def test_get_profile_failure(
         self,
         db: Session,
@@ -0,0 +1,199 @@
+import importlib
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.entities.administrator_entity import Administrator
+from src.providers.token_manager_provider import TokenManagerProvider
+from src.repositories.user_repository import UserRepository
+from src.middlewares import authentication_middleware
+from src.routers import metrics_routers
+from src.routers import router as router_module
+from src.schemas.user_schema import UserCreate
+from src.services.async_user_service import settings
+from src.utils.pool_metrics_utils import InstrumentedQueuePool, instrument_engine
+
+
+def administrator_headers(db: Session, user_data: dict) -> dict:
+    """
+    Create an administrator and build the headers authenticating as them.
+    """
+    user = UserRepository(db).create_user(UserCreate(**user_data))
+    db.add(Administrator(user_id=user.id))
+    db.commit()
+    return {"Authorization": f"Bearer {TokenManagerProvider().create_access_token({'sub': user.email})}"}
+
+
+class TestMetricsRouters:
+    """
+    Test suite for the MetricsRouters class.
+    """
+
+    def test_get_cache_metrics(
+        self, db: Session, client: TestClient, user_data: dict, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Test retrieving the usage counters of the caches.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            client (TestClient): A TestClient instance from FastAPI.
+            user_data (dict): A dictionary containing mock user data.
+            monkeypatch (pytest.MonkeyPatch): Used to enable `USER_CACHE_ENABLED`.
+
+        Expected Results:
+            The response should contain the counters of the principal cache and of the user cache, which should count
+            one miss and one hit after a user is retrieved twice with the user cache enabled.
+        """
+        monkeypatch.setattr(settings, "USER_CACHE_ENABLED", True)
+        headers = administrator_headers(db, user_data)
+        user = UserRepository(db).create_user(UserCreate(name="Jane Doe", email="janedoe@example.com", password="p"))
+        client.get(f"/api/users/{user.id}")
+        client.get(f"/api/users/{user.id}")
+
+        response = client.get("/api/metrics/cache", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert {"hits", "misses", "hit_ratio", "size", "maxsize"} <= set(response.json()["principal_cache"])
+        assert response.json()["user_cache"]["hits"] == 1
+        assert response.json()["user_cache"]["hit_ratio"] == 0.5
+
+    def test_get_pool_metrics(
+        self, db: Session, client: TestClient, user_data: dict, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Test retrieving the usage counters of the database connection pools.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            client (TestClient): A TestClient instance from FastAPI.
+            user_data (dict): A dictionary containing mock user data.
+            monkeypatch (pytest.MonkeyPatch): Used to register a read replica.
+
+        Expected Results:
+            The response should contain the counters of the sync and async pools, and of the read replica.
+        """
+        headers = administrator_headers(db, user_data)
+        replica = create_engine("sqlite://", poolclass=InstrumentedQueuePool)
+        monkeypatch.setitem(metrics_routers.pooled_engines, "sync_replica_0", replica)
+        monkeypatch.setitem(metrics_routers.pool_metrics, "sync_replica_0", instrument_engine(replica))
+        with replica.connect():
+            response = client.get("/api/metrics/pool", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        for pool in ("sync", "async", "sync_replica_0"):
+            assert {"checked_out", "overflow", "timeouts", "wait_seconds_max"} <= set(response.json()[pool])
+        assert response.json()["sync_replica_0"]["checked_out"] == 1
+
+    def test_get_coalescing_metrics(self, db: Session, client: TestClient, user_data: dict):
+        """
+        Test retrieving the counters of the coalesced user lookups.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            client (TestClient): A TestClient instance from FastAPI.
+            user_data (dict): A dictionary containing mock user data.
+
+        Expected Results:
+            The response should contain the counters of the async user lookups, which serve every request.
+        """
+        response = client.get("/api/metrics/coalescing", headers=administrator_headers(db, user_data))
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.json()) == {"calls", "coalesced", "in_flight"}
+
+    def test_get_prometheus_metrics(self, client: TestClient, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test retrieving the metrics in the Prometheus text exposition format with the scrape token.
+
+        Args:
+            client (TestClient): A TestClient instance from FastAPI.
+            monkeypatch (pytest.MonkeyPatch): Used to set `METRICS_SCRAPE_TOKEN`.
+
+        Expected Results:
+            The response should be plain text in the version 0.0.4 format and describe the HTTP request metrics.
+        """
+        monkeypatch.setattr(authentication_middleware.settings, "METRICS_SCRAPE_TOKEN", "scrape-token")
+        response = client.get("/api/metrics/prometheus", headers={"Authorization": "Bearer scrape-token"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE http_requests_total counter" in response.text
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+
+    @pytest.mark.parametrize("path", ["cache", "coalescing", "pool", "prometheus"])
+    def test_metrics_require_authorization(
+        self, db: Session, client: TestClient, user_data: dict, path: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Test retrieving the metrics without being an administrator or holding the scrape token.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            client (TestClient): A TestClient instance from FastAPI.
+            user_data (dict): A dictionary containing mock user data.
+            path (str): The path of the metrics endpoint.
+            monkeypatch (pytest.MonkeyPatch): Used to set `METRICS_SCRAPE_TOKEN`.
+
+        Expected Results:
+            A request without a token or with a wrong one should be denied with a 401, and a user who is not an
+            administrator with a 403.
+        """
+        monkeypatch.setattr(authentication_middleware.settings, "METRICS_SCRAPE_TOKEN", "scrape-token")
+        user = UserRepository(db).create_user(UserCreate(**user_data))
+        token = TokenManagerProvider().create_access_token({"sub": user.email})
+
+        assert client.get(f"/api/metrics/{path}").status_code == status.HTTP_401_UNAUTHORIZED
+        response = client.get(f"/api/metrics/{path}", headers={"Authorization": "Bearer wrong-token"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = client.get(f"/api/metrics/{path}", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_metrics_not_mounted_when_disabled(self, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test building the API router with `METRICS_ENABLED` unset.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to unset `METRICS_ENABLED`, `PROFILER_ENABLED` and
+                `SLOW_QUERY_LOG_ENABLED`.
+
+        Expected Results:
+            No route under `/metrics` should be mounted.
+        """
+        monkeypatch.setenv("METRICS_ENABLED", "false")
+        monkeypatch.setenv("PROFILER_ENABLED", "false")
+        monkeypatch.setenv("SLOW_QUERY_LOG_ENABLED", "false")
+        try:
+            paths = [route.path for route in importlib.reload(router_module).router.routes]
+        finally:
+            monkeypatch.undo()
+            importlib.reload(router_module)
+
+        assert "/users/" in paths
+        assert not any(path.startswith("/metrics") for path in paths)
+
+    @pytest.mark.parametrize(
+        "setting, path", [("PROFILER_ENABLED", "/metrics/profile"), ("SLOW_QUERY_LOG_ENABLED", "/metrics/slow-queries")]
+    )
+    def test_diagnostics_mounted_without_metrics(self, setting: str, path: str, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test building the API router with `METRICS_ENABLED` unset and the setting of one diagnostics route set.
+
+        Args:
+            setting (str): The setting mounting the route.
+            path (str): The path of the route.
+            monkeypatch (pytest.MonkeyPatch): Used to set the settings.
+
+        Expected Results:
+            The route should be mounted on its own, without the metrics routes.
+        """
+        monkeypatch.setenv("METRICS_ENABLED", "false")
+        monkeypatch.setenv(setting, "true")
+        try:
+            paths = [route.path for route in importlib.reload(router_module).router.routes]
+        finally:
+            monkeypatch.undo()
+            importlib.reload(router_module)
+
+        assert path in paths
+        assert "/metrics/cache" not in paths
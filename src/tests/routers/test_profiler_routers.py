@@ -0,0 +1,82 @@
+from contextlib import contextmanager
+from typing import List
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.entities.administrator_entity import Administrator
+from src.providers.token_manager_provider import TokenManagerProvider
+from src.repositories.user_repository import UserRepository
+from src.routers import profiler_routers
+from src.schemas.user_schema import UserCreate
+from src.tests.conftest import override_db_dependencies
+from src.utils.pool_metrics_utils import PoolMetrics
+from src.utils.profiler_utils import sampling_profile
+
+
+@pytest.fixture
+def profiler_client(app: FastAPI, db: Session):
+    """
+    Create a TestClient for the application with the profiler route mounted, as when `PROFILER_ENABLED` is set.
+    """
+    app.include_router(profiler_routers.router, prefix="/api/metrics")
+    override_db_dependencies(app, db)
+    with TestClient(app) as client:
+        yield client
+
+
+class TestProfilerRouters:
+    """
+    Test suite for the ProfilerRouters class.
+    """
+
+    def test_get_process_profile(
+        self,
+        db: Session,
+        profiler_client: TestClient,
+        user_data: dict,
+        async_connections: PoolMetrics,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """
+        Test profiling the process.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            profiler_client (TestClient): A TestClient for the application with the profiler route.
+            user_data (dict): A dictionary containing mock user data.
+            async_connections (PoolMetrics): Counters of the connections checked out from the test async engine.
+            monkeypatch (pytest.MonkeyPatch): Used to record the connections checked out when sampling starts.
+
+        Expected Results:
+            A user who is not an administrator should be denied with a 403, and an unknown mode refused with a 400.
+            An administrator should get the collapsed stacks of every thread of the process, including the one waiting
+            for the response, and no connection should stay checked out while the process is sampled.
+        """
+        checked_out_while_sampling: List[int] = []
+
+        @contextmanager
+        def recording_profile(*args):
+            checked_out_while_sampling.append(async_connections.checked_out)
+            with sampling_profile(*args) as profiler:
+                yield profiler
+
+        monkeypatch.setattr(profiler_routers, "sampling_profile", recording_profile)
+        user = UserRepository(db).create_user(UserCreate(**user_data))
+        headers = {"Authorization": f"Bearer {TokenManagerProvider().create_access_token({'sub': user.email})}"}
+
+        response = profiler_client.get("/api/metrics/profile", params={"seconds": 0.05}, headers=headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        db.add(Administrator(user_id=user.id))
+        db.commit()
+        response = profiler_client.get("/api/metrics/profile", params={"mode": "memory"}, headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = profiler_client.get("/api/metrics/profile", params={"seconds": 0.05}, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["Content-Type"].startswith("text/plain")
+        assert "test_profiler_routers:TestProfilerRouters.test_get_process_profile;" in response.text
+        assert checked_out_while_sampling == [0]
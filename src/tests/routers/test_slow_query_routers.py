@@ -0,0 +1,47 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.entities.administrator_entity import Administrator
+from src.providers.token_manager_provider import TokenManagerProvider
+from src.repositories.user_repository import UserRepository
+from src.schemas.user_schema import UserCreate
+from src.tests.conftest import async_engine
+from src.utils.slow_query_utils import instrument_slow_queries, slow_query_log
+
+
+class TestSlowQueryRouters:
+    """
+    Test suite for the SlowQueryRouters class.
+    """
+
+    def test_get_slow_queries(self, db: Session, client: TestClient, user_data: dict):
+        """
+        Test retrieving and resetting the slowest SQL statement fingerprints.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            client (TestClient): A TestClient instance from FastAPI.
+            user_data (dict): A dictionary containing mock user data.
+
+        Expected Results:
+            A user who is not an administrator should be denied with a 403. An administrator should get the
+            fingerprint of the statement loading a user, and after a reset, no fingerprint.
+        """
+        instrument_slow_queries(async_engine.sync_engine)
+        user = UserRepository(db).create_user(UserCreate(**user_data))
+        headers = {"Authorization": f"Bearer {TokenManagerProvider().create_access_token({'sub': user.email})}"}
+
+        response = client.get("/api/metrics/slow-queries", headers=headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        db.add(Administrator(user_id=user.id))
+        db.commit()
+        client.get(f"/api/users/{user.id}")
+        response = client.get("/api/metrics/slow-queries", params={"limit": 100, "order_by": "count"}, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert {"threshold_ms", "fingerprints", "dropped"} <= set(response.json())
+        assert any("FROM users WHERE users.id = ?" in query["fingerprint"] for query in response.json()["queries"])
+
+        assert client.delete("/api/metrics/slow-queries", headers=headers).status_code == status.HTTP_204_NO_CONTENT
+        assert slow_query_log.stats()["fingerprints"] == 0
@@ -1,7 +1,10 @@
 import asyncio
+import json
+import threading
 from dataclasses import dataclass
 from typing import List
 
+import httpx
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
@@ -9,7 +12,10 @@ from sqlalchemy.orm import Session
 
 from src.providers.token_manager_provider import TokenManagerProvider
 from src.repositories.user_repository import UserRepository
-from src.schemas.user_schema import UserCreate
+from src.routers import user_routers
+from src.schemas.user_schema import UserCreate, UserUpdate
+from src.services.async_user_service import settings
+from src.tests.conftest import QueryCounter
 
 
 class TestUserRouters:
@@ -70,6 +76,90 @@ class TestUserRouters:
         response = client.post("/api/users/", json=user_data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_import_users_json(self, user_data: UserCreate, db: Session, client: TestClient):
+        """Test importing users in bulk from a JSON array.
+
+        Args:
+            user_data (UserCreate): A Pydantic model representing a user that is already registered.
+            db (Session): A SQLAlchemy session object.
+            client (TestClient): A FastAPI test client instance.
+
+        Steps:
+            1. Create a user in the database with the given user_data.
+            2. Send a POST request to /api/users/bulk with a new user, an invalid row, a repeated email and the
+               already registered user.
+            3. Assert the report of the import.
+
+        Expected Result:
+            Only the new user should be created, and every other row should be reported without failing the import.
+        """
+        UserRepository(db).create_user(UserCreate(**user_data))
+        rows = [
+            {"name": "Jane Doe", "email": "janedoe@example.com", "password": "secret"},
+            {"name": "No Email", "password": "secret"},
+            {"name": "Jane Again", "email": "janedoe@example.com", "password": "secret"},
+            user_data,
+        ]
+
+        response = client.post("/api/users/bulk", json=rows)
+
+        assert response.status_code == status.HTTP_200_OK
+        report = response.json()
+        assert report["created"] == 1
+        assert [(failure["row"], failure["email"]) for failure in report["failed"]] == [
+            (2, None),
+            (3, "janedoe@example.com"),
+            (4, user_data["email"]),
+        ]
+        assert report["failed"][0]["detail"] == "email: field required"
+        assert report["failed"][1]["detail"] == "Duplicate email in import"
+        assert report["failed"][2]["detail"] == "Email already registered"
+        login = client.post("/api/auth/token", json={"email": "janedoe@example.com", "password": "secret"})
+        assert login.status_code == status.HTTP_200_OK
+
+    def test_import_users_csv(self, db: Session, client: TestClient, monkeypatch: pytest.MonkeyPatch):
+        """Test importing users in bulk from a CSV file, in several batches.
+
+        Args:
+            db (Session): A SQLAlchemy session object.
+            client (TestClient): A FastAPI test client instance.
+            monkeypatch (pytest.MonkeyPatch): Used to import the users in batches of two.
+
+        Expected Result:
+            Every user of the file should be created.
+        """
+        monkeypatch.setattr(settings, "USERS_IMPORT_BATCH_SIZE", 2)
+        content = "name,email,password\n" + "".join(f"User {i},user{i}@example.com,secret\n" for i in range(5))
+
+        response = client.post("/api/users/bulk", content=content, headers={"Content-Type": "text/csv; charset=utf-8"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"created": 5, "failed": []}
+        assert len(UserRepository(db).get_all_users()) == 5
+
+    @pytest.mark.parametrize(
+        "content, content_type, status_code",
+        [
+            ('{"name": "John"}', "application/json", status.HTTP_400_BAD_REQUEST),
+            ("not json", "application/json", status.HTTP_400_BAD_REQUEST),
+            ("name,email,password\n", "text/plain", status.HTTP_415_UNSUPPORTED_MEDIA_TYPE),
+        ],
+    )
+    def test_import_users_invalid_body(self, content: str, content_type: str, status_code: int, client: TestClient):
+        """Test importing users from a body that is not a JSON array or a CSV file.
+
+        Args:
+            content (str): The body of the request.
+            content_type (str): The media type of the body.
+            status_code (int): The expected status code.
+            client (TestClient): A FastAPI test client instance.
+
+        Expected Result:
+            The import should be rejected as a whole.
+        """
+        response = client.post("/api/users/bulk", content=content, headers={"Content-Type": content_type})
+        assert response.status_code == status_code
+
     def test_get_user(self, db: Session, user_data: UserCreate, client: TestClient):
         """Test creating a new user with an email address that already exists in the database.
 
@@ -99,6 +189,120 @@ class TestUserRouters:
         assert user["name"] == user_data["name"]
         assert user["id"] == created_user.id
 
+    def test_get_user_fields(
+        self, db: Session, user_data: UserCreate, client: TestClient, query_counter: QueryCounter
+    ):
+        """Test retrieving only some attributes of users with the `fields` query parameter.
+
+        Args:
+            db (Session): A SQLAlchemy session object.
+            user_data (UserCreate): A Pydantic model representing the user data.
+            client (TestClient): A FastAPI test client instance.
+            query_counter (QueryCounter): Counts the statements sent to the database.
+
+        Steps:
+            - Create a new user using the UserRepository.
+            - Retrieve it, list the users and retrieve them by ID with a fieldset, while recording the statements
+              sent to the database.
+            - Retrieve it with an unknown field.
+
+        Expected Result:
+            - The responses should only hold the requested attributes.
+            - No query should read the password column.
+            - An unknown field should return an HTTP 400 Bad Request status code.
+        """
+        created_user = UserRepository(db).create_user(UserCreate(**user_data))
+
+        with query_counter(max_queries=3) as queries:
+            user = client.get(f"/api/users/{created_user.id}", params={"fields": "name,email"}).json()
+            page = client.get("/api/users/", params={"fields": "id"}).json()
+            batch = client.post(
+                "/api/users/batch-get", params={"fields": "name"}, json={"ids": [created_user.id]}
+            ).json()
+
+        assert user == {"name": user_data["name"], "email": user_data["email"]}
+        assert page == {"items": [{"id": created_user.id}], "next_cursor": None}
+        assert batch == {"items": [{"name": user_data["name"]}], "missing_ids": []}
+        assert queries.count == 3
+        assert not any("password" in statement for statement in queries.statements)
+
+        response = client.get(f"/api/users/{created_user.id}", params={"fields": "id,password"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_fast_json_responses(
+        self, db: Session, user_data: UserCreate, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that the fast JSON mode returns the same documents as the default serialization.
+
+        Args:
+            db (Session): A SQLAlchemy session object.
+            user_data (UserCreate): A Pydantic model representing the user data.
+            client (TestClient): A FastAPI test client instance.
+            monkeypatch (pytest.MonkeyPatch): Used to enable `FAST_JSON_RESPONSES`.
+
+        Expected Result:
+            Every user read endpoint should return the same body with and without `FAST_JSON_RESPONSES`.
+        """
+        created_user = UserRepository(db).create_user(UserCreate(**user_data))
+        UserRepository(db).create_user(UserCreate(name="Jane Doe", email="janedoe@example.com", password="p"))
+
+        def read():
+            return [
+                client.get(f"/api/users/{created_user.id}").json(),
+                client.get(f"/api/users/{created_user.id}", params={"fields": "email,created_at"}).json(),
+                client.get("/api/users/", params={"limit": 1}).json(),
+                client.post("/api/users/batch-get", params={"fields": "id"}, json={"ids": [created_user.id, 9]}).json(),
+            ]
+
+        default_bodies = read()
+        monkeypatch.setattr(user_routers.settings, "FAST_JSON_RESPONSES", True)
+
+        assert read() == default_bodies
+
+    def test_get_user_not_modified(
+        self, db: Session, user_data: UserCreate, client: TestClient, query_counter: QueryCounter
+    ):
+        """Test revalidating a user with the ETag of a previous response.
+
+        Args:
+            db (Session): A SQLAlchemy session object.
+            user_data (UserCreate): A Pydantic model representing the user data.
+            client (TestClient): A FastAPI test client instance.
+            query_counter (QueryCounter): Counts the statements sent to the database.
+
+        Steps:
+            - Create a new user using the UserRepository and retrieve it.
+            - Retrieve it again with its ETag in `If-None-Match`, while recording the statements sent to the database.
+            - Retrieve it with the same ETag but another fieldset, then update it and retrieve it with the ETag again.
+
+        Expected Result:
+            - The revalidation should return an HTTP 304 Not Modified status code without a body.
+            - It should only read the modification times of the user.
+            - Another fieldset or an update of the user should return the full response with a new ETag.
+        """
+        user_repository = UserRepository(db)
+        created_user = user_repository.create_user(UserCreate(**user_data))
+        etag = client.get(f"/api/users/{created_user.id}").headers["ETag"]
+
+        with query_counter(max_queries=1) as queries:
+            response = client.get(f"/api/users/{created_user.id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        assert queries.count == 1
+        assert not any(column in queries.statements[0] for column in ("name", "email", "password"))
+
+        response = client.get(f"/api/users/{created_user.id}", params={"fields": "id"}, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
+        user_repository.update_user(created_user, UserUpdate(name="Updated Name", email=user_data["email"]))
+        response = client.get(f"/api/users/{created_user.id}", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "Updated Name"
+        assert response.headers["ETag"] != etag
+
     def test_get_user_not_found(self, client: TestClient):
         """Test retrieving a user that does not exist.
 
@@ -119,6 +323,37 @@ class TestUserRouters:
         response = client.get("/api/users/999")
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_get_users_batch(self, db: Session, client: TestClient, query_counter: QueryCounter):
+        """Test retrieving several users by their IDs in one request.
+
+        Args:
+            db (Session): A SQLAlchemy session object.
+            client (TestClient): A FastAPI test client instance.
+            query_counter (QueryCounter): Counts the statements sent to the database.
+
+        Steps:
+            - Create three users using the UserRepository.
+            - Request two of them and an unknown ID, in reverse order, while recording the statements sent to the
+              database.
+
+        Expected Result:
+            - The users should be returned in the requested order and the unknown ID reported as missing.
+            - The users should be read with a single `SELECT`.
+        """
+        user_repository = UserRepository(db)
+        ids = [
+            user_repository.create_user(UserCreate(name=f"User {i}", email=f"user{i}@example.com", password="p")).id
+            for i in range(3)
+        ]
+
+        with query_counter(max_queries=1) as queries:
+            response = client.post("/api/users/batch-get", json={"ids": [ids[2], 999, ids[0], ids[2]]})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [user["id"] for user in response.json()["items"]] == [ids[2], ids[0]]
+        assert response.json()["missing_ids"] == [999]
+        assert [statement.split()[0].upper() for statement in queries.statements] == ["SELECT"]
+
     def test_list_users(self, db: Session, user_data: UserCreate, client: TestClient):
         """
         Test listing all users.
@@ -136,7 +371,7 @@ class TestUserRouters:
         Expected Result:
             - Response status code should be 200.
             - Response headers should contain 'Content-Type' as 'application/json'.
-            - Response data should be a list of dictionaries representing the users.
+            - Response data should contain a list of dictionaries representing the users and a next cursor.
 
         """
         user_service = UserRepository(db)
@@ -145,7 +380,82 @@ class TestUserRouters:
         response = client.get("/api/users/")
         assert response.status_code == status.HTTP_200_OK
         assert response.headers["Content-Type"] == "application/json"
-        assert isinstance(response.json(), List)
+        assert isinstance(response.json()["items"], List)
+        assert response.json()["next_cursor"] is None
+
+    def test_list_users_pagination(self, db: Session, user_data: UserCreate, client: TestClient):
+        """
+        Test following the next cursor when listing users.
+
+        Args:
+            db (Session): Database session.
+            user_data (UserCreate): User data to create and list.
+            client (TestClient): Test client.
+
+        Steps:
+            - Create two users.
+            - Request the first page with a limit of one.
+            - Request the second page with the returned next cursor.
+
+        Expected Result:
+            - Each page should contain a different user.
+            - The last page should not return a next cursor.
+        """
+        user_service = UserRepository(db)
+        user_service.create_user(UserCreate(**user_data))
+        user_service.create_user(UserCreate(name="Jane Doe", email="janedoe@example.com", password="password456"))
+
+        first_page = client.get("/api/users/", params={"limit": 1}).json()
+        assert len(first_page["items"]) == 1
+        assert first_page["next_cursor"] is not None
+
+        second_page = client.get("/api/users/", params={"limit": 1, "cursor": first_page["next_cursor"]}).json()
+        assert len(second_page["items"]) == 1
+        assert second_page["items"][0]["id"] != first_page["items"][0]["id"]
+        assert second_page["next_cursor"] is None
+
+    def test_list_users_limit_above_maximum(self, client: TestClient):
+        """
+        Test that the page size is capped.
+
+        Args:
+            client (TestClient): Test client.
+
+        Expected Result:
+            - The API should return an HTTP 422 Unprocessable Entity status code.
+        """
+        response = client.get("/api/users/", params={"limit": 100000})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_export_users(self, db: Session, user_data: UserCreate, client: TestClient):
+        """
+        Test streaming the users export.
+
+        Args:
+            db (Session): Database session.
+            user_data (UserCreate): User data to create and export.
+            client (TestClient): Test client.
+
+        Steps:
+            - Create a new user.
+            - Request the export in NDJSON and CSV formats.
+
+        Expected Result:
+            - Both responses should have status code 200 and the media type of the requested format.
+            - The exported data should contain the created user.
+        """
+        user_service = UserRepository(db)
+        user_service.create_user(UserCreate(**user_data))
+
+        response = client.get("/api/users/export")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        assert json.loads(response.text.splitlines()[0])["email"] == user_data["email"]
+
+        response = client.get("/api/users/export", params={"format": "csv"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["Content-Type"].startswith("text/csv")
+        assert user_data["email"] in response.text
 
     def test_update_user(self, db: Session, user_data: UserCreate, client: TestClient):
         """Test updating a user.
@@ -197,6 +507,44 @@ class TestUserRouters:
         response = client.patch("/api/users/999", json=user_data)
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_update_and_delete_run_one_statement(
+        self, db: Session, user_data: UserCreate, client: TestClient, query_counter: QueryCounter
+    ):
+        """Test that updating and deleting a user each take a single SQL statement.
+
+        Args:
+            db (Session): A SQLAlchemy session object.
+            user_data (UserCreate): A Pydantic model representing the user data.
+            client (TestClient): A FastAPI test client instance.
+            query_counter (QueryCounter): Counts the statements sent to the database.
+
+        Steps:
+            - Create a new user using the UserRepository.
+            - Update and then delete it through the API while recording the statements sent to the database.
+            - Delete it again.
+
+        Expected Result:
+            - The update should run a single `UPDATE ... RETURNING` and the delete a single `DELETE ... RETURNING`.
+            - Deleting a user that no longer exists should return an HTTP 404 Not Found status code.
+        """
+        created_user = UserRepository(db).create_user(UserCreate(**user_data))
+
+        with query_counter(max_queries=1) as queries:
+            response = client.patch(
+                f"/api/users/{created_user.id}", json={"name": "Updated Name", "email": user_data["email"]}
+            )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "Updated Name"
+        assert queries.statements[0].split()[0].upper() == "UPDATE"
+
+        with query_counter(max_queries=1) as queries:
+            response = client.delete(f"/api/users/{created_user.id}")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert queries.statements[0].split()[0].upper() == "DELETE"
+
+        response = client.delete(f"/api/users/{created_user.id}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_password_reset_request(self, db: Session, user_data: UserCreate, client: TestClient):
         """Test requesting a password reset.
 
@@ -274,3 +622,46 @@ class TestUserRouters:
         # check that the user's password was updated in the database
         user = UserRepository(db).get_user_by_email(user_data["email"])
         assert user is not None
+
+    @pytest.mark.asyncio
+    async def test_password_reset_does_not_block_event_loop(
+        self, db: Session, user_data: UserCreate, async_client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Test that resetting a password hashes it off the event loop.
+
+        Args:
+            db (Session): Database session.
+            user_data (UserCreate): User data to create and reset the password.
+            async_client (httpx.AsyncClient): Client calling the application on the test's event loop.
+            monkeypatch (pytest.MonkeyPatch): Used to record the thread hashing the password.
+
+        Steps:
+            - Wrap the password manager's hash so it records the thread it runs in.
+            - Reset the password of a user.
+
+        Expected Result:
+            - The request should succeed, and the new password verify against the stored hash.
+            - The password should be hashed exactly once, in a thread other than the one running the event loop.
+        """
+        password_manager = UserRepository(db).password_manager
+        user = UserRepository(db).create_user(UserCreate(**user_data))
+        token = TokenManagerProvider().generate_jwt_token(user_data["email"])
+        hash_generate = password_manager.hash_generate
+        hashing_threads = []
+
+        def recording_hash_generate(text: str) -> str:
+            hashing_threads.append(threading.get_ident())
+            return hash_generate(text)
+
+        monkeypatch.setattr(password_manager, "hash_generate", recording_hash_generate)
+        response = await async_client.post(
+            "/api/users/password-reset",
+            json={"token": token, "email": user_data["email"], "password": "newpassword456"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(hashing_threads) == 1
+        assert hashing_threads[0] != threading.get_ident()
+        db.refresh(user)
+        assert password_manager.hash_verify("newpassword456", user.password) is True
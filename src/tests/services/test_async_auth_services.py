@@ -0,0 +1,79 @@
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.providers.password_manager_provider import PasswordManagerProvider
+from src.repositories.async_user_repository import AsyncUserRepository
+from src.schemas.login_schema import LoginData
+from src.schemas.user_schema import UserCreate
+from src.services.async_auth_service import AsyncAuthService
+
+
+class TestAsyncAuthServices:
+    """
+    Test suite for the AsyncAuthService login_for_access_token method.
+    """
+
+    @pytest.mark.asyncio
+    async def test_login_for_access_token(self, async_db: AsyncSession, user_data: LoginData):
+        """
+        Test logging in with valid and invalid credentials.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object
+            user_data (LoginData): Data required to login (username and password)
+
+        Expected Results:
+            Valid credentials should return an access token for the user, and a wrong password should raise an
+            HTTPException.
+        """
+        await AsyncUserRepository(async_db).create_user(UserCreate(**user_data))
+        auth_service = AsyncAuthService(async_db)
+
+        result = await auth_service.login_for_access_token(LoginData(**user_data))
+        assert result.user.email == user_data["email"]
+        assert result.access_token
+
+        with pytest.raises(HTTPException):
+            await auth_service.login_for_access_token(LoginData(email=user_data["email"], password="123"))
+
+    @pytest.mark.asyncio
+    async def test_login_for_access_token_failure_when_user_do_not_exist(
+        self, async_db: AsyncSession, user_data: LoginData
+    ):
+        """
+        Test that an HTTPException is raised when the user does not exist.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object
+            user_data (LoginData): Data required to login (username and password)
+
+        Expected Results:
+            An HTTPException should be raised when trying to login with non-existent user_data.
+        """
+        with pytest.raises(HTTPException):
+            await AsyncAuthService(async_db).login_for_access_token(LoginData(**user_data))
+
+    @pytest.mark.asyncio
+    async def test_login_for_access_token_rehashes_outdated_password(
+        self, async_db: AsyncSession, user_data: LoginData
+    ):
+        """
+        Test that a password hashed with an outdated cost is hashed again on a successful login.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object
+            user_data (LoginData): Data required to login (username and password)
+
+        Expected Results:
+            The stored hash should now use the current cost and still verify the password.
+        """
+        outdated_manager = PasswordManagerProvider(CryptContext(schemes=["bcrypt"], bcrypt__rounds=4))
+        await AsyncUserRepository(async_db, outdated_manager).create_user(UserCreate(**user_data))
+
+        current_manager = PasswordManagerProvider(CryptContext(schemes=["bcrypt"], bcrypt__rounds=5))
+        await AsyncAuthService(async_db, password_manager=current_manager).login_for_access_token(LoginData(**user_data))
+
+        user = await AsyncUserRepository(async_db).get_user_by_email(user_data["email"])
+        assert user.password.startswith("$2b$05$")
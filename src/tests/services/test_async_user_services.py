@@ -0,0 +1,300 @@
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.providers.password_manager_provider import PasswordManagerProvider
+from src.repositories.async_user_repository import AsyncUserRepository
+from src.schemas.user_schema import PasswordReset, UserCreate, UserExportFormat, UserUpdate
+from src.services.async_user_service import AsyncUserService, settings
+from src.tests.conftest import AsyncSessionTesting
+
+
+class TestAsyncUserService:
+    """
+    Class to test AsyncUserService methods.
+    """
+
+    @pytest.mark.asyncio
+    async def test_create_user(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test case to create a user.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): UserCreate schema object.
+
+        Expected Result:
+            The created user should have a non-null id and its attributes should match the input user_data.
+        """
+        result = await AsyncUserService(async_db).create_user(UserCreate(**user_data))
+        assert result.id is not None
+        assert result.name == user_data["name"]
+        assert result.email == user_data["email"]
+
+    @pytest.mark.asyncio
+    async def test_create_user_duplicate_email(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test that an email can only be registered once.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): Data of the user to create.
+
+        Expected Results:
+            The second registration should raise an HTTPException with status 400.
+        """
+        user_service = AsyncUserService(async_db)
+        await user_service.create_user(UserCreate(**user_data))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await user_service.create_user(UserCreate(**user_data))
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_create_user_concurrent_signups(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test concurrent signups with the same email.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object, used to create the tables.
+            user_data (UserCreate): Data of the user to create.
+
+        Expected Results:
+            Exactly one signup should succeed and every other one should raise an HTTPException with status 400.
+        """
+
+        async def signup():
+            async with AsyncSessionTesting() as session:
+                return await AsyncUserService(session).create_user(UserCreate(**user_data))
+
+        results = await asyncio.gather(*(signup() for _ in range(4)), return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        assert len(results) - len(errors) == 1
+        assert all(isinstance(error, HTTPException) and error.status_code == 400 for error in errors)
+
+    @pytest.mark.asyncio
+    async def test_list_users_paginates_with_cursor(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test walking through the users with the returned cursor.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): Data of the first user to create.
+
+        Expected Results:
+            The first page should have a cursor leading to the second and last page.
+        """
+        user_service = AsyncUserService(async_db)
+        await user_service.create_user(UserCreate(**user_data))
+        await user_service.create_user(UserCreate(name="Jane Doe", email="janedoe@example.com", password="p"))
+
+        first_page = await user_service.list_users(limit=1)
+        second_page = await user_service.list_users(limit=1, cursor=first_page.next_cursor)
+
+        assert first_page.items[0].email == user_data["email"]
+        assert second_page.items[0].email == "janedoe@example.com"
+        assert second_page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_export_users_csv(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test exporting the users as CSV.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): Data of the user to create.
+
+        Expected Results:
+            The export should start with the header row followed by the user.
+        """
+        user_service = AsyncUserService(async_db)
+        await user_service.create_user(UserCreate(**user_data))
+
+        chunks = [chunk async for chunk in user_service.export_users(UserExportFormat.csv)]
+        rows = list(csv.reader(io.StringIO("".join(chunks))))
+
+        assert rows[0] == ["id", "name", "email", "created_at"]
+        assert rows[1][2] == user_data["email"]
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_missing_user(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test updating and deleting a user that does not exist.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): Data used for the update.
+
+        Expected Results:
+            Both operations should raise an HTTPException with status 404.
+        """
+        user_service = AsyncUserService(async_db)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await user_service.update_user(999, UserUpdate(**user_data))
+        assert exc_info.value.status_code == 404
+        with pytest.raises(HTTPException) as exc_info:
+            await user_service.delete_user(999)
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_get_user(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test case to get a user by id.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): UserCreate schema object.
+
+        Expected Result:
+            The returned user should have attributes that match the created user.
+        """
+        service = AsyncUserService(async_db)
+        result = await service.create_user(UserCreate(**user_data))
+        get_result = await service.get_user(result.id)
+        assert get_result.id == result.id
+        assert get_result.name == result.name
+        assert get_result.email == result.email
+
+    @pytest.mark.asyncio
+    async def test_get_users_too_many_ids(self, async_db: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test retrieving more users by id than allowed in one request.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            monkeypatch (pytest.MonkeyPatch): Used to lower the maximum number of ids.
+
+        Expected Result:
+            An HTTPException with status 400 should be raised, while repeated ids only count once.
+        """
+        monkeypatch.setattr(settings, "USERS_BATCH_GET_MAX_IDS", 2)
+        service = AsyncUserService(async_db)
+
+        assert (await service.get_users([1, 2, 2, 1])).missing_ids == [1, 2]
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_users([1, 2, 3])
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_list_users(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test case to list all users.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): UserCreate schema object.
+
+        Expected Result:
+            The returned page should contain all the created users and no next cursor.
+        """
+        service = AsyncUserService(async_db)
+        await service.create_user(UserCreate(**user_data))
+        await service.create_user(UserCreate(name="Test User 2", email="test2@example.com", password="password"))
+        result = await service.list_users()
+        assert len(result.items) == 2
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_list_users_invalid_cursor(self, async_db: AsyncSession):
+        """
+        Test listing users with a malformed cursor.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+
+        Expected Result:
+            An HTTPException with status code 400 should be raised.
+        """
+        with pytest.raises(HTTPException) as error:
+            await AsyncUserService(async_db).list_users(cursor="not-a-cursor")
+        assert error.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_export_users_ndjson(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test exporting users as newline-delimited JSON.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): UserCreate schema object.
+
+        Expected Result:
+            Each line should be a JSON document describing one user, without its password.
+        """
+        service = AsyncUserService(async_db)
+        await service.create_user(UserCreate(**user_data))
+        await service.create_user(UserCreate(name="Test User 2", email="test2@example.com", password="password"))
+
+        lines = "".join([chunk async for chunk in service.export_users(UserExportFormat.ndjson)]).splitlines()
+        users = [json.loads(line) for line in lines]
+        assert [user["email"] for user in users] == [user_data["email"], "test2@example.com"]
+        assert set(users[0]) == {"id", "name", "email", "created_at"}
+
+    @pytest.mark.asyncio
+    async def test_update_user(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test updating a user's information.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): The user data to use for creating the user.
+
+        Expected Results:
+            The user returned by `update_user` should have the same ID as the original user and the updated name.
+        """
+        service = AsyncUserService(async_db)
+        result = await service.create_user(UserCreate(**user_data))
+        update_user = UserUpdate(name="Update User", email="test@example.com", password="password")
+        updated_result = await service.update_user(result.id, update_user)
+        assert updated_result.id == result.id
+        assert updated_result.name == update_user.name
+        assert updated_result.email == result.email
+
+    @pytest.mark.asyncio
+    async def test_delete_user(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test deleting a user.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): The user data to use for creating the user.
+
+        Expected Results:
+            Calling `get_user` with the user ID after calling `delete_user` should raise an HTTPException.
+        """
+        service = AsyncUserService(async_db)
+        result = await service.create_user(UserCreate(**user_data))
+
+        await service.delete_user(result.id)
+        with pytest.raises(HTTPException):
+            await service.get_user(result.id)
+
+    @pytest.mark.asyncio
+    async def test_reset_password(self, async_db: AsyncSession, user_data: UserCreate):
+        """
+        Test resetting a user's password.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async session object.
+            user_data (UserCreate): The user data to create the user with.
+
+        Expected Results:
+            An access token should be returned and the stored hash should verify the new password.
+        """
+        service = AsyncUserService(async_db)
+        user = await service.create_user(UserCreate(**user_data))
+        token = service.token_manager.generate_jwt_token(user.email)
+        password_reset = PasswordReset(token=token, password="newpassword", email=user.email)
+
+        result = await service.reset_password(password_reset)
+
+        assert result["access_token"] is not None
+        updated_user = await AsyncUserRepository(async_db).get_user_by_id(user.id)
+        assert PasswordManagerProvider().hash_verify(password_reset.password, updated_user.password) is True
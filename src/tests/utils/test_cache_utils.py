@@ -0,0 +1,93 @@
+import time
+
+from src.utils.cache_utils import TTLCache
+
+
+class TestTTLCache:
+    """
+    Test suite for the TTLCache class.
+    """
+
+    def test_get_and_set(self):
+        """
+        Test caching and retrieving a value.
+
+        Expected Result:
+            The cached value should be returned and counted as a hit, a missing key should be counted as a miss.
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5, "size": 1, "maxsize": 2}
+
+    def test_evicts_least_recently_used(self):
+        """
+        Test the eviction of the least recently used entry when the cache is full.
+
+        Expected Result:
+            The entry that was not read recently should be evicted.
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self):
+        """
+        Test that entries expire after their time to live.
+
+        Expected Result:
+            An entry cached with a short time to live should no longer be returned once it has elapsed.
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1, ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+
+    def test_disabled_cache(self):
+        """
+        Test a cache with a time to live of zero.
+
+        Expected Result:
+            Nothing should be cached.
+        """
+        cache = TTLCache(maxsize=2, ttl=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+
+    def test_invalidate(self):
+        """
+        Test removing an entry.
+
+        Expected Result:
+            The invalidated entry should no longer be returned.
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.invalidate("a")
+
+        assert cache.get("a") is None
+
+    def test_invalidate_where(self):
+        """
+        Test removing the entries whose value matches a predicate.
+
+        Expected Result:
+            Only the matching entries should be removed.
+        """
+        cache = TTLCache(maxsize=3, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate_where(lambda value: value == 1)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
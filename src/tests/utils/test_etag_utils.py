@@ -0,0 +1,48 @@
+import pytest
+
+from src.utils.etag_utils import etag_matches, make_etag
+
+
+class TestEtagUtils:
+    """
+    Test suite for the entity tag helpers.
+    """
+
+    def test_make_etag(self):
+        """
+        Test building entity tags.
+
+        Expected Result:
+            The tag should be weak and quoted, stable for the same values and different when a value changes.
+        """
+        etag = make_etag(1, "2024-01-01 00:00:00", "id,name")
+
+        assert etag.startswith('W/"') and etag.endswith('"')
+        assert etag == make_etag(1, "2024-01-01 00:00:00", "id,name")
+        assert etag != make_etag(1, "2024-01-01 00:00:01", "id,name")
+        assert etag != make_etag(1, "2024-01-01 00:00:00", "id")
+
+    @pytest.mark.parametrize(
+        "if_none_match, matches",
+        [
+            ('W/"abc"', True),
+            ('"abc"', True),
+            ('"other", W/"abc"', True),
+            ("*", True),
+            ('W/"other"', False),
+            ("", False),
+            (None, False),
+        ],
+    )
+    def test_etag_matches(self, if_none_match, matches):
+        """
+        Test comparing an If-None-Match header with an entity tag.
+
+        Args:
+            if_none_match: The value of the header.
+            matches: Whether the header matches the tag `W/"abc"`.
+
+        Expected Result:
+            Tags should be compared weakly, any tag of a list may match and `*` should match any tag.
+        """
+        assert etag_matches(if_none_match, 'W/"abc"') is matches
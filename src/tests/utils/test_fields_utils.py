@@ -0,0 +1,43 @@
+import pytest
+
+from src.utils.fields_utils import parse_fields
+
+ALLOWED = ("id", "name", "email", "created_at")
+
+
+class TestFieldsUtils:
+    """
+    Test suite for the sparse fieldset parser.
+    """
+
+    @pytest.mark.parametrize("fields", [None, "", " "])
+    def test_parse_fields_defaults_to_all(self, fields):
+        """
+        Test that an absent or blank fieldset selects every allowed field.
+
+        Args:
+            fields: An absent or blank fieldset.
+
+        Expected Result:
+            Every allowed field should be returned, in order.
+        """
+        assert parse_fields(fields, ALLOWED) == list(ALLOWED)
+
+    def test_parse_fields(self):
+        """
+        Test parsing a fieldset with spaces and repeated fields.
+
+        Expected Result:
+            The requested fields should be returned once each, in the order of the allowed fields.
+        """
+        assert parse_fields("email, id,email,", ALLOWED) == ["id", "email"]
+
+    def test_parse_unknown_fields(self):
+        """
+        Test parsing a fieldset with a field that is not allowed.
+
+        Expected Result:
+            A ValueError naming the unknown field should be raised.
+        """
+        with pytest.raises(ValueError, match="password"):
+            parse_fields("id,password", ALLOWED)
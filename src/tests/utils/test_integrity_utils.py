@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.entities.user_entity import User
+from src.utils.integrity_utils import is_unique_violation, unique_names
+
+
+class TestIntegrityUtils:
+    """
+    Test suite for the helpers recognising unique constraint violations.
+    """
+
+    def test_unique_names(self):
+        """
+        Test the names collected for the email column of the users table.
+
+        Expected Result:
+            The named constraint, the unique index, PostgreSQL's default name and SQLite's column form are included.
+        """
+        names = unique_names(User.__table__.c.email)
+
+        assert {"uq_users_email", "ix_users_email", "users_email_key", "users.email"} <= names
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "UNIQUE constraint failed: users.email",
+            'duplicate key value violates unique constraint "uq_users_email"\nDETAIL:  Key (email)=(a@b.c) already exists.',
+            'duplicate key value violates unique constraint "ix_users_email"',
+            "Duplicate entry 'a@b.c' for key 'uq_users_email'",
+        ],
+    )
+    def test_is_unique_violation(self, message: str):
+        """
+        Test recognising a duplicate email from the messages of SQLite, PostgreSQL and MySQL.
+
+        Args:
+            message (str): The message of the driver error.
+
+        Expected Result:
+            The error should be recognised as a duplicate email.
+        """
+        error = IntegrityError("INSERT INTO users ...", {}, Exception(message))
+
+        assert is_unique_violation(error, User.__table__.c.email)
+
+    def test_is_not_unique_violation(self):
+        """
+        Test that other integrity errors are not taken for a duplicate email.
+
+        Expected Result:
+            A NOT NULL violation should not be recognised as a duplicate email.
+        """
+        error = IntegrityError("INSERT INTO users ...", {}, Exception("NOT NULL constraint failed: users.name"))
+
+        assert not is_unique_violation(error, User.__table__.c.email)
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import pytest
+
+from src.schemas.user_schema import UserPage, UserPartialOut
+from src.utils.json_utils import FastJSONResponse, dumps
+
+
+class TestJsonUtils:
+    """
+    Test suite for the orjson based serialization helpers.
+    """
+
+    def test_dumps_constructed_models(self):
+        """
+        Test serializing models constructed without validation.
+
+        Expected Result:
+            Only the fields that were set should be encoded, in declaration order, with datetimes in ISO 8601 format.
+        """
+        user = UserPartialOut.construct(created_at=datetime(2023, 3, 1, 12, 30), id=1)
+        page = UserPage.construct(items=[user, UserPartialOut.construct(name="Jane")], next_cursor=None)
+
+        assert dumps(page) == (
+            b'{"items":[{"id":1,"created_at":"2023-03-01T12:30:00"},{"name":"Jane"}],"next_cursor":null}'
+        )
+
+    def test_dumps_unsupported_object(self):
+        """
+        Test serializing an object that is neither JSON nor a pydantic model.
+
+        Expected Result:
+            A TypeError should be raised.
+        """
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+    def test_fast_json_response(self):
+        """
+        Test rendering a FastJSONResponse.
+
+        Expected Result:
+            The body should be the orjson document and the media type JSON.
+        """
+        response = FastJSONResponse(UserPartialOut.construct(id=1))
+
+        assert response.body == b'{"id":1}'
+        assert response.media_type == "application/json"
@@ -0,0 +1,115 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.utils.metrics_utils import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    QueryStats,
+    instrument_queries,
+    request_queries,
+    timed,
+)
+
+
+class TestMetricsUtils:
+    """
+    Test suite for the in-process metrics and their Prometheus text exposition.
+    """
+
+    def test_render_counter_and_gauge(self):
+        """
+        Test the exposition of a counter and of a gauge.
+
+        Expected Result:
+            Each metric should have its HELP and TYPE lines, and one sample per set of labels, with escaped label
+            values.
+        """
+        registry = MetricsRegistry()
+        requests = registry.register(Counter("requests_total", "Requests served.", ["route"]))
+        in_flight = registry.register(Gauge("in_flight", "Requests being served."))
+        requests.inc('/users/{user_id}"')
+        requests.inc('/users/{user_id}"', amount=2)
+        in_flight.inc()
+        in_flight.dec()
+
+        assert registry.render() == (
+            "# HELP requests_total Requests served.\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{route="/users/{user_id}\\""} 3\n'
+            "# HELP in_flight Requests being served.\n"
+            "# TYPE in_flight gauge\n"
+            "in_flight 0\n"
+        )
+
+    def test_render_histogram(self):
+        """
+        Test the exposition of a histogram.
+
+        Expected Result:
+            The buckets should be cumulative and end with `+Inf`, followed by the sum and the count.
+        """
+        histogram = Histogram("duration_seconds", "Durations.", ["route"], buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, "/users")
+
+        assert histogram.render()[2:] == [
+            'duration_seconds_bucket{route="/users",le="0.1"} 1',
+            'duration_seconds_bucket{route="/users",le="1.0"} 2',
+            'duration_seconds_bucket{route="/users",le="+Inf"} 3',
+            'duration_seconds_sum{route="/users"} 5.55',
+            'duration_seconds_count{route="/users"} 3',
+        ]
+        assert histogram.get("/users") == (3, 5.55)
+        with pytest.raises(ValueError):
+            histogram.observe(1.0)
+
+    @pytest.mark.asyncio
+    async def test_timed(self):
+        """
+        Test timing a function and a coroutine function, including a call raising an exception.
+
+        Expected Result:
+            Every call should be recorded under the labels given to the decorator.
+        """
+        histogram = Histogram("call_duration_seconds", "Call durations.", ["operation"])
+
+        @timed(histogram, "sync")
+        def fail():
+            raise RuntimeError
+
+        @timed(histogram, "async")
+        async def succeed():
+            return "done"
+
+        with pytest.raises(RuntimeError):
+            fail()
+        assert await succeed() == "done"
+        assert histogram.get("sync")[0] == 1
+        assert histogram.get("async")[0] == 1
+
+    def test_instrument_queries(self):
+        """
+        Test counting the statements run by an instrumented engine while a QueryStats is set.
+
+        Expected Result:
+            Only the statements run while the QueryStats is set should be counted, once each although the engine is
+            instrumented twice.
+        """
+        engine = create_engine("sqlite://")
+        instrument_queries(engine)
+        instrument_queries(engine)
+        queries = QueryStats()
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            token = request_queries.set(queries)
+            try:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+            finally:
+                request_queries.reset(token)
+
+        assert queries.count == 2
+        assert queries.duration > 0
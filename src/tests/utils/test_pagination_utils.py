@@ -0,0 +1,32 @@
+import pytest
+
+from src.utils.pagination_utils import decode_cursor, encode_cursor
+
+
+class TestPaginationUtils:
+    """
+    Test suite for the keyset pagination cursor helpers.
+    """
+
+    def test_cursor_round_trip(self):
+        """
+        Test that an encoded cursor decodes back to the same id.
+
+        Expected Result:
+            The decoded id should match the encoded one.
+        """
+        assert decode_cursor(encode_cursor(42)) == 42
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "eyJpZCI6ICJhIn0", "eyJmb28iOiAxfQ"])
+    def test_decode_invalid_cursor(self, cursor: str):
+        """
+        Test decoding malformed cursors.
+
+        Args:
+            cursor (str): A malformed cursor.
+
+        Expected Result:
+            A ValueError should be raised.
+        """
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
@@ -0,0 +1,34 @@
+from src.utils.password_hash_calibration import calibrate, measure_hash_time
+
+
+class TestPasswordHashCalibration:
+    """
+    Test suite for the password hashing calibration command.
+    """
+
+    def test_measure_hash_time(self):
+        """
+        Test measuring the bcrypt hash time.
+
+        Expected Result:
+            A positive duration in milliseconds should be returned.
+        """
+        assert measure_hash_time("bcrypt", 4, samples=1) > 0
+
+    def test_calibrate_unreachable_target_returns_minimum(self):
+        """
+        Test calibrating with a target no cost can reach.
+
+        Expected Result:
+            The minimum bcrypt cost should be returned.
+        """
+        assert calibrate("bcrypt", target_ms=0, samples=1) == 4
+
+    def test_calibrate_is_bounded_by_max_cost(self):
+        """
+        Test calibrating with a generous target.
+
+        Expected Result:
+            The returned cost should not exceed `max_cost`.
+        """
+        assert calibrate("bcrypt", target_ms=60000, max_cost=5, samples=1) == 5
@@ -0,0 +1,76 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from src.utils.pool_metrics_utils import InstrumentedQueuePool, instrument_engine
+
+
+class TestPoolMetrics:
+    """
+    Test suite for the connection pool instrumentation.
+    """
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.1,
+        )
+        yield engine
+        engine.dispose()
+
+    def test_counts_checkouts_and_connections_in_use(self, engine):
+        """
+        Test counting the connections handed out and returned by the pool.
+
+        Expected Results:
+            The connection in use should be counted while it is checked out, and released once it is closed.
+        """
+        metrics = instrument_engine(engine)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            assert metrics.snapshot(engine.pool)["checked_out"] == 1
+
+        snapshot = metrics.snapshot(engine.pool)
+        assert snapshot["checked_out"] == 0
+        assert snapshot["peak_checked_out"] == 1
+        assert snapshot["checkouts"] == 1
+        assert snapshot["connections_opened"] == 1
+        assert snapshot["pool_size"] == 1
+
+    def test_records_timeouts_and_wait_time(self, engine):
+        """
+        Test recording a checkout that waits for an exhausted pool until it times out.
+
+        Expected Results:
+            The timeout should be counted, and the longest wait should be at least the pool timeout.
+        """
+        metrics = instrument_engine(engine)
+
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        snapshot = metrics.snapshot(engine.pool)
+        assert snapshot["timeouts"] == 1
+        assert snapshot["wait_seconds_max"] >= 0.1
+
+    def test_metrics_survive_dispose(self, engine):
+        """
+        Test that the counters are kept when the engine recreates its pool.
+
+        Expected Results:
+            The pool created by `dispose` should share the counters of the previous one.
+        """
+        metrics = instrument_engine(engine)
+        with engine.connect():
+            pass
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert engine.pool.metrics is metrics
+        assert metrics.checkouts == 2
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from src.utils.profiler_utils import ProfilerBusyError, SamplingProfiler, sampling_profile
+
+
+def spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def idle(stop: threading.Event) -> None:
+    stop.wait()
+
+
+class TestProfilerUtils:
+    """
+    Test suite for the SamplingProfiler class.
+    """
+
+    @pytest.mark.parametrize("mode, expected, unexpected", [("wall", ["spin", "idle"], []), ("cpu", ["spin"], ["idle"])])
+    def test_profiles_threads(self, mode: str, expected: list, unexpected: list):
+        """
+        Test profiling a thread burning CPU and a thread waiting.
+
+        Args:
+            mode (str): The profiling mode.
+            expected (list): The functions expected in the profile.
+            unexpected (list): The functions expected to be absent from the profile.
+
+        Expected Result:
+            Both threads should show in a wall-clock profile, and only the busy one in a CPU profile, as collapsed
+            stacks rooted at the thread name and ending with a positive weight.
+        """
+        stop = threading.Event()
+        threads = [threading.Thread(target=target, args=(stop,), name=target.__name__) for target in (spin, idle)]
+        for thread in threads:
+            thread.start()
+        try:
+            with sampling_profile(mode, interval=0.001) as profiler:
+                time.sleep(0.2)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        lines = profiler.collapsed().splitlines()
+        for function in expected:
+            assert any(line.startswith(f"{function};") and f"test_profiler_utils:{function}" in line for line in lines), function
+        for function in unexpected:
+            assert not any(line.startswith(f"{function};") for line in lines), function
+        assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+        assert not any(line.startswith("sampling-profiler;") for line in lines)
+
+    def test_one_profile_at_a_time(self):
+        """
+        Test starting a profile while another one runs, and with an unknown mode.
+
+        Expected Result:
+            The second profile should be refused, and an unknown mode rejected.
+        """
+        with sampling_profile():
+            with pytest.raises(ProfilerBusyError):
+                with sampling_profile():
+                    pass
+        with pytest.raises(ValueError):
+            SamplingProfiler(mode="memory")
@@ -0,0 +1,117 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.entities.students_entity import Student
+from src.entities.user_entity import User
+from src.tests.conftest import QueryCounter
+from src.utils.query_budget_utils import QueryBudget, QueryBudgetExceeded, statement_fingerprint
+
+
+class TestQueryBudgetUtils:
+    """
+    Test suite for the SQL statement fingerprints and the QueryBudget class.
+    """
+
+    @pytest.mark.parametrize(
+        "statements",
+        [
+            ["SELECT * FROM users WHERE id = 1", "SELECT  *\nFROM users WHERE id = 42"],
+            ["SELECT * FROM users WHERE email = 'a@b.com'", "SELECT * FROM users WHERE email = 'it''s@b.com'"],
+            ["SELECT * FROM users WHERE id IN (?, ?)", "SELECT * FROM users WHERE id IN (?, ?, ?, ?)"],
+            ["INSERT INTO users (name) VALUES (%(name)s)", "INSERT INTO users (name) VALUES (:name), (:name_1)"],
+            [
+                "SELECT * FROM users WHERE id IN ($1::INTEGER, $2::INTEGER)",
+                "SELECT * FROM users WHERE id IN ($1::INTEGER, $2::INTEGER, $3::INTEGER)",
+                "SELECT * FROM users WHERE id IN (?)",
+            ],
+            ["UPDATE users SET name=$1::VARCHAR(255) WHERE id = $2", "UPDATE users SET name=? WHERE id = ?"],
+        ],
+    )
+    def test_statement_fingerprint(self, statements):
+        """
+        Test that statements differing only by their values share a fingerprint.
+
+        Args:
+            statements (List[str]): Statements of the same shape.
+
+        Expected Result:
+            The statements should have the same fingerprint.
+        """
+        assert len({statement_fingerprint(statement) for statement in statements}) == 1
+        assert statement_fingerprint("SELECT id FROM users") != statement_fingerprint("SELECT id FROM students")
+
+    def test_raises_over_budget(self):
+        """
+        Test a budget raising on violations.
+
+        Expected Result:
+            Running more statements than `max_queries`, or repeating one more than `max_repeats` times, should raise.
+        """
+        budget = QueryBudget(max_queries=2)
+        budget.record("SELECT 1")
+        budget.record("SELECT 2")
+        with pytest.raises(QueryBudgetExceeded, match="more than 2 SQL statements"):
+            budget.record("SELECT 3")
+
+        budget = QueryBudget(max_repeats=1)
+        budget.record("SELECT * FROM users WHERE id = 1")
+        with pytest.raises(QueryBudgetExceeded, match="N\\+1"):
+            budget.record("SELECT * FROM users WHERE id = 2")
+
+    def test_logs_violations_once(self, caplog: pytest.LogCaptureFixture):
+        """
+        Test a budget logging its violations instead of raising.
+
+        Args:
+            caplog (pytest.LogCaptureFixture): Captures the log records.
+
+        Expected Result:
+            Each violation should be logged once as a warning, however many statements go over the budget.
+        """
+        budget = QueryBudget(max_queries=1, raise_on_violation=False, name="GET /api/users")
+        with caplog.at_level(logging.WARNING):
+            for _ in range(3):
+                budget.record("SELECT 1")
+
+        assert budget.count == 3
+        assert budget.violations == ["GET /api/users ran more than 1 SQL statements"]
+        assert [record.getMessage() for record in caplog.records] == budget.violations
+
+    def test_watch(self):
+        """
+        Test watching an engine within a block.
+
+        Expected Result:
+            Only the statements run within the block should be recorded.
+        """
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            with QueryBudget().watch(engine) as queries:
+                connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+        assert queries.statements == ["SELECT 1"]
+
+    def test_detects_lazy_loads(self, db: Session, query_counter: QueryCounter):
+        """
+        Test catching the N+1 query of serializing the user of each student.
+
+        Args:
+            db (Session): A SQLAlchemy session.
+            query_counter (QueryCounter): Counts the statements sent to the database.
+
+        Expected Result:
+            Lazily loading the user of a third student should go over a budget of two repeats.
+        """
+        for i in range(3):
+            user = User(name=f"User {i}", email=f"user{i}@example.com", password="p")
+            db.add(Student(user=user))
+        db.commit()
+        db.expunge_all()
+
+        with pytest.raises(QueryBudgetExceeded, match="N\\+1"):
+            with query_counter(max_repeats=2):
+                [student.user.email for student in db.query(Student).all()]
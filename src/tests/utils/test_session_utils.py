@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.config.replica import RoutingSession
+from src.entities.user_entity import User
+from src.tests.conftest import engine
+from src.utils.session_utils import has_changes, release_connection
+
+
+class TestSessionUtils:
+    """
+    Test suite for the session helpers.
+    """
+
+    def test_has_changes(self, db: Session):
+        """
+        Test telling whether a session has changes of its own.
+
+        Args:
+            db (Session): SQLAlchemy database session object, which creates the tables.
+
+        Expected Result:
+            A session should have changes while an entity is pending, and a routing session also once it has written,
+            even after committing.
+        """
+        with RoutingSession(bind=engine) as session:
+            assert not has_changes(session)
+            session.add(User(name="John Doe", email="john@example.com", password="hash"))
+            assert has_changes(session)
+            session.commit()
+            assert has_changes(session)
+
+    @pytest.mark.asyncio
+    async def test_release_connection(self, async_db: AsyncSession):
+        """
+        Test releasing the connection of a session that only read, then of a session with a pending change.
+
+        Args:
+            async_db (AsyncSession): SQLAlchemy async database session object.
+
+        Expected Result:
+            The read transaction should be ended, while the transaction with a pending change should be kept open.
+        """
+        await async_db.execute(select(User.id))
+        assert await release_connection(async_db) is True
+        assert not async_db.in_transaction()
+
+        async_db.add(User(name="John Doe", email="john@example.com", password="hash"))
+        await async_db.execute(select(User.id))
+        assert await release_connection(async_db) is False
+        assert async_db.in_transaction()
+        assert await release_connection(async_db) is False
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from src.utils.single_flight_utils import AsyncSingleFlight
+
+
+class TestAsyncSingleFlight:
+    """
+    Test suite for the AsyncSingleFlight class.
+    """
+
+    @pytest.mark.asyncio
+    async def test_async_coalesces_concurrent_calls(self):
+        """
+        Test four coroutines calling the same key, and another key, concurrently.
+
+        Expected Result:
+            The function should run once per key, and every coroutine should get the result of its key.
+        """
+        flight = AsyncSingleFlight()
+        runs = []
+
+        async def load(key):
+            runs.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        results = await asyncio.gather(
+            *(flight.do(key, lambda key=key: load(key)) for key in ["a", "a", "b", "a", "a"])
+        )
+
+        assert sorted(runs) == ["a", "b"]
+        assert [result for result, _ in results] == ["a", "a", "b", "a", "a"]
+        assert flight.stats() == {"calls": 5, "coalesced": 3, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_async_leader_cancelled(self):
+        """
+        Test cancelling the coroutine running the call other coroutines joined.
+
+        Expected Result:
+            The coroutines that joined it should run the function again instead of being cancelled.
+        """
+        flight = AsyncSingleFlight()
+        runs = []
+
+        async def load():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return "user"
+
+        leader = asyncio.ensure_future(flight.do("user:1", load))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("user:1", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == ("user", False)
+        assert leader.cancelled()
+        assert len(runs) == 2
+        assert flight.stats()["coalesced"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_shares_exceptions(self):
+        """
+        Test that a call raising an exception does not stay in flight.
+
+        Expected Result:
+            The exception should be raised, and the next call should run the function again.
+        """
+        flight = AsyncSingleFlight()
+
+        async def fail():
+            raise ValueError("database unavailable")
+
+        async def load():
+            return "user"
+
+        with pytest.raises(ValueError):
+            await flight.do("user:1", fail)
+        assert await flight.do("user:1", load) == ("user", False)
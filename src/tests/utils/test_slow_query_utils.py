@@ -0,0 +1,162 @@
+import logging
+
+import orjson
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from src.entities.user_entity import User
+from src.utils import slow_query_utils
+from src.utils.metrics_utils import QueryStats, instrument_queries, request_queries
+from src.utils.slow_query_utils import SlowQueryLog, instrument_slow_queries
+
+
+class TestSlowQueryUtils:
+    """
+    Test suite for the SlowQueryLog class.
+    """
+
+    def test_top(self):
+        """
+        Test aggregating statements per fingerprint and ranking the fingerprints.
+
+        Expected Result:
+            Statements differing only by their values should be aggregated together, with nearest-rank percentiles,
+            and the fingerprints should be ranked by the requested figure.
+        """
+        query_log = SlowQueryLog(threshold_seconds=10)
+        for duration in range(1, 101):
+            query_log.record(f"SELECT * FROM users WHERE id = {duration}", duration / 1000)
+        query_log.record("DELETE FROM users WHERE id = ?", 0.5)
+
+        by_total, by_max = query_log.top(order_by="total"), query_log.top(limit=1, order_by="max")
+
+        assert [row["fingerprint"] for row in by_total] == [
+            "SELECT * FROM users WHERE id = ?",
+            "DELETE FROM users WHERE id = ?",
+        ]
+        assert by_total[0]["count"] == 100
+        assert by_total[0]["p50_ms"] == pytest.approx(50)
+        assert by_total[0]["p99_ms"] == pytest.approx(99)
+        assert by_total[0]["max_ms"] == pytest.approx(100)
+        assert [row["fingerprint"] for row in by_max] == ["DELETE FROM users WHERE id = ?"]
+        with pytest.raises(ValueError):
+            query_log.top(order_by="name")
+
+    def test_bounds(self):
+        """
+        Test the limits on the number of fingerprints and of durations kept.
+
+        Expected Result:
+            The statements of new fingerprints should be dropped once the log is full, the percentiles should only
+            cover the most recent durations, and a reset should empty the log.
+        """
+        query_log = SlowQueryLog(threshold_seconds=10, max_fingerprints=1, sample_size=2)
+        for duration in (0.3, 0.1, 0.1):
+            query_log.record("SELECT 1", duration)
+        query_log.record("SELECT name FROM users", 0.1)
+
+        assert query_log.top()[0]["p99_ms"] == pytest.approx(100)
+        assert query_log.top()[0]["max_ms"] == pytest.approx(300)
+        assert query_log.stats()["dropped"] == 1
+
+        query_log.reset()
+        assert query_log.top() == []
+        assert query_log.stats() == {"threshold_ms": 10000, "fingerprints": 0, "dropped": 0}
+
+    def test_batch_gets_share_a_fingerprint(self):
+        """
+        Test aggregating batch-gets of different sizes, as rendered for asyncpg.
+
+        Expected Result:
+            The batch-gets should be aggregated under a single fingerprint, instead of taking one slot of
+            `max_fingerprints` per size.
+        """
+        query_log = SlowQueryLog(threshold_seconds=10, max_fingerprints=1)
+        for size in range(1, 6):
+            statement = select(User.id).where(User.id.in_(list(range(size))))
+            compiled = statement.compile(dialect=PGDialect_asyncpg(), compile_kwargs={"render_postcompile": True})
+            query_log.record(str(compiled), 0.01)
+
+        [row] = query_log.top()
+        assert row["count"] == 5
+        assert row["fingerprint"] == "SELECT users.id FROM users WHERE users.id IN (?)"
+        assert query_log.stats()["dropped"] == 0
+
+    def test_logs_slow_statements(self, caplog: pytest.LogCaptureFixture):
+        """
+        Test the log line of a statement slower than the threshold.
+
+        Args:
+            caplog (pytest.LogCaptureFixture): Captures the log records.
+
+        Expected Result:
+            Only the slow statement should be logged, as a JSON object also attached to the record.
+        """
+        query_log = SlowQueryLog(threshold_seconds=0.5)
+        with caplog.at_level(logging.WARNING):
+            query_log.record("SELECT * FROM users WHERE email = 'a@b.com'", 0.75)
+            query_log.record("SELECT 1", 0.01)
+
+        assert len(caplog.records) == 1
+        assert orjson.loads(caplog.records[0].getMessage()) == caplog.records[0].slow_query == {
+            "event": "slow_query",
+            "duration_ms": 750.0,
+            "threshold_ms": 500.0,
+            "fingerprint": "SELECT * FROM users WHERE email = ?",
+        }
+
+    def test_instrument_slow_queries(self, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test recording the statements run by an instrumented engine.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to replace the shared slow query log.
+
+        Expected Result:
+            Each statement should be recorded once, although the engine is instrumented twice.
+        """
+        query_log = SlowQueryLog(threshold_seconds=10)
+        monkeypatch.setattr(slow_query_utils, "slow_query_log", query_log)
+        engine = create_engine("sqlite://")
+        instrument_slow_queries(engine)
+        instrument_slow_queries(engine)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+        [row] = query_log.top()
+        assert row["fingerprint"] == "SELECT ?"
+        assert row["count"] == 2
+
+    def test_shares_the_metrics_timing(self, monkeypatch: pytest.MonkeyPatch):
+        """
+        Test instrumenting an engine for both the metrics and the slow query log.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to replace the shared slow query log.
+
+        Expected Result:
+            The engine should be timed by a single pair of cursor listeners, and the slow query log should record the
+            same duration as the metrics.
+        """
+        query_log = SlowQueryLog(threshold_seconds=10)
+        monkeypatch.setattr(slow_query_utils, "slow_query_log", query_log)
+        engine = create_engine("sqlite://")
+        instrument_queries(engine)
+        instrument_slow_queries(engine)
+        queries = QueryStats()
+
+        token = request_queries.set(queries)
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        finally:
+            request_queries.reset(token)
+
+        assert len(engine.dispatch.before_cursor_execute) == 1
+        assert len(engine.dispatch.after_cursor_execute) == 1
+        [row] = query_log.top()
+        assert row["count"] == queries.count == 1
+        assert row["total_ms"] == queries.duration * 1000
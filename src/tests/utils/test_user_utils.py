@@ -0,0 +1,79 @@
+from datetime import datetime
+
+import pytest
+
+from src.entities.user_entity import User
+from src.utils.user_utils import (
+    csv_chunk,
+    csv_records,
+    import_conflicts,
+    parse_import_rows,
+    project_user,
+    validate_import_rows,
+)
+
+
+class TestUserUtils:
+    """
+    Test suite for the helpers shared by the user service.
+    """
+
+    def test_project_user(self):
+        """
+        Test projecting a user on a selection of its attributes.
+
+        Expected Result:
+            Only the selected attributes should be set on the response.
+        """
+        user = User(id=1, name="John Doe", email="john@example.com", password="hash")
+
+        assert project_user(user, ["id", "email"]).dict(exclude_unset=True) == {"id": 1, "email": "john@example.com"}
+
+    def test_csv_records(self):
+        """
+        Test encoding users as CSV lines.
+
+        Expected Result:
+            Each user should be encoded as its id, name, email and creation time, without its password.
+        """
+        user = User(id=1, name="Doe, John", email="john@example.com", password="hash", created_at=datetime(2023, 3, 1))
+
+        assert csv_chunk(csv_records([user])) == '1,"Doe, John",john@example.com,2023-03-01T00:00:00\r\n'
+
+    @pytest.mark.parametrize(
+        "content, media_type",
+        [(b'{"name": "John"}', "application/json"), (b"\xff", "text/csv"), (b"[", "application/json")],
+    )
+    def test_parse_invalid_import(self, content: bytes, media_type: str):
+        """
+        Test parsing a body that is not a list of rows.
+
+        Args:
+            content (bytes): The body of the import.
+            media_type (str): The media type of the body.
+
+        Expected Result:
+            A ValueError should be raised.
+        """
+        with pytest.raises(ValueError):
+            parse_import_rows(content, media_type)
+
+    def test_validate_import_rows(self):
+        """
+        Test validating the rows of an import and reporting the rows of a batch that were not created.
+
+        Expected Result:
+            Invalid rows and rows repeating an email should be reported with their row numbers, and the valid users
+            not created should be reported as already registered.
+        """
+        rows = parse_import_rows(
+            b"name,email,password\nJohn,john@example.com,secret\nJane,not-an-email,secret\nJohnny,john@example.com,x\n",
+            "text/csv",
+        )
+
+        users, failed = validate_import_rows(rows)
+
+        assert [(row, user.email) for row, user in users] == [(1, "john@example.com")]
+        assert [(failure.row, failure.email) for failure in failed] == [(2, "not-an-email"), (3, "john@example.com")]
+        assert failed[1].detail == "Duplicate email in import"
+        assert [failure.row for failure in import_conflicts(users, set())] == [1]
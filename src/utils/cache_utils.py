@@ -0,0 +1,240 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.config.settings import Settings
+
+settings = Settings()
+
+
+class TTLCache:
+    """
+    A thread-safe, bounded, least-recently-used cache whose entries expire after a time to live.
+
+    Args:
+        maxsize (int): The maximum number of entries. The least recently used entry is evicted when it is exceeded.
+        ttl (float): The default and maximum time to live of an entry, in seconds. A value of 0 disables the cache.
+
+    Attributes:
+        hits (int): The number of lookups that found a live entry.
+        misses (int): The number of lookups that found no entry or an expired one.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value cached under a key.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Any): The value returned when the key is missing or expired.
+
+        Returns:
+            Any: The cached value, or `default`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Caches a value under a key.
+
+        Args:
+            key (Hashable): The key to cache the value under.
+            value (Any): The value to cache.
+            ttl (Optional[float]): The time to live of the entry, in seconds. It is capped by the cache's own ttl.
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes the entry cached under a key, if any.
+
+        Args:
+            key (Hashable): The key to remove.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]) -> None:
+        """
+        Removes every entry whose value matches a predicate.
+
+        Args:
+            predicate (Callable[[Any], bool]): Called with each cached value, returns True for the entries to remove.
+        """
+        with self._lock:
+            for key in [key for key, (_, value) in self._entries.items() if predicate(value)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the usage counters of the cache.
+
+        Returns:
+            Dict[str, Any]: The hits, misses, hit ratio, current size and maximum size of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+class SharedCache:
+    """
+    A cache shared between processes, stored in Redis or any server speaking its protocol.
+
+    Values are bytes and expire after a time to live. The cache is best effort: when the server cannot be reached, a
+    lookup counts as a miss and a write is dropped, so requests fall back to the database instead of failing. The
+    server is reached through an asyncio client, so no command blocks the event loop.
+
+    Args:
+        client (Any): An asyncio Redis client, e.g. `redis.asyncio.Redis`.
+        ttl (float): The time to live of an entry, in seconds. A value of 0 disables the cache.
+        prefix (str): The prefix of every key, to share a server between applications.
+
+    Attributes:
+        hits (int): The number of lookups that found an entry.
+        misses (int): The number of lookups that found no entry.
+        errors (int): The number of commands that failed because of the server.
+    """
+
+    def __init__(self, client: Any, ttl: float, prefix: str = ""):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @classmethod
+    def from_url(cls, url: str, ttl: float, prefix: str = "") -> "SharedCache":
+        """
+        Creates a cache on the Redis server at a URL. Requires the `redis` package.
+
+        Args:
+            url (str): The URL of the server, e.g. `redis://localhost:6379/0`.
+            ttl (float): The time to live of an entry, in seconds.
+            prefix (str): The prefix of every key.
+
+        Returns:
+            SharedCache: The cache. No connection is opened until it is used.
+        """
+        import redis.asyncio
+
+        return cls(redis.asyncio.Redis.from_url(url), ttl, prefix)
+
+    def _count(self, value: Optional[bytes]) -> Optional[bytes]:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the value cached under a key.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            Optional[bytes]: The cached value, or None.
+        """
+        if self.ttl <= 0:
+            return None
+        try:
+            return self._count(await self.client.get(self.prefix + key))
+        except Exception:  # a server outage degrades to a miss
+            self.errors += 1
+            return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        """
+        Caches a value under a key.
+
+        Args:
+            key (str): The key to cache the value under.
+            value (bytes): The value to cache.
+        """
+        if self.ttl <= 0:
+            return
+        try:
+            await self.client.set(self.prefix + key, value, px=int(self.ttl * 1000))
+        except Exception:
+            self.errors += 1
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Removes the entry cached under a key, if any.
+
+        Args:
+            key (str): The key to remove.
+        """
+        try:
+            await self.client.delete(self.prefix + key)
+        except Exception:
+            self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the usage counters of the cache.
+
+        Returns:
+            Dict[str, Any]: The hits, misses, hit ratio and errors of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "errors": self.errors,
+        }
+
+
+principal_cache = TTLCache(maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_CACHE_MAX_TTL_SECONDS)
+user_cache = TTLCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+shared_user_cache = (
+    SharedCache.from_url(settings.USER_CACHE_REDIS_URL, settings.USER_CACHE_TTL_SECONDS, prefix="fastapi:")
+    if settings.USER_CACHE_REDIS_URL
+    else None
+)
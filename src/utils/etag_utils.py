@@ -0,0 +1,39 @@
+import hashlib
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak entity tag from the values identifying a version of a representation.
+
+    Args:
+        *parts (Any): The values, e.g. the id and last modification time of an entity and the fields returned.
+
+    Returns:
+        str: The tag, e.g. `W/"3f2a..."`, which changes whenever one of the values does.
+    """
+    digest = hashlib.blake2b("\x1f".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Tell whether an `If-None-Match` header matches an entity tag, using the weak comparison of RFC 9110.
+
+    Args:
+        if_none_match (Optional[str]): The value of the header, a comma-separated list of tags or `*`.
+        etag (str): The current tag of the representation.
+
+    Returns:
+        bool: True if the client's copy is current, so a `304 Not Modified` response can be sent.
+    """
+    if not if_none_match:
+        return False
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == opaque_tag:
+            return True
+    return False
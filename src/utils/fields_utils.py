@@ -0,0 +1,25 @@
+from typing import List, Optional, Sequence
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> List[str]:
+    """
+    Parse a sparse fieldset, the comma-separated list of fields a client wants in a response.
+
+    Args:
+        fields (Optional[str]): The fieldset received from the client, e.g. `"id,name"`. None or blank selects every
+            allowed field.
+        allowed (Sequence[str]): The fields that may be requested, in the order they are returned.
+
+    Returns:
+        List[str]: The requested fields, without repetitions and in the order of `allowed`.
+
+    Raises:
+        ValueError: If a requested field is not allowed.
+    """
+    if not fields or not fields.strip():
+        return list(allowed)
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return [field for field in allowed if field in requested]
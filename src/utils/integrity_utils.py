@@ -0,0 +1,72 @@
+from typing import Set
+
+from sqlalchemy import Column, Table, UniqueConstraint
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.dml import Insert
+
+
+def unique_names(column: Column) -> Set[str]:
+    """
+    Collect the names a database may report when a unique value of a column is duplicated.
+
+    These are the names of the unique constraints and unique indexes covering only this column, the name PostgreSQL
+    gives to an unnamed unique constraint, and the `table.column` form used by SQLite.
+
+    Args:
+        column (Column): The unique column, e.g. `User.__table__.c.email`.
+
+    Returns:
+        Set[str]: The constraint, index and column names.
+    """
+    table = column.table
+    names = {f"{table.name}.{column.name}", f"{table.name}_{column.name}_key"}
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and list(constraint.columns) == [column] and constraint.name:
+            names.add(constraint.name)
+    for index in table.indexes:
+        if index.unique and list(index.columns) == [column] and index.name:
+            names.add(index.name)
+    return names
+
+
+def is_unique_violation(error: IntegrityError, column: Column) -> bool:
+    """
+    Tell whether an IntegrityError was raised because a value of a unique column already exists.
+
+    Drivers do not agree on how to report the violated constraint, but all of them name it, or the column, in the
+    message of the original error, so the message is matched against the names returned by `unique_names`.
+
+    Args:
+        error (IntegrityError): The error raised by SQLAlchemy.
+        column (Column): The unique column, e.g. `User.__table__.c.email`.
+
+    Returns:
+        bool: True if the error is a duplicate value of the column.
+    """
+    message = str(error.orig)
+    return any(name in message for name in unique_names(column))
+
+
+def insert_ignoring_conflicts(table: Table, dialect_name: str) -> Insert:
+    """
+    Build an INSERT statement skipping the rows that would violate a unique constraint (`ON CONFLICT DO NOTHING`).
+
+    Combined with `RETURNING`, the statement reports which rows were inserted, so one statement can insert a batch
+    while the duplicates in it are reported instead of aborting the whole batch.
+
+    Args:
+        table (Table): The table to insert into.
+        dialect_name (str): The name of the database dialect, e.g. `session.get_bind().dialect.name`.
+
+    Returns:
+        Insert: The INSERT statement.
+
+    Raises:
+        NotImplementedError: If the dialect is neither PostgreSQL nor SQLite.
+    """
+    if dialect_name == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing()
+    if dialect_name == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing()
+    raise NotImplementedError(f"ON CONFLICT DO NOTHING is not supported for the {dialect_name} dialect")
@@ -0,0 +1,53 @@
+from typing import Any, Dict
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _model_fields(model: Any) -> Dict[str, Any]:
+    """
+    Return the fields set on a pydantic model, in declaration order, without validating or copying them.
+
+    Args:
+        model (Any): The model, typically built with `construct` from trusted data.
+
+    Returns:
+        Dict[str, Any]: The values of the fields that were set.
+
+    Raises:
+        TypeError: If the object is not a pydantic model.
+    """
+    if not isinstance(model, BaseModel):
+        raise TypeError(f"Object of type {type(model).__name__} is not JSON serializable")
+    values = model.__dict__
+    fields_set = model.__fields_set__
+    return {name: values[name] for name in model.__fields__ if name in fields_set}
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to JSON with orjson.
+
+    Pydantic models are encoded with the fields that were set, like a response model with `response_model_exclude_unset`
+    would be, and datetimes in ISO 8601 format.
+
+    Args:
+        content (Any): The content to serialize.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    return orjson.dumps(content, default=_model_fields)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson.
+
+    Returning it from an endpoint bypasses the validation against the response model and `jsonable_encoder`, so it is
+    meant for content built from trusted data, such as pydantic models constructed from database rows.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,397 @@
+import asyncio
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+class Metric:
+    """
+    Base class of the metrics, a family of samples identified by the values of their labels.
+
+    Args:
+        name (str): The name of the metric, e.g. `http_requests_total`.
+        documentation (str): The help text of the metric.
+        labelnames (Sequence[str]): The names of the labels of the metric.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labelvalues: Sequence[Any]) -> Tuple[str, ...]:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects the labels {self.labelnames}, got {tuple(labelvalues)}")
+        return tuple(str(value) for value in labelvalues)
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        """
+        Returns the samples of the metric.
+
+        Returns:
+            Iterator[Tuple[str, Sequence[str], Sequence[str], float]]: The name, label names, label values and value
+            of each sample.
+        """
+        with self._lock:
+            values = list(self._values.items())
+        for labelvalues, value in values:
+            yield self.name, self.labelnames, labelvalues, value
+
+    def render(self) -> List[str]:
+        """
+        Renders the metric in the Prometheus text exposition format.
+
+        Returns:
+            List[str]: The lines of the metric.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        for name, labelnames, labelvalues, value in self.samples():
+            lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """
+    A metric that only goes up, e.g. the number of requests served.
+    """
+
+    type = "counter"
+
+    def inc(self, *labelvalues: Any, amount: float = 1.0) -> None:
+        """
+        Increments the counter of a set of labels.
+
+        Args:
+            *labelvalues (Any): The value of each label, in the order of `labelnames`.
+            amount (float): The increment.
+        """
+        key = self._key(labelvalues)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, *labelvalues: Any) -> float:
+        """
+        Returns the value of the counter of a set of labels.
+
+        Args:
+            *labelvalues (Any): The value of each label, in the order of `labelnames`.
+
+        Returns:
+            float: The value, 0 if the counter was never incremented.
+        """
+        with self._lock:
+            return self._values.get(self._key(labelvalues), 0.0)
+
+
+class Gauge(Counter):
+    """
+    A metric that goes up and down, e.g. the number of requests in flight.
+    """
+
+    type = "gauge"
+
+    def dec(self, *labelvalues: Any, amount: float = 1.0) -> None:
+        """
+        Decrements the gauge of a set of labels.
+
+        Args:
+            *labelvalues (Any): The value of each label, in the order of `labelnames`.
+            amount (float): The decrement.
+        """
+        self.inc(*labelvalues, amount=-amount)
+
+
+class Histogram(Metric):
+    """
+    A metric counting observations in cumulative buckets, e.g. request durations.
+
+    Args:
+        name (str): The name of the metric, e.g. `http_request_duration_seconds`.
+        documentation (str): The help text of the metric.
+        labelnames (Sequence[str]): The names of the labels of the metric.
+        buckets (Sequence[float]): The upper bounds of the buckets. A `+Inf` bucket is always added.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DURATION_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, *labelvalues: Any) -> None:
+        """
+        Records an observation.
+
+        Args:
+            value (float): The observed value.
+            *labelvalues (Any): The value of each label, in the order of `labelnames`.
+        """
+        key = self._key(labelvalues)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0, 0.0]
+            bucket_counts = state[0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    bucket_counts[index] += 1
+                    break
+            state[1] += 1
+            state[2] += value
+
+    def get(self, *labelvalues: Any) -> Tuple[int, float]:
+        """
+        Returns the number and the sum of the observations of a set of labels.
+
+        Args:
+            *labelvalues (Any): The value of each label, in the order of `labelnames`.
+
+        Returns:
+            Tuple[int, float]: The count and the sum of the observations.
+        """
+        with self._lock:
+            state = self._values.get(self._key(labelvalues))
+            return (state[1], state[2]) if state else (0, 0.0)
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        with self._lock:
+            values = [(labelvalues, (list(state[0]), state[1], state[2])) for labelvalues, state in self._values.items()]
+        bucket_labelnames = self.labelnames + ("le",)
+        for labelvalues, (bucket_counts, count, total) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", bucket_labelnames, labelvalues + (_format_bound(bound),), cumulative
+            yield f"{self.name}_sum", self.labelnames, labelvalues, total
+            yield f"{self.name}_count", self.labelnames, labelvalues, count
+
+
+class MetricsRegistry:
+    """
+    The set of metrics exposed by the application.
+    """
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Adds a metric to the registry.
+
+        Args:
+            metric (Metric): The metric to expose.
+
+        Returns:
+            Metric: The metric.
+        """
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            str: The exposition.
+        """
+        return "".join(line + "\n" for metric in self._metrics for line in metric.render())
+
+
+class QueryStats:
+    """
+    The SQL statements run while handling a request.
+
+    Attributes:
+        count (int): The number of statements.
+        duration (float): The time spent running them, in seconds.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, duration: float) -> None:
+        """
+        Records a statement.
+
+        Args:
+            duration (float): The time spent running it, in seconds.
+        """
+        with self._lock:
+            self.count += 1
+            self.duration += duration
+
+
+request_queries: ContextVar[Optional[QueryStats]] = ContextVar("request_queries", default=None)
+
+
+StatementRecorder = Callable[[str, float], None]
+
+
+class StatementTimer:
+    """
+    Times the SQL statements run by an engine with a single pair of cursor listeners.
+
+    The duration of each statement is measured once and passed to every recorder, so the metrics and the slow query
+    log agree on it and a statement is not timed once per consumer.
+
+    Attributes:
+        recorders (List[StatementRecorder]): The functions called with each statement and its duration, in seconds.
+    """
+
+    def __init__(self):
+        self.recorders: List[StatementRecorder] = []
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        context._statement_start = time.perf_counter()
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        duration = time.perf_counter() - context._statement_start
+        for recorder in self.recorders:
+            recorder(statement, duration)
+
+
+_statement_timers: "WeakKeyDictionary[Engine, StatementTimer]" = WeakKeyDictionary()
+
+
+def time_statements(engine: Engine, recorder: StatementRecorder) -> None:
+    """
+    Passes the duration of each SQL statement run by an engine to a recorder.
+
+    Every recorder of an engine shares the `StatementTimer` listening to it. Adding a recorder twice has no effect.
+
+    Args:
+        engine (Engine): The engine to time. For an AsyncEngine, pass its `sync_engine`.
+        recorder (StatementRecorder): The function called with each statement and its duration, in seconds.
+    """
+    timer = _statement_timers.get(engine)
+    if timer is None:
+        timer = _statement_timers[engine] = StatementTimer()
+        event.listen(engine, "before_cursor_execute", timer.before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", timer.after_cursor_execute)
+    if recorder not in timer.recorders:
+        timer.recorders.append(recorder)
+
+
+def _record_statement(statement: str, duration: float) -> None:
+    db_statement_duration.observe(duration, (statement.split(None, 1) or [""])[0].upper())
+    queries = request_queries.get()
+    if queries is not None:
+        queries.record(duration)
+
+
+def instrument_queries(engine: Engine) -> None:
+    """
+    Times the SQL statements run by an engine, see `time_statements`.
+
+    Every statement is recorded in `db_statement_duration_seconds`, and in the `QueryStats` of the request being
+    handled, if any, which the metrics middleware reports per route. Instrumenting an engine twice has no effect.
+
+    Args:
+        engine (Engine): The engine to instrument. For an AsyncEngine, pass its `sync_engine`.
+    """
+    time_statements(engine, _record_statement)
+
+
+def timed(histogram: Histogram, *labelvalues: Any) -> Callable[[Callable], Callable]:
+    """
+    Decorates a function, or a coroutine function, to record how long its calls take.
+
+    Args:
+        histogram (Histogram): The histogram recording the durations, in seconds.
+        *labelvalues (Any): The value of each label of the histogram.
+
+    Returns:
+        Callable[[Callable], Callable]: The decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - start, *labelvalues)
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start, *labelvalues)
+
+        return wrapper
+
+    return decorator
+
+
+registry = MetricsRegistry()
+http_requests = registry.register(
+    Counter("http_requests_total", "HTTP requests served, by route template and status.", ["method", "route", "status"])
+)
+http_request_duration = registry.register(
+    Histogram("http_request_duration_seconds", "Time spent serving HTTP requests.", ["method", "route"])
+)
+http_requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests being served.", ["method"])
+)
+http_request_db_statements = registry.register(
+    Histogram("http_request_db_statements", "SQL statements run per HTTP request.", ["route"], buckets=COUNT_BUCKETS)
+)
+http_request_db_duration = registry.register(
+    Histogram("http_request_db_duration_seconds", "Time spent running SQL statements per HTTP request.", ["route"])
+)
+db_statement_duration = registry.register(
+    Histogram("db_statement_duration_seconds", "Time spent running SQL statements, by verb.", ["verb"])
+)
+provider_call_duration = registry.register(
+    Histogram(
+        "provider_call_duration_seconds",
+        "Time spent in the password and token providers.",
+        ["provider", "operation"],
+    )
+)
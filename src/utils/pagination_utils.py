@@ -0,0 +1,41 @@
+import base64
+import binascii
+import json
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode the position of the last item of a page into an opaque cursor.
+
+    Args:
+        last_id (int): The ID of the last item returned in the current page.
+
+    Returns:
+        str: A URL-safe cursor that points right after the given item.
+    """
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode an opaque cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor received from the client.
+
+    Returns:
+        int: The ID of the last item of the previous page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        last_id = payload["id"]
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError) as error:
+        raise ValueError("Invalid cursor") from error
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValueError("Invalid cursor")
+    return last_id
@@ -0,0 +1,92 @@
+"""
+Command that measures password hashing on the current machine and picks the cost matching a target hash time.
+
+Usage:
+    python -m src.utils.password_hash_calibration --target-ms 250
+    python -m src.utils.password_hash_calibration --scheme argon2 --target-ms 250
+"""
+import argparse
+import statistics
+import time
+from typing import Optional
+
+from passlib.context import CryptContext
+
+from src.config.settings import Settings
+
+COST_PARAMETERS = {
+    "bcrypt": ("rounds", "PASSWORD_BCRYPT_ROUNDS", 4, 20),
+    "argon2": ("time_cost", "PASSWORD_ARGON2_TIME_COST", 1, 32),
+}
+
+
+def measure_hash_time(scheme: str, cost: int, samples: int = 3, settings: Settings = Settings()) -> float:
+    """
+    Measures the median time needed to hash a password with the given scheme and cost.
+
+    Args:
+        scheme (str): The passlib scheme to measure, either `bcrypt` or `argon2`.
+        cost (int): The value of the scheme's cost parameter.
+        samples (int): The number of hashes to measure.
+        settings (Settings): Settings object providing the argon2 memory cost and parallelism.
+
+    Returns:
+        float: The median hash time in milliseconds.
+    """
+    parameter = COST_PARAMETERS[scheme][0]
+    options = {f"{scheme}__{parameter}": cost}
+    if scheme == "argon2":
+        options["argon2__memory_cost"] = settings.PASSWORD_ARGON2_MEMORY_COST
+        options["argon2__parallelism"] = settings.PASSWORD_ARGON2_PARALLELISM
+    context = CryptContext(schemes=[scheme], **options)
+
+    durations = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.hash("calibration-password")
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def calibrate(scheme: str, target_ms: float, max_cost: Optional[int] = None, samples: int = 3) -> int:
+    """
+    Finds the highest cost whose median hash time does not exceed the target.
+
+    The cost is increased one step at a time starting from the scheme's minimum, so the slowest configuration measured
+    is the first one over the target.
+
+    Args:
+        scheme (str): The passlib scheme to calibrate, either `bcrypt` or `argon2`.
+        target_ms (float): The target hash time in milliseconds.
+        max_cost (Optional[int]): The highest cost to try. Defaults to the scheme's upper bound.
+        samples (int): The number of hashes measured for each cost.
+
+    Returns:
+        int: The calibrated cost, never lower than the scheme's minimum.
+    """
+    _, _, min_cost, upper_bound = COST_PARAMETERS[scheme]
+    max_cost = min(max_cost or upper_bound, upper_bound)
+
+    cost = min_cost
+    while cost < max_cost and measure_hash_time(scheme, cost + 1, samples) <= target_ms:
+        cost += 1
+    return cost
+
+
+def main() -> None:
+    """
+    Parses the command line, runs the calibration and prints the setting to use.
+    """
+    parser = argparse.ArgumentParser(description="Pick the password hashing cost matching a target hash time.")
+    parser.add_argument("--scheme", choices=sorted(COST_PARAMETERS), default="bcrypt")
+    parser.add_argument("--target-ms", type=float, required=True, help="Target hash time in milliseconds.")
+    parser.add_argument("--samples", type=int, default=3, help="Number of hashes measured for each cost.")
+    args = parser.parse_args()
+
+    cost = calibrate(args.scheme, args.target_ms, samples=args.samples)
+    setting = COST_PARAMETERS[args.scheme][1]
+    print(f"{setting}={cost}  # {measure_hash_time(args.scheme, cost, args.samples):.1f} ms per hash")
+
+
+if __name__ == "__main__":
+    main()
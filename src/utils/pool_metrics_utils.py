@@ -0,0 +1,163 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolMetrics:
+    """
+    Thread-safe counters describing how a connection pool is used.
+
+    Attributes:
+        checkouts (int): The number of connections handed out by the pool.
+        timeouts (int): The number of checkouts that gave up after waiting `pool_timeout` seconds.
+        connections_opened (int): The number of database connections opened by the pool.
+        checked_out (int): The number of connections currently in use.
+        peak_checked_out (int): The highest number of connections in use at once.
+        wait_seconds_total (float): The total time spent waiting for a connection.
+        wait_seconds_max (float): The longest time spent waiting for a connection.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connections_opened = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds: float) -> None:
+        """
+        Records the time a caller waited for a connection.
+
+        Args:
+            seconds (float): The time spent in the pool's checkout, in seconds.
+        """
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def record_timeout(self) -> None:
+        """
+        Records a checkout that timed out.
+        """
+        with self._lock:
+            self.timeouts += 1
+
+    def record_connect(self) -> None:
+        """
+        Records a new database connection.
+        """
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_checkout(self) -> None:
+        """
+        Records a connection handed out by the pool.
+        """
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def record_checkin(self) -> None:
+        """
+        Records a connection returned to the pool.
+        """
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def snapshot(self, pool: Optional[Pool] = None) -> Dict[str, Any]:
+        """
+        Returns the current values of the counters.
+
+        Args:
+            pool (Optional[Pool]): The pool the counters belong to, used to report its size and overflow.
+
+        Returns:
+            Dict[str, Any]: The counters, the average wait and, for queue pools, the pool size and current overflow.
+        """
+        with self._lock:
+            data = {
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connections_opened": self.connections_opened,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "wait_seconds_avg": self.wait_seconds_total / self.checkouts if self.checkouts else 0.0,
+            }
+        if isinstance(pool, QueuePool):
+            data["pool_size"] = pool.size()
+            data["overflow"] = max(pool.overflow(), 0)
+        return data
+
+
+class InstrumentedPoolMixin:
+    """
+    Mixin for SQLAlchemy pools that measures how long callers wait to check out a connection.
+
+    SQLAlchemy emits no event before a checkout starts, so the wait is timed around `connect`. It includes waiting for a
+    connection to be returned and opening an overflow connection. The counters are kept on `metrics`, which survives the
+    pool being recreated by `Engine.dispose`.
+
+    Args:
+        metrics (Optional[PoolMetrics]): The counters to update. Defaults to a new PoolMetrics.
+    """
+
+    def __init__(self, *args, metrics: Optional[PoolMetrics] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics if metrics else PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """
+    QueuePool recording checkout wait times and timeouts in a PoolMetrics.
+    """
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool recording checkout wait times and timeouts in a PoolMetrics.
+    """
+
+
+def instrument_engine(engine: Engine) -> PoolMetrics:
+    """
+    Counts the connections opened, checked out and returned by the pool of an engine through SQLAlchemy pool events.
+
+    Args:
+        engine (Engine): The engine to instrument. For an AsyncEngine, pass its `sync_engine`.
+
+    Returns:
+        PoolMetrics: The counters of the engine's pool.
+    """
+    metrics = getattr(engine.pool, "metrics", None)
+    if metrics is None:
+        metrics = engine.pool.metrics = PoolMetrics()
+
+    event.listen(engine, "connect", lambda *_: metrics.record_connect())
+    event.listen(engine, "checkout", lambda *_: metrics.record_checkout())
+    event.listen(engine, "checkin", lambda *_: metrics.record_checkin())
+    return metrics
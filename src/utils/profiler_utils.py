@@ -0,0 +1,172 @@
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+MODES = ("wall", "cpu")
+
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusyError(Exception):
+    """
+    Raised when a profile is requested while another one is running.
+    """
+
+
+def check_mode(mode: str) -> None:
+    """
+    Check that a profiling mode is supported.
+
+    Args:
+        mode (str): `wall` or `cpu`.
+
+    Raises:
+        ValueError: If the mode is unknown, or is `cpu` on a platform without per-thread CPU clocks.
+    """
+    if mode not in MODES:
+        raise ValueError(f"The profiling mode must be one of {', '.join(MODES)}")
+    if mode == "cpu" and not hasattr(time, "pthread_getcpuclockid"):
+        raise ValueError("The cpu profiling mode is not supported on this platform")
+
+
+def _frame_label(frame) -> str:
+    """
+    Name the function of a frame, e.g. `src.providers.token_manager_provider:TokenManagerProvider._decode`.
+
+    Args:
+        frame (FrameType): The frame.
+
+    Returns:
+        str: The module and qualified name of the function, without the characters the collapsed format reserves.
+    """
+    code = frame.f_code
+    label = f"{frame.f_globals.get('__name__', code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}"
+    return label.replace(";", ":").replace(" ", "_")
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler sampling the Python stacks of every thread of the process from a background thread.
+
+    In `wall` mode, every thread is sampled at every tick, whether it runs or waits, and each sample weighs 1. In `cpu`
+    mode, each sample weighs the CPU time (in microseconds) its thread consumed since the previous tick, so idle
+    threads do not show; it relies on the per-thread CPU clocks of POSIX systems. The stacks are aggregated in the
+    collapsed format read by flamegraph.pl and speedscope: one line per stack, from the thread name down to the
+    innermost function, separated by semicolons and followed by its weight.
+
+    Sampling only reads the frames, so the profiled threads are not interrupted, but the profiler thread takes the GIL
+    at every tick. Nothing runs until `start` is called.
+
+    Args:
+        mode (str): `wall` or `cpu`.
+        interval (float): The time (in seconds) between two samples.
+
+    Attributes:
+        stacks (Counter): The weight of each collapsed stack.
+        ticks (int): The number of times the threads were sampled.
+
+    Raises:
+        ValueError: If the mode is unknown, or is `cpu` on a platform without per-thread CPU clocks.
+    """
+
+    def __init__(self, mode: str = "wall", interval: float = 0.005):
+        check_mode(mode)
+        self.mode = mode
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.ticks = 0
+        self._cpu_times: Dict[int, float] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _cpu_weight(self, ident: int) -> int:
+        try:
+            cpu_time = time.clock_gettime(time.pthread_getcpuclockid(ident))
+        except OSError:  # the thread exited since its frames were read
+            return 0
+        previous = self._cpu_times.get(ident)
+        self._cpu_times[ident] = cpu_time
+        return 0 if previous is None else round((cpu_time - previous) * 1_000_000)
+
+    def sample(self) -> None:
+        """
+        Records the current stack of every thread but the profiler's.
+        """
+        threads = {thread.ident: thread for thread in threading.enumerate()}
+        own_ident = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            weight = self._cpu_weight(ident) if self.mode == "cpu" else 1
+            if weight <= 0:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            thread = threads.get(ident)
+            stack.append((thread.name if thread else f"Thread-{ident}").replace(";", ":").replace(" ", "_"))
+            self.stacks[";".join(reversed(stack))] += weight
+        self.ticks += 1
+
+    def _run(self) -> None:
+        if self.mode == "cpu":
+            self.sample()  # reads the initial CPU time of each thread, which weighs no sample
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def start(self) -> None:
+        """
+        Starts sampling in a background thread.
+        """
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops sampling, waiting for the background thread to exit.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        """
+        Renders the profile in the collapsed stack format.
+
+        Returns:
+            str: One `frame;frame;frame weight` line per stack, heaviest first.
+        """
+        return "".join(f"{stack} {weight}\n" for stack, weight in self.stacks.most_common())
+
+
+@contextmanager
+def sampling_profile(mode: str = "wall", interval: float = 0.005) -> Iterator[SamplingProfiler]:
+    """
+    Profiles the process while the block runs. Only one profile runs at a time, as each one samples every thread.
+
+    Args:
+        mode (str): `wall` or `cpu`.
+        interval (float): The time (in seconds) between two samples.
+
+    Yields:
+        SamplingProfiler: The profiler, whose output is complete once the block exits.
+
+    Raises:
+        ProfilerBusyError: If another profile is running.
+        ValueError: If the mode is not supported.
+    """
+    profiler = SamplingProfiler(mode, interval)
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+    try:
+        profiler.start()
+        try:
+            yield profiler
+        finally:
+            profiler.stop()
+    finally:
+        _profile_lock.release()
@@ -0,0 +1,173 @@
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERALS = re.compile(r"'(?:[^']|'')*'")
+_POSITIONAL_PARAMETERS = re.compile(r"\$\d+")
+_CASTS = re.compile(r"::\w+(?:\s*\(\s*\d+(?:\s*,\s*\d+)?\s*\))?(?:\[\])*")
+_NUMBER_LITERALS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETERS = re.compile(r"\?|%\(\w+\)s|%s|(?<!:):\w+")
+_PARAMETER_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROW_LISTS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+
+
+@lru_cache(maxsize=1024)
+def statement_fingerprint(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape, so the statements differing only by their values compare equal.
+
+    Literals and bound parameters become `?`, lists of parameters, such as `IN (?, ?, ?)` or the rows of a multi-row
+    `INSERT`, become a single `(?)`, and whitespace is collapsed. The `$1` parameters of asyncpg are replaced and
+    the `::TYPE` casts it adds to them are dropped before the numbers, which would otherwise turn `$1` into `$?`. The values of SQLAlchemy statements are bound
+    parameters, so the same statements come back over and over and their fingerprints are memoized.
+
+    Args:
+        statement (str): The SQL statement.
+
+    Returns:
+        str: The fingerprint of the statement, e.g. `SELECT users.id FROM users WHERE users.id IN (?)`.
+    """
+    shape = _STRING_LITERALS.sub("?", statement)
+    shape = _POSITIONAL_PARAMETERS.sub("?", shape)
+    shape = _CASTS.sub("", shape)
+    shape = _NUMBER_LITERALS.sub("?", shape)
+    shape = _PARAMETERS.sub("?", shape)
+    shape = _PARAMETER_LISTS.sub("(?)", shape)
+    shape = _ROW_LISTS.sub("(?)", shape)
+    return " ".join(shape.split())
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    Raised when a unit of work runs more SQL statements than its budget allows, or repeats one too many times.
+    """
+
+
+class QueryBudget:
+    """
+    Counts the SQL statements run by a unit of work, such as a request, and reports the ones going over a budget.
+
+    Two violations are reported: running more than `max_queries` statements in total, and running more than
+    `max_repeats` statements with the same fingerprint, the usual sign of an N+1 query, e.g. a relationship lazily
+    loaded once per serialized item. Violations are raised as `QueryBudgetExceeded`, or logged once each as warnings
+    when `raise_on_violation` is False.
+
+    Args:
+        max_queries (Optional[int]): The maximum number of statements. None for no limit.
+        max_repeats (Optional[int]): The maximum number of statements sharing a fingerprint. None for no limit.
+        raise_on_violation (bool): Whether violations raise, instead of being logged.
+        name (str): The name of the unit of work in the reports, e.g. `GET /api/users/1`.
+
+    Attributes:
+        statements (List[str]): The statements run, in order.
+        fingerprints (Dict[str, int]): The number of statements run per fingerprint.
+        violations (List[str]): The violations reported.
+    """
+
+    def __init__(
+        self,
+        max_queries: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+        raise_on_violation: bool = True,
+        name: str = "The unit of work",
+    ):
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+        self.raise_on_violation = raise_on_violation
+        self.name = name
+        self.statements: List[str] = []
+        self.fingerprints: Dict[str, int] = {}
+        self.violations: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """
+        The number of statements run.
+        """
+        return len(self.statements)
+
+    def record(self, statement: str) -> None:
+        """
+        Records a statement about to run, and reports it if it goes over the budget.
+
+        Args:
+            statement (str): The SQL statement.
+
+        Raises:
+            QueryBudgetExceeded: If the statement goes over the budget and `raise_on_violation` is set.
+        """
+        fingerprint = statement_fingerprint(statement)
+        with self._lock:
+            self.statements.append(statement)
+            repeats = self.fingerprints[fingerprint] = self.fingerprints.get(fingerprint, 0) + 1
+            violations = []
+            if self.max_queries is not None and len(self.statements) > self.max_queries:
+                violations.append(f"{self.name} ran more than {self.max_queries} SQL statements")
+            if self.max_repeats is not None and repeats > self.max_repeats:
+                violations.append(
+                    f"{self.name} ran the same SQL statement more than {self.max_repeats} times, "
+                    f"which looks like an N+1 query: {fingerprint}"
+                )
+            new_violations = [violation for violation in violations if violation not in self.violations]
+            self.violations.extend(new_violations)
+
+        if violations and self.raise_on_violation:
+            raise QueryBudgetExceeded(violations[0])
+        for violation in new_violations:
+            logger.warning(violation)
+
+    @contextmanager
+    def watch(self, *engines: Engine) -> Iterator["QueryBudget"]:
+        """
+        Records every statement run by some engines, from any thread or task, until the block exits.
+
+        Args:
+            *engines (Engine): The engines to watch. For an AsyncEngine, pass its `sync_engine`.
+
+        Yields:
+            QueryBudget: This budget.
+        """
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            self.record(statement)
+
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield self
+        finally:
+            for engine in engines:
+                event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+current_query_budget: ContextVar[Optional[QueryBudget]] = ContextVar("current_query_budget", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    budget = current_query_budget.get()
+    if budget is not None:
+        budget.record(statement)
+
+
+def instrument_query_budget(engine: Engine) -> None:
+    """
+    Records the SQL statements run by an engine in the `QueryBudget` set in `current_query_budget`, if any.
+
+    The statement is recorded before it runs, so a budget raising on violation stops the statement going over it.
+    Instrumenting an engine twice has no effect.
+
+    Args:
+        engine (Engine): The engine to instrument. For an AsyncEngine, pass its `sync_engine`.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
@@ -0,0 +1,41 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+def has_changes(session: Session) -> bool:
+    """
+    Tell whether a session has changes of its own, pending or already sent to the database.
+
+    Writes already sent are tracked by `RoutingSession.has_written` for the whole life of the session, so they are
+    only known for sessions of that class.
+
+    Args:
+        session (Session): The session, the `sync_session` of an `AsyncSession`.
+
+    Returns:
+        bool: True if the session has pending changes or has written.
+    """
+    return bool(session.new or session.dirty or session.deleted or getattr(session, "has_written", False))
+
+
+async def release_connection(db: AsyncSession) -> bool:
+    """
+    Return the pooled connection of a session before a slow step, such as hashing a password, if that commits nothing.
+
+    The connection is released by committing the open transaction, which is only harmless when the transaction merely
+    read. When the session has pending changes, or has already written as tracked by `RoutingSession.has_written`,
+    committing would persist the caller's changes early, out of reach of a later rollback, so the connection is kept
+    instead. Loaded entities stay usable, as the application's sessions do not expire them on commit.
+
+    Args:
+        db (AsyncSession): The session.
+
+    Returns:
+        bool: True if the session holds no connection anymore, False if it kept its connection.
+    """
+    if not db.in_transaction():
+        return True
+    if has_changes(db.sync_session):
+        return False
+    await db.commit()
+    return True
@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent identical calls made from coroutines.
+
+    The first caller of a key awaits the function in its own task, and the callers asking for the same key while it
+    runs wait for it and share its result, or its exception. Calls are only coalesced within an event loop. If the
+    first caller is cancelled, the callers waiting for it start over instead of being cancelled too.
+
+    Attributes:
+        calls (int): The number of calls made.
+        coalesced (int): The number of calls that joined a call in flight instead of running the function.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Awaits a function, unless a call with the same key is in flight, in which case its outcome is shared.
+
+        Args:
+            key (Hashable): The key identifying identical calls.
+            function (Callable[[], Awaitable[T]]): The function to await.
+
+        Returns:
+            Tuple[T, bool]: The result, and whether it comes from another caller's call, in which case the result is
+            shared and must not be mutated.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        self.calls += 1
+        future = self._in_flight.get(flight_key)
+        if future is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                self.calls -= 1
+                self.coalesced -= 1
+                return await self.do(key, function)
+
+        future = self._in_flight[flight_key] = loop.create_future()
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            future.exception()  # retrieved, so a call nobody joined does not log "exception was never retrieved"
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._in_flight[flight_key]
+        return result, False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the usage counters.
+
+        Returns:
+            Dict[str, Any]: The calls made, the calls coalesced and the calls currently in flight.
+        """
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._in_flight)}
+
+
+async_user_lookups = AsyncSingleFlight()
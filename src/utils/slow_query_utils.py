@@ -0,0 +1,187 @@
+import logging
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List
+
+import orjson
+from sqlalchemy.engine import Engine
+
+from src.config.settings import Settings
+from src.utils.metrics_utils import time_statements
+from src.utils.query_budget_utils import statement_fingerprint
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+ORDERS = ("total", "count", "p50", "p99", "max")
+
+
+def _percentile(sorted_durations: List[float], quantile: float) -> float:
+    """
+    Compute a percentile with the nearest-rank method.
+
+    Args:
+        sorted_durations (List[float]): The durations, in ascending order. Must not be empty.
+        quantile (float): The quantile, from 0 to 1.
+
+    Returns:
+        float: The smallest duration greater than or equal to `quantile` of the durations.
+    """
+    return sorted_durations[max(math.ceil(quantile * len(sorted_durations)) - 1, 0)]
+
+
+class _FingerprintStats:
+    """
+    The durations of the statements sharing a fingerprint.
+    """
+
+    def __init__(self, sample_size: int):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: Deque[float] = deque(maxlen=sample_size)
+
+
+class SlowQueryLog:
+    """
+    Aggregates the durations of SQL statements per fingerprint, and logs the statements slower than a threshold.
+
+    The count, total and maximum durations of each fingerprint cover every statement recorded, while the percentiles
+    are computed over the `sample_size` most recent ones. At most `max_fingerprints` fingerprints are tracked; the
+    statements of the fingerprints seen once the log is full are only counted in `dropped`, and still logged if slow.
+
+    A slow statement is logged as a warning whose message is a JSON object, e.g.
+    `{"event": "slow_query", "duration_ms": 812.4, "threshold_ms": 500.0, "fingerprint": "SELECT ..."}`, which is also
+    attached to the record as its `slow_query` attribute for structured log handlers. Statements hold no values, since
+    they are bound as parameters.
+
+    Args:
+        threshold_seconds (float): The duration above which a statement is logged.
+        max_fingerprints (int): The maximum number of fingerprints tracked.
+        sample_size (int): The number of recent durations kept per fingerprint to compute the percentiles.
+
+    Attributes:
+        dropped (int): The number of statements not aggregated because the log was full.
+    """
+
+    def __init__(self, threshold_seconds: float, max_fingerprints: int = 1000, sample_size: int = 256):
+        self.threshold_seconds = threshold_seconds
+        self.max_fingerprints = max_fingerprints
+        self.sample_size = sample_size
+        self.dropped = 0
+        self._stats: Dict[str, _FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration: float) -> None:
+        """
+        Records the duration of a statement, and logs it if it is slow.
+
+        Args:
+            statement (str): The SQL statement.
+            duration (float): The time it took to run, in seconds.
+        """
+        fingerprint = statement_fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(fingerprint)
+            if stats is None and len(self._stats) < self.max_fingerprints:
+                stats = self._stats[fingerprint] = _FingerprintStats(self.sample_size)
+            if stats is None:
+                self.dropped += 1
+            else:
+                stats.count += 1
+                stats.total += duration
+                stats.max = max(stats.max, duration)
+                stats.recent.append(duration)
+
+        if duration >= self.threshold_seconds:
+            slow_query = {
+                "event": "slow_query",
+                "duration_ms": round(duration * 1000, 3),
+                "threshold_ms": round(self.threshold_seconds * 1000, 3),
+                "fingerprint": fingerprint,
+            }
+            logger.warning(orjson.dumps(slow_query).decode(), extra={"slow_query": slow_query})
+
+    def top(self, limit: int = 10, order_by: str = "total") -> List[Dict[str, Any]]:
+        """
+        Returns the fingerprints taking the most time.
+
+        Args:
+            limit (int): The number of fingerprints to return.
+            order_by (str): The figure to rank them by: `total`, `count`, `p50`, `p99` or `max`.
+
+        Returns:
+            List[Dict[str, Any]]: The fingerprint, count, and total, mean, p50, p99 and maximum durations (in
+            milliseconds) of each fingerprint, in descending order of `order_by`.
+
+        Raises:
+            ValueError: If `order_by` is not one of the figures above.
+        """
+        if order_by not in ORDERS:
+            raise ValueError(f"order_by must be one of {', '.join(ORDERS)}")
+        with self._lock:
+            snapshot = [
+                (fingerprint, stats.count, stats.total, stats.max, sorted(stats.recent))
+                for fingerprint, stats in self._stats.items()
+            ]
+
+        rows = [
+            {
+                "fingerprint": fingerprint,
+                "count": count,
+                "total_ms": total * 1000,
+                "mean_ms": total / count * 1000,
+                "p50_ms": _percentile(recent, 0.5) * 1000,
+                "p99_ms": _percentile(recent, 0.99) * 1000,
+                "max_ms": maximum * 1000,
+            }
+            for fingerprint, count, total, maximum, recent in snapshot
+        ]
+        key = "count" if order_by == "count" else f"{order_by}_ms"
+        return sorted(rows, key=lambda row: row[key], reverse=True)[:limit]
+
+    def reset(self) -> None:
+        """
+        Forgets every statement recorded, e.g. to measure the effect of a new index.
+        """
+        with self._lock:
+            self._stats.clear()
+            self.dropped = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the configuration and the size of the log.
+
+        Returns:
+            Dict[str, Any]: The threshold (in milliseconds), the number of fingerprints tracked and the number of
+            statements dropped.
+        """
+        with self._lock:
+            return {
+                "threshold_ms": self.threshold_seconds * 1000,
+                "fingerprints": len(self._stats),
+                "dropped": self.dropped,
+            }
+
+
+slow_query_log = SlowQueryLog(
+    settings.SLOW_QUERY_THRESHOLD_MS / 1000, settings.SLOW_QUERY_MAX_FINGERPRINTS, settings.SLOW_QUERY_SAMPLE_SIZE
+)
+
+
+def _record_slow_query(statement: str, duration: float) -> None:
+    slow_query_log.record(statement, duration)
+
+
+def instrument_slow_queries(engine: Engine) -> None:
+    """
+    Records the duration of the SQL statements run by an engine in `slow_query_log`.
+
+    The statements are timed by the same listeners as the metrics, see `time_statements`. Instrumenting an engine twice
+    has no effect.
+
+    Args:
+        engine (Engine): The engine to instrument. For an AsyncEngine, pass its `sync_engine`.
+    """
+    time_statements(engine, _record_slow_query)
@@ -0,0 +1,178 @@
+import csv
+import io
+import json
+from typing import Any, Iterable, List, Sequence, Tuple
+
+from pydantic import ValidationError
+
+from src.schemas.user_schema import UserCreate, UserImportFailure, UserPartialOut
+from src.utils.etag_utils import make_etag
+
+USER_FIELDS = ("id", "name", "email", "created_at")
+
+VERSION_FIELDS = ("updated_at", "created_at")
+
+CSV_HEADER = ("id", "name", "email", "created_at")
+
+IMPORT_MEDIA_TYPES = ("application/json", "text/csv")
+
+
+def project_user(user: Any, fields: Sequence[str]) -> UserPartialOut:
+    """
+    Build the response for a user holding only the selected attributes.
+
+    The values were read from the database, so the model is constructed without validating them again.
+
+    Args:
+        user (Any): The user, or a row, with at least the selected attributes loaded.
+        fields (Sequence[str]): The selected attributes.
+
+    Returns:
+        UserPartialOut: The user, with only the selected attributes set.
+    """
+    return UserPartialOut.construct(**{field: getattr(user, field) for field in fields})
+
+
+def user_etag(user_id: int, version: Any, fields: Sequence[str]) -> str:
+    """
+    Build the entity tag of a user's representation.
+
+    The tag only depends on the id, the modification times and the selected attributes, so it can be computed without
+    loading the user. Both times are used, so the tag changes on the first update even when the database stores them
+    with a resolution of one second, like SQLite does.
+
+    Args:
+        user_id (int): The user id.
+        version (Any): The user, or a row, with its `updated_at` and `created_at` attributes.
+        fields (Sequence[str]): The selected attributes.
+
+    Returns:
+        str: The weak ETag.
+    """
+    return make_etag(user_id, version.created_at, version.updated_at, ",".join(fields))
+
+
+def ndjson_chunk(rows: Iterable[Any]) -> str:
+    """
+    Encode a batch of user rows as newline-delimited JSON.
+
+    Args:
+        rows (Iterable[Any]): The user rows.
+
+    Returns:
+        str: One JSON line per user.
+    """
+    return "".join(
+        json.dumps(
+            {
+                "id": row.id,
+                "name": row.name,
+                "email": row.email,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+            }
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+def csv_chunk(records: Iterable[Sequence[Any]]) -> str:
+    """
+    Encode records as CSV lines.
+
+    Args:
+        records (Iterable[Sequence[Any]]): The field values of each record.
+
+    Returns:
+        str: One CSV line per record.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(records)
+    return buffer.getvalue()
+
+
+def csv_records(rows: Iterable[Any]) -> Iterable[Tuple[Any, ...]]:
+    """
+    Convert a batch of user rows into CSV records, in the order of `CSV_HEADER`.
+
+    Args:
+        rows (Iterable[Any]): The user rows.
+
+    Returns:
+        Iterable[Tuple[Any, ...]]: The id, name, email and created_at of each user.
+    """
+    return ((row.id, row.name, row.email, row.created_at.isoformat() if row.created_at else "") for row in rows)
+
+
+def parse_import_rows(content: bytes, media_type: str) -> List[Any]:
+    """
+    Parse the rows of a bulk import of users.
+
+    Args:
+        content (bytes): The body of the request.
+        media_type (str): One of `IMPORT_MEDIA_TYPES`.
+
+    Returns:
+        List[Any]: The rows, which still have to be validated.
+
+    Raises:
+        ValueError: If the body is not a JSON array or a CSV file with a header row.
+    """
+    try:
+        if media_type == "text/csv":
+            rows = list(csv.DictReader(io.StringIO(content.decode("utf-8-sig"))))
+        else:
+            rows = json.loads(content)
+    except (UnicodeDecodeError, ValueError, csv.Error):
+        rows = None
+    if not isinstance(rows, list):
+        raise ValueError("Invalid import, expected a JSON array or a CSV file with a header row")
+    return rows
+
+
+def validate_import_rows(rows: List[Any]) -> Tuple[List[Tuple[int, UserCreate]], List[UserImportFailure]]:
+    """
+    Validate the rows of a bulk import of users.
+
+    Args:
+        rows (List[Any]): The parsed rows.
+
+    Returns:
+        Tuple[List[Tuple[int, UserCreate]], List[UserImportFailure]]: The valid users with their row numbers, and the
+        rows that are invalid or repeat the email of an earlier row.
+    """
+    users, failed, emails = [], [], set()
+    for row_number, row in enumerate(rows, start=1):
+        try:
+            user = UserCreate.parse_obj(row)
+        except ValidationError as error:
+            email = row.get("email") if isinstance(row, dict) else None
+            detail = "; ".join(f"{'.'.join(map(str, item['loc']))}: {item['msg']}" for item in error.errors())
+            failed.append(
+                UserImportFailure(row=row_number, email=email if isinstance(email, str) else None, detail=detail)
+            )
+            continue
+        if user.email in emails:
+            failed.append(UserImportFailure(row=row_number, email=user.email, detail="Duplicate email in import"))
+            continue
+        emails.add(user.email)
+        users.append((row_number, user))
+    return users, failed
+
+
+def import_conflicts(batch: List[Tuple[int, UserCreate]], created_emails: set) -> List[UserImportFailure]:
+    """
+    Report the users of an imported batch that were skipped because their email is already registered.
+
+    Args:
+        batch (List[Tuple[int, UserCreate]]): The users of the batch with their row numbers.
+        created_emails (set): The emails of the users created from the batch.
+
+    Returns:
+        List[UserImportFailure]: One failure per skipped user.
+    """
+    return [
+        UserImportFailure(row=row_number, email=user.email, detail="Email already registered")
+        for row_number, user in batch
+        if user.email not in created_emails
+    ]